@@ -0,0 +1,91 @@
+"""Compare the pure-Python and NumPy clustering engines.
+
+Usage::
+
+    python benchmarks/bench_clustering.py --sizes 1000 10000 50000
+
+Use ``--dimensions 384`` to see the blocked matrix path used for model-sized
+embeddings. Synthetic articles are drawn around ``size / story_ratio`` story centres so the
+cluster count grows with the batch, like a real polling cycle.
+
+``--partitions 40 --workers 8`` also times blocked clustering over 40 synthetic
+blocking keys, in-process and on a process pool of 8 workers.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import random
+import time
+
+from ai_news_publisher.infrastructure.vector_index import numpy_available
+from ai_news_publisher.services.clustering import IncrementalClusterer, cluster_in_parallel
+
+
+def synthetic_vectors(count: int, stories: int, dimensions: int, seed: int = 42) -> list[list[float]]:
+    rng = random.Random(seed)
+    centers = [[rng.gauss(0, 1) for _ in range(dimensions)] for _ in range(max(1, stories))]
+    return [[value + rng.gauss(0, 0.25) for value in rng.choice(centers)] for _ in range(count)]
+
+
+def run_backend(backend: str, vectors: list[list[float]], threshold: float) -> tuple[float, list[int]]:
+    clusterer = IncrementalClusterer(threshold, backend=backend)
+    started = time.perf_counter()
+    assignments = clusterer.add_many(vectors)
+    return time.perf_counter() - started, assignments
+
+
+def run_partitioned(
+    backend: str, vectors: list[list[float]], threshold: float, partitions: int, workers: int
+) -> None:
+    keys = [idx % partitions for idx in range(len(vectors))]
+    clusterer = IncrementalClusterer(threshold, backend=backend)
+    started = time.perf_counter()
+    clusterer.add_many(vectors, keys=keys)
+    sequential = time.perf_counter() - started
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        started = time.perf_counter()
+        members = cluster_in_parallel(vectors, keys, threshold, executor, backend=backend)
+        parallel = time.perf_counter() - started
+    same = "yes" if members == clusterer.members else "NO"
+    print(
+        f"{len(vectors):>9} {backend:>8} blocked x{partitions}: {sequential:.3f}s in-process, "
+        f"{parallel:.3f}s on {workers} workers (same clusters: {same})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--dimensions", type=int, default=16)
+    parser.add_argument("--story-ratio", type=int, default=20, help="articles per synthetic story")
+    parser.add_argument("--threshold", type=float, default=0.80)
+    parser.add_argument("--partitions", type=int, default=0, help="blocking keys for the blocked runs")
+    parser.add_argument("--workers", type=int, default=4, help="process pool size for the blocked runs")
+    args = parser.parse_args()
+
+    backends = ["python"] + (["numpy"] if numpy_available() else [])
+    if len(backends) == 1:
+        print("numpy is not installed; only the python backend will run")
+
+    print(f"{'articles':>9} {'backend':>8} {'seconds':>9} {'articles/s':>11} {'clusters':>9}")
+    for size in args.sizes:
+        vectors = synthetic_vectors(size, size // args.story_ratio, args.dimensions)
+        baseline: list[int] | None = None
+        for backend in backends:
+            elapsed, assignments = run_backend(backend, vectors, args.threshold)
+            clusters = len(set(assignments))
+            print(f"{size:>9} {backend:>8} {elapsed:>9.3f} {size / elapsed:>11.0f} {clusters:>9}")
+            if baseline is None:
+                baseline = assignments
+            elif assignments != baseline:
+                mismatched = sum(1 for a, b in zip(assignments, baseline) if a != b)
+                print(f"{'':>9} warning: {mismatched} assignments differ from the python backend")
+        if args.partitions:
+            for backend in backends:
+                run_partitioned(backend, vectors, args.threshold, args.partitions, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Measure resident bytes per event for the slotted models against the old layout.
+
+Usage::
+
+    python benchmarks/bench_event_memory.py --events 100000 --dimensions 384
+
+``dict+list`` rebuilds the previous models: plain dataclasses with a per-instance
+``__dict__``, embeddings as lists of Python floats and a fresh string object per
+field, as parsed feeds produce them. ``slots+array`` is the current
+``Event``/``SourceLink``, with float32 embeddings and interned repeated strings.
+Both are fed the same inputs; allocations are counted with tracemalloc.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import gc
+import random
+import tracemalloc
+
+from ai_news_publisher.domain.models import Event, SourceLink
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+CATEGORIES = ["tech", "world", "business", "science", "sports", "climate", "health", "politics"]
+COUNTRIES = ["US", "GB", "DE", "FR", "IN", "JP", "BR", "NG", "AU", "CA"]
+SOURCES = ["Wire", "Daily Planet", "Morning Post", "Evening Standard"]
+
+
+@dataclass(frozen=True)
+class LegacySourceLink:
+    source_name: str
+    url: str
+    published_at: datetime
+
+
+@dataclass
+class LegacyEvent:
+    event_id: str
+    slug: str
+    title: str
+    category: str
+    country: str
+    city: str
+    occurred_at: datetime
+    confidence: float
+    source_diversity: int
+    source_count: int
+    embedding: list[float]
+    source_links: list[LegacySourceLink]
+    summary: dict[str, str]
+    status: str
+    bias_indicator: str
+    ai_generated_notice: str = "AI-generated summary. Source links provided for verification."
+
+
+def fresh(text: str) -> str:
+    """A new string object with the same value, like one decoded from a feed."""
+
+    return "".join(list(text))
+
+
+def build(n: int, rng: random.Random, dimensions: int, event_cls, link_cls):
+    occurred_at = BASE + timedelta(minutes=rng.uniform(0, 60 * 24 * 365))
+    links = [
+        link_cls(fresh(rng.choice(SOURCES)), f"https://source{s}.example.com/{n}", occurred_at) for s in range(2)
+    ]
+    return event_cls(
+        event_id=f"evt{n:08d}",
+        slug=f"event-{n}",
+        title=f"Event {n}",
+        category=fresh(rng.choice(CATEGORIES)),
+        country=fresh(rng.choice(COUNTRIES)),
+        city=fresh(f"City {rng.randrange(200)}"),
+        occurred_at=occurred_at,
+        confidence=0.8,
+        source_diversity=2,
+        source_count=2,
+        embedding=[rng.gauss(0, 1) for _ in range(dimensions)],
+        source_links=links,
+        summary={"what_happened": f"Summary {n}"},
+        status=fresh("Developing"),
+        bias_indicator=fresh("unknown"),
+    )
+
+
+def bytes_per_event(count: int, dimensions: int, event_cls, link_cls) -> float:
+    rng = random.Random(42)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = [build(n, rng, dimensions, event_cls, link_cls) for n in range(count)]
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del events
+    return used / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--dimensions", type=int, default=16)
+    args = parser.parse_args()
+
+    legacy = bytes_per_event(args.events, args.dimensions, LegacyEvent, LegacySourceLink)
+    lean = bytes_per_event(args.events, args.dimensions, Event, SourceLink)
+    print(f"{args.events} events, {args.dimensions}-dim embeddings")
+    print(f"dict+list:   {legacy:9,.0f} bytes/event")
+    print(f"slots+array: {lean:9,.0f} bytes/event ({lean / legacy:.0%} of before)")
+
+
+if __name__ == "__main__":
+    main()
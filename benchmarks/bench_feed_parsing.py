@@ -0,0 +1,94 @@
+"""Measure event-loop stall time while RSSFetcher parses large synthetic feeds.
+
+Usage::
+
+    python benchmarks/bench_feed_parsing.py --feeds 40 --items 2000
+
+A heartbeat task ticks every millisecond; the worst and total delay past each
+tick is the time the loop was blocked. ``inline`` parses on the loop thread (the
+old behaviour); ``thread`` and ``process`` use RSSFetcher's parse pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import Executor
+import time
+
+from ai_news_publisher.infrastructure.rss import RSSFetcher, build_parse_executor, parse_feed
+
+
+def synthetic_feed(feed_idx: int, items: int) -> bytes:
+    parts = ['<?xml version="1.0" encoding="utf-8"?><rss><channel>']
+    for i in range(items):
+        parts.append(
+            f"<item><title>Story {feed_idx}-{i} about markets and policy</title>"
+            f"<link>https://feed{feed_idx}.example.com/{i}</link>"
+            f"<description>{'Synthetic description text. ' * 20}</description>"
+            "<pubDate>Thu, 01 Jan 2026 10:00:00 GMT</pubDate></item>"
+        )
+    parts.append("</channel></rss>")
+    return "".join(parts).encode("utf-8")
+
+
+class InMemoryFetcher(RSSFetcher):
+    def __init__(self, bodies: dict[str, bytes], parse_executor: Executor | None, inline: bool) -> None:
+        super().__init__(parse_executor=parse_executor)
+        self.bodies = bodies
+        self.inline = inline
+
+    async def download(self, url: str) -> bytes | None:
+        await asyncio.sleep(0.001)
+        return self.bodies[url]
+
+    async def parse(self, feed: dict[str, str], body: bytes) -> list:
+        if not self.inline:
+            return await super().parse(feed, body)
+        return parse_feed(body, feed)
+
+
+async def measure(fetcher: RSSFetcher, feeds: list[dict[str, str]]) -> tuple[float, float, float, int]:
+    stalls: list[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        interval = 0.001
+        while not done.is_set():
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            stalls.append(max(0.0, time.perf_counter() - expected))
+
+    beat = asyncio.create_task(heartbeat())
+    started = time.perf_counter()
+    articles = await fetcher.fetch_many(feeds)
+    elapsed = time.perf_counter() - started
+    done.set()
+    await beat
+    return elapsed, max(stalls, default=0.0), sum(stalls), len(articles)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=40)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    bodies = {f"mem://{i}": synthetic_feed(i, args.items) for i in range(args.feeds)}
+    feeds = [{"url": url, "source_name": url} for url in bodies]
+    megabytes = sum(len(body) for body in bodies.values()) / 1e6
+    print(f"{args.feeds} feeds x {args.items} items ({megabytes:.1f} MB)")
+    print(f"{'mode':>8} {'seconds':>9} {'max stall ms':>13} {'total stall ms':>15} {'articles':>9}")
+
+    for mode in ("inline", "thread", "process"):
+        executor = None if mode == "inline" else build_parse_executor(mode, args.workers)
+        fetcher = InMemoryFetcher(bodies, executor, inline=mode == "inline")
+        elapsed, worst, total, count = asyncio.run(measure(fetcher, feeds))
+        if executor is not None:
+            executor.shutdown()
+        print(f"{mode:>8} {elapsed:>9.3f} {worst * 1000:>13.1f} {total * 1000:>15.1f} {count:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Measure related-event lookups against the same-category listing they replace.
+
+Usage::
+
+    python benchmarks/bench_related_index.py --events 200000 --dimensions 64
+
+Embeddings are drawn around a few hundred topic centres, as clustered news tends
+to be. ``same-category listing`` is what the frontend did before: list every event
+of the category to pick "related" ones. The exact and IVF indexes are timed per
+query and per small upsert batch; IVF recall@k is measured against the exact answer.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+import random
+import time
+
+import numpy as np
+
+from bench_repository import synthetic_event, timed
+
+from ai_news_publisher.infrastructure.repository import InMemoryEventRepository
+from ai_news_publisher.infrastructure.vector_index import IVFSimilarityIndex, NumpySimilarityIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--dimensions", type=int, default=64)
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--probes", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    generator = np.random.default_rng(42)
+    centres = generator.normal(size=(args.topics, args.dimensions))
+    vectors = (centres[generator.integers(args.topics, size=args.events)]
+               + 0.5 * generator.normal(size=(args.events, args.dimensions))).astype(np.float32)
+    events = [replace(synthetic_event(n, rng), embedding=vectors[n]) for n in range(args.events)]
+
+    repository = InMemoryEventRepository()
+    started = time.perf_counter()
+    for start in range(0, len(events), 1000):
+        repository.upsert_events(events[start : start + 1000])
+    print(f"load {args.events} events (numpy index maintained): {time.perf_counter() - started:.1f}s")
+
+    exact = NumpySimilarityIndex()
+    ivf = IVFSimilarityIndex(probes=args.probes)
+    for name, index in (("exact", exact), ("ivf", ivf)):
+        started = time.perf_counter()
+        for event in events:
+            index.upsert(event.slug, event.embedding)
+        print(f"build {name:5} index: {time.perf_counter() - started:6.1f}s")
+
+    queries = [events[i] for i in rng.sample(range(args.events), args.queries)]
+    cycle = iter(queries * 1000)
+
+    def query(index) -> None:
+        event = next(cycle)
+        index.nearest(event.embedding, args.k, exclude=(event.slug,))
+
+    print(f"same-category listing:        {timed(lambda: repository.list_events(category=next(cycle).category), 20):9.2f} ms")
+    print(f"related (exact, numpy):       {timed(lambda: query(exact), args.queries):9.3f} ms")
+    print(f"related (ivf, {args.probes} probes):      {timed(lambda: query(ivf), args.queries):9.3f} ms")
+    print(f"related via repository:       {timed(lambda: repository.related_events(next(cycle).slug, args.k), args.queries):9.3f} ms")
+
+    hits = 0
+    for event in queries:
+        truth = {key for key, _ in exact.nearest(event.embedding, args.k, exclude=(event.slug,))}
+        hits += len(truth & {key for key, _ in ivf.nearest(event.embedding, args.k, exclude=(event.slug,))})
+    print(f"ivf recall@{args.k}: {hits / (args.k * len(queries)):.3f}")
+
+    def upsert_batch(index) -> None:
+        for event in rng.sample(events, 20):
+            index.upsert(event.slug, event.embedding)
+
+    print(f"upsert 20 (exact):            {timed(lambda: upsert_batch(exact), 20):9.3f} ms")
+    print(f"upsert 20 (ivf):              {timed(lambda: upsert_batch(ivf), 20):9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Measure event repository write and read latency at scale.
+
+Usage::
+
+    python benchmarks/bench_repository.py --events 500000
+
+Loads synthetic events in ingestion-sized batches, then times full and recent
+and filtered listings, keyset pages, small re-upserts that move events in time, and the same listings with
+reader threads running alongside a writer. ``sort-per-call`` is the old
+behaviour of sorting the whole store on every ``list_events``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+import random
+from statistics import median
+from threading import Event as Flag, Thread
+import time
+
+from ai_news_publisher.domain.models import Event, SourceLink
+from ai_news_publisher.infrastructure.repository import InMemoryEventRepository
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+CATEGORIES = ["tech", "world", "business", "science", "sports", "climate", "health", "politics"]
+COUNTRIES = ["US", "GB", "DE", "FR", "IN", "JP", "BR", "NG", "AU", "CA"]
+
+
+def synthetic_event(n: int, rng: random.Random) -> Event:
+    occurred_at = BASE + timedelta(minutes=rng.uniform(0, 60 * 24 * 365))
+    return Event(
+        event_id=f"evt{n:08d}",
+        slug=f"event-{n}",
+        title=f"Event {n}",
+        category=rng.choice(CATEGORIES),
+        country=rng.choice(COUNTRIES),
+        city=f"City {rng.randrange(200)}",
+        occurred_at=occurred_at,
+        confidence=0.8,
+        source_diversity=2,
+        source_count=2,
+        embedding=[rng.gauss(0, 1) for _ in range(16)],
+        source_links=[SourceLink("Wire", f"https://wire.example.com/{n}", occurred_at)],
+        summary={"what_happened": f"Summary {n}"},
+        status="Developing",
+        bias_indicator="unknown",
+    )
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=500_000)
+    parser.add_argument("--batch", type=int, default=1000, help="events per ingestion upsert")
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    events = [synthetic_event(n, rng) for n in range(args.events)]
+    repository = InMemoryEventRepository()
+    started = time.perf_counter()
+    for start in range(0, len(events), args.batch):
+        repository.upsert_events(events[start : start + args.batch])
+    print(f"load {args.events} events in batches of {args.batch}: {time.perf_counter() - started:.2f}s")
+
+    recent = BASE + timedelta(days=358)
+    store = repository._events_by_slug
+    print(f"list_events (sort-per-call): {timed(lambda: sorted(store.values(), key=lambda e: e.occurred_at, reverse=True), 5):9.2f} ms")
+    print(f"list_events (sorted index):  {timed(repository.list_events, 5):9.2f} ms")
+    print(f"list_events_since (7 days):  {timed(lambda: repository.list_events_since(recent), 20):9.3f} ms")
+
+    def scan_filter(category: str, country: str) -> list[Event]:
+        found = repository.list_events()
+        found = [e for e in found if e.category.lower() == category.lower()]
+        return [e for e in found if e.country.lower() == country.lower()]
+
+    print(f"filter category+country (scan):  {timed(lambda: scan_filter('Tech', 'us'), 5):9.2f} ms")
+    print(f"filter category+country (index): {timed(lambda: repository.list_events(category='Tech', country='us'), 5):9.2f} ms")
+    print(f"filter country+city (index):     {timed(lambda: repository.list_events(country='us', city='city 7'), 5):9.2f} ms")
+
+    deep = repository.list_events(limit=args.events // 2)[-1]
+    cursor = (deep.occurred_at, deep.event_id)
+    print(f"page of 50 (first):              {timed(lambda: repository.list_events(limit=50), 20):9.3f} ms")
+    print(f"page of 50 (mid-store cursor):   {timed(lambda: repository.list_events(limit=50, before=cursor), 20):9.3f} ms")
+    print(f"page of 50 (country+city):       {timed(lambda: repository.list_events(country='us', city='city 7', limit=50, before=cursor), 20):9.3f} ms")
+
+    def reupsert() -> None:
+        moved = [rng.choice(events) for _ in range(20)]
+        repository.upsert_events(
+            [replace(e, occurred_at=e.occurred_at + timedelta(hours=1)) for e in moved]
+        )
+
+    print(f"upsert 20 moved events:      {timed(reupsert, 20):9.2f} ms")
+
+    stop = Flag()
+    reads = [0] * args.readers
+
+    def reader(slot: int) -> None:
+        while not stop.is_set():
+            repository.list_events_since(recent)
+            reads[slot] += 1
+
+    threads = [Thread(target=reader, args=(slot,)) for slot in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    writes = timed(reupsert, 20)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    print(f"upsert 20 with {args.readers} readers:    {writes:9.2f} ms ({sum(reads)} concurrent recent listings)")
+
+
+if __name__ == "__main__":
+    main()
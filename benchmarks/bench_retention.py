@@ -0,0 +1,51 @@
+"""Measure retention evictions on a large in-memory repository.
+
+Usage::
+
+    python benchmarks/bench_retention.py --events 500000 --days 30
+
+Loads a year of synthetic events, then moves the retention cutoff forward one
+daily bucket at a time and times each eviction. Events drop from the store,
+the time and filter indexes, the related-events index and the search index.
+Listing latency is timed before and after, because a smaller store lists faster.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import timedelta
+import random
+from statistics import median
+import time
+
+from bench_repository import BASE, synthetic_event, timed
+
+from ai_news_publisher.infrastructure.repository import InMemoryEventRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=500_000)
+    parser.add_argument("--days", type=int, default=30, help="daily buckets to evict")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    repository = InMemoryEventRepository()
+    for start in range(0, args.events, 1000):
+        repository.upsert_events([synthetic_event(n, rng) for n in range(start, min(start + 1000, args.events))])
+    print(f"loaded {len(repository)} events")
+    print(f"list_events before:   {timed(repository.list_events, 5):9.2f} ms")
+
+    samples, evicted = [], 0
+    for day in range(1, args.days + 1):
+        started = time.perf_counter()
+        evicted += repository.evict_before(BASE + timedelta(days=day))
+        samples.append(time.perf_counter() - started)
+    per_event = sum(samples) / max(evicted, 1) * 1e6
+    print(f"evicted {evicted} events in {args.days} daily buckets")
+    print(f"per bucket: median {median(samples) * 1000:.1f} ms, max {max(samples) * 1000:.1f} ms ({per_event:.1f} us/event)")
+    print(f"list_events after:    {timed(repository.list_events, 5):9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measure SearchIndex build time, posting size and query latency at scale.
+
+Usage::
+
+    python benchmarks/bench_search_index.py --docs 1000000
+
+Titles and summaries draw words from a Zipf-distributed vocabulary, so some terms
+are in most documents and most terms are rare. ``scan`` is the client-side search
+this replaces: split every document and keep those containing all the words.
+"""
+
+from __future__ import annotations
+
+import argparse
+from itertools import accumulate
+import random
+import time
+
+from bench_repository import CATEGORIES, COUNTRIES, timed
+
+from ai_news_publisher.infrastructure.search_index import SearchIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--vocabulary", type=int, default=200_000)
+    parser.add_argument("--words", type=int, default=40, help="words per title plus summary")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    words = [f"w{n}" for n in range(args.vocabulary)]
+    cumulative = list(accumulate(1 / (rank + 1) for rank in range(args.vocabulary)))
+    index = SearchIndex()
+    texts = []
+    started = time.perf_counter()
+    for n in range(args.docs):
+        text = " ".join(rng.choices(words, cum_weights=cumulative, k=args.words))
+        if n < 100_000:
+            texts.append(text)
+        index.add(
+            f"event-{n}",
+            text,
+            category=rng.choice(CATEGORIES),
+            country=rng.choice(COUNTRIES),
+            city=f"City {rng.randrange(200)}",
+        )
+    elapsed = time.perf_counter() - started
+    postings = sum(len(p.deltas) for p in index._postings.values())
+    posting_bytes = sum(p.deltas.itemsize * len(p.deltas) + p.tfs.itemsize * len(p.tfs) for p in index._postings.values())
+    print(f"index {args.docs} docs: {elapsed:.1f}s ({args.docs / elapsed:,.0f} docs/s)")
+    print(f"{len(index._postings):,} terms, {postings:,} postings, {posting_bytes / 2**20:.1f} MiB of posting arrays")
+
+    def scan(query: str) -> list[int]:
+        wanted = query.split()
+        return [n for n, text in enumerate(texts) if all(w in text.split() for w in wanted)]
+
+    print(f"scan 100k docs (2 words):        {timed(lambda: scan('w50 w900'), 3):9.1f} ms")
+    for label, query, filters in (
+        ("rare words", "w5000 w12000", {}),
+        ("mid-frequency words", "w200 w900", {}),
+        ("common word", "w3", {}),
+        ("prefix (w123…)", "w5 w123", {}),
+        ("common word + country", "w3", {"country": "de"}),
+        ("mid words + category+city", "w200 w900", {"category": "tech", "city": "city 7"}),
+    ):
+        print(f"search {label:26} {timed(lambda: index.search(query, 20, **filters), 20):9.2f} ms")
+
+    replaced = rng.sample(range(args.docs), 1000)
+    started = time.perf_counter()
+    for n in replaced:
+        index.add(f"event-{n}", " ".join(rng.choices(words, cum_weights=cumulative, k=args.words)), category="tech")
+    print(f"re-index 1000 docs:              {(time.perf_counter() - started) * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
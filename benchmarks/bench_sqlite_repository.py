@@ -0,0 +1,64 @@
+"""Measure SQLiteEventRepository upsert throughput and listing latency.
+
+Usage::
+
+    python benchmarks/bench_sqlite_repository.py --events 1000000 --path /tmp/events.sqlite
+
+Writes synthetic events in ingestion-sized batches (one transaction each), then
+times first pages, deep keyset pages and filtered pages, plus a point lookup by slug.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import timedelta
+import os
+import random
+import time
+
+from bench_repository import BASE, synthetic_event, timed
+
+from ai_news_publisher.infrastructure.repository import SQLiteEventRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=1000, help="events per upsert transaction")
+    parser.add_argument("--path", default="bench_events.sqlite")
+    args = parser.parse_args()
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(args.path + suffix):
+            os.remove(args.path + suffix)
+    repository = SQLiteEventRepository(args.path)
+    rng = random.Random(42)
+
+    written, busy = 0, 0.0
+    while written < args.events:
+        batch = [synthetic_event(n, rng) for n in range(written, min(written + args.batch, args.events))]
+        started = time.perf_counter()
+        repository.upsert_events(batch)
+        busy += time.perf_counter() - started
+        written += len(batch)
+    print(f"upsert {written} events in batches of {args.batch}: {busy:.1f}s ({written / busy:,.0f} events/s)")
+
+    resample = [synthetic_event(n, rng) for n in rng.sample(range(args.events), args.batch)]
+    print(f"re-upsert {args.batch} existing events:  {timed(lambda: repository.upsert_events(resample), 5):9.2f} ms")
+
+    middle = repository.list_events(limit=1, before=(BASE + timedelta(days=182), "~"))[0]
+    cursor = (middle.occurred_at, middle.event_id)
+    print(f"first page of 50:                 {timed(lambda: repository.list_events(limit=50), 20):9.2f} ms")
+    print(f"page of 50 at mid-store cursor:   {timed(lambda: repository.list_events(limit=50, before=cursor), 20):9.2f} ms")
+    print(f"category page of 50:              {timed(lambda: repository.list_events(category='Tech', limit=50), 20):9.2f} ms")
+    print(
+        "category+country+city page of 50: "
+        f"{timed(lambda: repository.list_events(category='tech', country='us', city='city 7', limit=50), 20):9.2f} ms"
+    )
+    print(f"country+city page (residual):     {timed(lambda: repository.list_events(country='US', city='City 7', limit=50, before=cursor), 20):9.2f} ms")
+    print(f"get_by_slug:                      {timed(lambda: repository.get_by_slug(middle.slug), 200):9.3f} ms")
+    repository.close()
+
+
+if __name__ == "__main__":
+    main()
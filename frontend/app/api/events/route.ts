@@ -1,17 +1,56 @@
 import { NextRequest, NextResponse } from "next/server";
 import { events } from "@/lib/events-data";
+import { NewsEvent } from "@/types/event";
+
+// Mirrors the backend's GET /api/events paging: newest first, opaque keyset cursor.
+const DEFAULT_LIMIT = 50;
+const MAX_LIMIT = 200;
+
+function encodeCursor(event: NewsEvent): string {
+  return Buffer.from(JSON.stringify([event.publishedAt, event.id])).toString("base64url");
+}
+
+function decodeCursor(cursor: string): [string, string] | null {
+  try {
+    const value = JSON.parse(Buffer.from(cursor, "base64url").toString("utf8"));
+    if (Array.isArray(value) && value.length === 2 && value.every((part) => typeof part === "string")) {
+      return [value[0], value[1]];
+    }
+  } catch {
+    // Not a cursor this route produced.
+  }
+  return null;
+}
+
+function newerFirst(a: NewsEvent, b: NewsEvent): number {
+  if (a.publishedAt !== b.publishedAt) return a.publishedAt < b.publishedAt ? 1 : -1;
+  return a.id < b.id ? 1 : a.id > b.id ? -1 : 0;
+}
 
 export async function GET(request: NextRequest) {
   const { searchParams } = new URL(request.url);
   const category = searchParams.get("category");
   const location = searchParams.get("location");
+  const limit = Number(searchParams.get("limit") ?? DEFAULT_LIMIT);
+  if (!Number.isInteger(limit) || limit < 1 || limit > MAX_LIMIT) {
+    return NextResponse.json({ message: `limit must be between 1 and ${MAX_LIMIT}` }, { status: 400 });
+  }
+  const cursorParam = searchParams.get("cursor");
+  const cursor = cursorParam ? decodeCursor(cursorParam) : null;
+  if (cursorParam && !cursor) {
+    return NextResponse.json({ message: "Invalid cursor" }, { status: 400 });
+  }
 
   const filtered = events.filter((event) => {
     const categoryOk = !category || event.category === category;
     const locationOk = !location || event.location === location;
-    return categoryOk && locationOk;
+    const beforeOk =
+      !cursor || event.publishedAt < cursor[0] || (event.publishedAt === cursor[0] && event.id < cursor[1]);
+    return categoryOk && locationOk && beforeOk;
   });
 
-  const sorted = [...filtered].sort((a, b) => (a.publishedAt < b.publishedAt ? 1 : -1));
-  return NextResponse.json(sorted);
+  const sorted = [...filtered].sort(newerFirst);
+  const page = sorted.slice(0, limit);
+  const nextCursor = sorted.length > limit ? encodeCursor(page[page.length - 1]) : null;
+  return NextResponse.json({ events: page, next_cursor: nextCursor });
 }
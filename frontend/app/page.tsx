@@ -1,3 +1,4 @@
+import Link from "next/link";
 import { EventCard } from "@/components/EventCard";
 import { Filters } from "@/components/Filters";
 import { fetchEvents } from "@/lib/api";
@@ -5,11 +6,16 @@ import { fetchEvents } from "@/lib/api";
 export default async function HomePage({
   searchParams
 }: {
-  searchParams: { category?: string; location?: string };
+  searchParams: { category?: string; location?: string; cursor?: string };
 }) {
   const category = searchParams.category;
   const location = searchParams.location;
-  const events = await fetchEvents({ category, location });
+  const { events, nextCursor } = await fetchEvents({ category, location, cursor: searchParams.cursor });
+
+  const olderParams = new URLSearchParams();
+  if (category) olderParams.set("category", category);
+  if (location) olderParams.set("location", location);
+  if (nextCursor) olderParams.set("cursor", nextCursor);
 
   return (
     <section className="page">
@@ -22,7 +28,9 @@ export default async function HomePage({
       <Filters category={category} location={location} />
 
       <div className="results-bar">
-        <p>{events.length} event{events.length === 1 ? "" : "s"} found</p>
+        <p>
+          {events.length} event{events.length === 1 ? "" : "s"} {nextCursor ? "shown" : "found"}
+        </p>
       </div>
 
       <div className="grid">
@@ -32,6 +40,12 @@ export default async function HomePage({
           events.map((event) => <EventCard key={event.id} event={event} />)
         )}
       </div>
+
+      {nextCursor ? (
+        <Link className="ghost-btn" href={`/?${olderParams.toString()}`}>
+          Older events →
+        </Link>
+      ) : null}
     </section>
   );
 }
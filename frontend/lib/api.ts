@@ -3,6 +3,13 @@ import { NewsEvent } from "@/types/event";
 type FetchEventsOptions = {
   category?: string;
   location?: string;
+  cursor?: string;
+};
+
+export type EventsPage = {
+  events: NewsEvent[];
+  // Pass back as `cursor` for the next (older) page; null on the last page.
+  nextCursor: string | null;
 };
 
 function withBase(path: string): string {
@@ -13,10 +20,11 @@ function withBase(path: string): string {
   return `${base}${path}`;
 }
 
-export async function fetchEvents(options: FetchEventsOptions = {}): Promise<NewsEvent[]> {
+export async function fetchEvents(options: FetchEventsOptions = {}): Promise<EventsPage> {
   const params = new URLSearchParams();
   if (options.category) params.set("category", options.category);
   if (options.location) params.set("location", options.location);
+  if (options.cursor) params.set("cursor", options.cursor);
 
   const suffix = params.toString() ? `?${params.toString()}` : "";
   const response = await fetch(withBase(`/api/events${suffix}`), {
@@ -24,10 +32,11 @@ export async function fetchEvents(options: FetchEventsOptions = {}): Promise<New
   });
 
   if (!response.ok) {
-    return [];
+    return { events: [], nextCursor: null };
   }
 
-  return (await response.json()) as NewsEvent[];
+  const body = (await response.json()) as { events: NewsEvent[]; next_cursor: string | null };
+  return { events: body.events, nextCursor: body.next_cursor };
 }
 
 export async function fetchEventById(id: string): Promise<NewsEvent | null> {
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.responses import JSONResponse
 
-from ai_news_publisher.infrastructure.repository import InMemoryEventRepository
+from ai_news_publisher.infrastructure.repository import build_event_repository
 from ai_news_publisher.config import settings
 from ai_news_publisher.infrastructure.email import EmailSettings, SMTPEmailSender
 from ai_news_publisher.services.digest import DigestConfig, DigestService
@@ -11,10 +14,22 @@ from ai_news_publisher.services.email_digest import EmailDigestService
 from ai_news_publisher.seo import build_seo_metadata
 from ai_news_publisher.services.localization import LocalizationService, Location
 from ai_news_publisher.services.publishing import PublishingService
+from ai_news_publisher.services.retention import build_retention_service
 from ai_news_publisher.monitoring import monitoring_store
 
-app = FastAPI(title="AI News Publisher API", version="1.0.0")
-repository = InMemoryEventRepository()
+repository = build_event_repository()
+retention_service = build_retention_service(repository)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    task = asyncio.create_task(retention_service.run_forever()) if retention_service is not None else None
+    yield
+    if task is not None:
+        task.cancel()
+
+
+app = FastAPI(title="AI News Publisher API", version="1.0.0", lifespan=lifespan)
 publishing_service = PublishingService(repository)
 localization_service = LocalizationService()
 email_digest_service = EmailDigestService(
@@ -51,10 +66,17 @@ def list_events(
     category: str | None = Query(default=None),
     country: str | None = Query(default=None),
     city: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None),
 ):
-    events = publishing_service.list_events(category=category, country=country, city=city)
+    try:
+        page = publishing_service.list_events_page(
+            limit=limit, cursor=cursor, category=category, country=country, city=city
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     payload = []
-    for event in events:
+    for event in page.events:
         payload.append(
             {
                 "slug": event.slug,
@@ -68,11 +90,40 @@ def list_events(
                 "ai_generated_notice": event.ai_generated_notice,
             }
         )
-    response = JSONResponse({"events": payload})
+    response = JSONResponse({"events": payload, "next_cursor": page.next_cursor})
     response.headers["Cache-Control"] = "public, max-age=300"
     return response
 
 
+@app.get("/api/search")
+def search_events(
+    q: str = Query(min_length=1, max_length=200),
+    category: str | None = Query(default=None),
+    country: str | None = Query(default=None),
+    city: str | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+):
+    results = [
+        {
+            "slug": event.slug,
+            "title": event.title,
+            "category": event.category,
+            "country": event.country,
+            "city": event.city,
+            "summary": event.summary,
+            "status": event.status,
+            "score": round(score, 4),
+            "ai_generated_notice": event.ai_generated_notice,
+        }
+        for event, score in publishing_service.search_events(
+            q, category=category, country=country, city=city, limit=limit
+        )
+    ]
+    response = JSONResponse({"query": q, "results": results})
+    response.headers["Cache-Control"] = "public, max-age=60"
+    return response
+
+
 @app.get("/api/events/{slug}")
 def event_detail(slug: str):
     event = publishing_service.get_event(slug)
@@ -96,6 +147,28 @@ def event_detail(slug: str):
     return response
 
 
+@app.get("/api/events/{slug}/related")
+def related_events(slug: str, k: int = Query(default=5, ge=1, le=50)):
+    if not publishing_service.get_event(slug):
+        monitoring_store.record_publishing_failure(f"event_not_found:{slug}")
+        raise HTTPException(status_code=404, detail="Event not found")
+    related = [
+        {
+            "slug": event.slug,
+            "title": event.title,
+            "category": event.category,
+            "country": event.country,
+            "city": event.city,
+            "status": event.status,
+            "score": round(score, 4),
+        }
+        for event, score in publishing_service.related_events(slug, k)
+    ]
+    response = JSONResponse({"slug": slug, "related": related})
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return response
+
+
 @app.get("/api/events/{slug}/local-impact")
 def local_impact(slug: str, country: str, state: str | None = None, city: str | None = None):
     event = publishing_service.get_event(slug)
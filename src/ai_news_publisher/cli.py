@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import sys
 from pathlib import Path
 from typing import Sequence
 
+from .config import settings
+from .infrastructure.repository import build_event_repository
 from .pipeline import generate_markdown_digest, normalize_items
+from .services.ingestion import build_ingestion_service
+from .services.ingestion_scheduler import IngestionScheduler
+from .services.retention import build_retention_service
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -22,7 +28,24 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def build_schedule_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ai-news-publisher schedule",
+        description="Continuously ingest RSS feeds, polling each on an adaptive interval.",
+    )
+    parser.add_argument(
+        "feeds",
+        type=Path,
+        help="Path to JSON file containing a list of feed objects (url, source_name, country, city, category)",
+    )
+    parser.add_argument("--once", action="store_true", help="Run a single polling cycle and print per-feed lag")
+    return parser
+
+
 def run(argv: Sequence[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["schedule"]:
+        return run_schedule(argv[1:])
     args = build_parser().parse_args(argv)
 
     try:
@@ -58,6 +81,47 @@ def run(argv: Sequence[str] | None = None) -> int:
     return 0
 
 
+def run_schedule(argv: Sequence[str]) -> int:
+    args = build_schedule_parser().parse_args(argv)
+    try:
+        feeds = json.loads(args.feeds.read_text(encoding="utf-8"))
+    except OSError as exc:
+        print(f"Error reading feeds file '{args.feeds}': {exc}", file=sys.stderr)
+        return 1
+    except json.JSONDecodeError as exc:
+        print(f"Error parsing JSON in '{args.feeds}': {exc}", file=sys.stderr)
+        return 1
+    if not isinstance(feeds, list) or not all(isinstance(feed, dict) and feed.get("url") for feed in feeds):
+        print("Feeds JSON must be a list of objects with a 'url'", file=sys.stderr)
+        return 1
+    if not settings.events_db_path:
+        # An in-memory store dies with this process, so the API would never see the events.
+        if not args.once:
+            print("EVENTS_DB_PATH must be set: scheduled ingestion stores events for the API", file=sys.stderr)
+            return 1
+        print("Warning: EVENTS_DB_PATH is not set; ingested events are discarded on exit", file=sys.stderr)
+
+    repository = build_event_repository()
+    scheduler = IngestionScheduler(
+        build_ingestion_service(repository), feeds, retention=build_retention_service(repository)
+    )
+    if args.once:
+        for schedule in scheduler.schedules.values():
+            schedule.next_due = scheduler.clock()
+        events = asyncio.run(scheduler.run_once())
+        print(f"Ingested {len(events)} events from {len(feeds)} feeds")
+        for url, report in scheduler.lag_report().items():
+            print(f"{url}: {json.dumps(report, sort_keys=True)}")
+        if scheduler.retention is not None:
+            print(f"Evicted {scheduler.retention.run_once()} events past the retention horizon")
+        return 0
+    try:
+        asyncio.run(scheduler.run_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
 def main() -> None:
     raise SystemExit(run())
 
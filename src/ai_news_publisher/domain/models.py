@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from hashlib import sha1
-from typing import Iterable
+from sys import intern
+from typing import Iterable, Sequence
 
 
-@dataclass(frozen=True)
+# Events are held by the hundred thousand, so the models use slots instead of a
+# per-instance __dict__, float32 embeddings instead of lists of boxed floats, and
+# interned copies of the few distinct category, location and source strings.
+
+
+@dataclass(frozen=True, slots=True)
 class SourceLink:
     source_name: str
     url: str
     published_at: datetime
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "source_name", intern(self.source_name))
 
-@dataclass
+
+@dataclass(slots=True)
 class Event:
     event_id: str
     slug: str
@@ -25,13 +35,22 @@ class Event:
     confidence: float
     source_diversity: int
     source_count: int
-    embedding: list[float]
+    embedding: Sequence[float]
     source_links: list[SourceLink]
     summary: dict[str, str]
     status: str
     bias_indicator: str
     ai_generated_notice: str = "AI-generated summary. Source links provided for verification."
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.embedding, array):
+            self.embedding = array("f", self.embedding)
+        self.category = intern(self.category)
+        self.country = intern(self.country)
+        self.city = intern(self.city)
+        self.status = intern(self.status)
+        self.bias_indicator = intern(self.bias_indicator)
+
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from hashlib import blake2b
+from threading import Lock
+from typing import Protocol
+
+from ai_news_publisher.monitoring import monitoring_store
+
+
+class Embedder(Protocol):
+    def embed(self, text: str) -> list[float]: ...
 
 
 class DeterministicEmbedder:
@@ -12,6 +21,50 @@ class DeterministicEmbedder:
         return [round((byte / 255.0) * 2 - 1, 6) for byte in digest]
 
 
+class CachedEmbedder:
+    """LRU memoization in front of any embedder, keyed by a digest of the input text.
+
+    Hits, misses and evictions are reported to ``monitoring_store`` as
+    ``embedding_cache_*`` counters.
+    """
+
+    def __init__(self, embedder: Embedder, max_entries: int = 10000) -> None:
+        self.embedder = embedder
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def embed(self, text: str) -> list[float]:
+        key = self._key(text)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+        if cached is not None:
+            monitoring_store.increment_counter("embedding_cache_hits")
+            return cached
+
+        vector = self.embedder.embed(text)
+        evicted = 0
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        monitoring_store.increment_counter("embedding_cache_misses")
+        if evicted:
+            monitoring_store.increment_counter("embedding_cache_evictions", evicted)
+        return vector
+
+
 def cosine_similarity(a: list[float], b: list[float]) -> float:
     if not a or not b or len(a) != len(b):
         return 0.0
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import sqlite3
+from threading import Lock
+
+
+@dataclass(frozen=True)
+class FeedState:
+    """Validators from the last successfully processed response of one feed."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+
+
+class FeedStateStore:
+    def get(self, url: str) -> FeedState | None:
+        raise NotImplementedError
+
+    def put_many(self, states: dict[str, FeedState]) -> None:
+        raise NotImplementedError
+
+
+class InMemoryFeedStateStore(FeedStateStore):
+    def __init__(self) -> None:
+        self._states: dict[str, FeedState] = {}
+
+    def get(self, url: str) -> FeedState | None:
+        return self._states.get(url)
+
+    def put_many(self, states: dict[str, FeedState]) -> None:
+        self._states.update(states)
+
+
+class SQLiteFeedStateStore(FeedStateStore):
+    """Feed validators persisted in a small SQLite file so restarts keep conditional requests."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS feed_state ("
+                " url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content_hash TEXT)"
+            )
+
+    def get(self, url: str) -> FeedState | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_hash FROM feed_state WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return FeedState(etag=row[0], last_modified=row[1], content_hash=row[2])
+
+    def put_many(self, states: dict[str, FeedState]) -> None:
+        rows = [(url, s.etag, s.last_modified, s.content_hash) for url, s in states.items()]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO feed_state (url, etag, last_modified, content_hash) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET etag = excluded.etag, "
+                "last_modified = excluded.last_modified, content_hash = excluded.content_hash",
+                rows,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+import http.client
+from threading import Lock
+import time
+from urllib.parse import urljoin, urlsplit
+from weakref import WeakKeyDictionary
+
+from ai_news_publisher.monitoring import monitoring_store
+
+_HostKey = tuple[str, str, int]
+_RETRYABLE_STATUSES = {429, 502, 503, 504}
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+@dataclass(frozen=True)
+class FetchPolicy:
+    max_concurrency: int = 64
+    per_host_concurrency: int = 4
+    timeout_seconds: float = 10.0
+    retries: int = 2
+    backoff_seconds: float = 0.5
+    max_idle_per_host: int = 4
+    max_redirects: int = 5
+
+
+@dataclass(frozen=True)
+class HTTPResponse:
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    elapsed_seconds: float
+
+
+class HTTPStatusError(Exception):
+    def __init__(self, url: str, status: int) -> None:
+        super().__init__(f"HTTP {status} for {url}")
+        self.url = url
+        self.status = status
+
+
+class PooledHTTPClient:
+    """GET client with global and per-host concurrency caps and keep-alive connection reuse.
+
+    Blocking ``http.client`` calls run on a dedicated thread pool sized to the global cap,
+    so a large feed list never floods the default executor.
+    """
+
+    def __init__(self, policy: FetchPolicy | None = None) -> None:
+        self.policy = policy or FetchPolicy()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.policy.max_concurrency), thread_name_prefix="feed-http"
+        )
+        self._idle: dict[_HostKey, list[http.client.HTTPConnection]] = {}
+        self._idle_lock = Lock()
+        # asyncio primitives are bound to one loop; each ``asyncio.run`` gets its own set.
+        self._limits: WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[asyncio.Semaphore, dict[str, asyncio.Semaphore]]] = (
+            WeakKeyDictionary()
+        )
+
+    async def get(self, url: str, headers: dict[str, str] | None = None) -> HTTPResponse:
+        """GET ``url`` with retries and redirects; 2xx and 304 responses are returned, others raise."""
+
+        started = time.perf_counter()
+        current = url
+        redirects = 0
+        while True:
+            status, response_headers, body = await self._get_with_retries(current, headers or {})
+            if status in _REDIRECT_STATUSES and "location" in response_headers and redirects < self.policy.max_redirects:
+                current = urljoin(current, response_headers["location"])
+                redirects += 1
+                continue
+            elapsed = time.perf_counter() - started
+            monitoring_store.record_feed_fetch(url, elapsed, status)
+            if status == 304 or 200 <= status < 300:
+                return HTTPResponse(current, status, response_headers, body, elapsed)
+            raise HTTPStatusError(url, status)
+
+    def close(self) -> None:
+        with self._idle_lock:
+            pools, self._idle = self._idle, {}
+        for connections in pools.values():
+            for conn in connections:
+                conn.close()
+        self._executor.shutdown(wait=False)
+
+    async def _get_with_retries(self, url: str, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        key: _HostKey = (scheme, parts.hostname or "", parts.port or (443 if scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        loop = asyncio.get_running_loop()
+        global_limit, host_limit = self._semaphores(loop, key[1])
+        attempt = 0
+        while True:
+            try:
+                request = await self._start_request(loop, global_limit, host_limit, key, path, headers)
+                # Shielded: a timeout must not cancel the future early and free the slots with it.
+                result = await asyncio.wait_for(asyncio.shield(request), timeout=self.policy.timeout_seconds)
+                if result[0] not in _RETRYABLE_STATUSES or attempt >= self.policy.retries:
+                    return result
+            except (OSError, http.client.HTTPException, asyncio.TimeoutError):
+                if attempt >= self.policy.retries:
+                    raise
+            monitoring_store.increment_counter("feed_fetch_retries")
+            await asyncio.sleep(self.policy.backoff_seconds * (2**attempt))
+            attempt += 1
+
+    async def _start_request(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        global_limit: asyncio.Semaphore,
+        host_limit: asyncio.Semaphore,
+        key: _HostKey,
+        path: str,
+        headers: dict[str, str],
+    ) -> asyncio.Future:
+        """Run ``_request`` on the pool once both slots are free.
+
+        A blocking call cannot be interrupted, so the slots are released when the worker
+        thread returns, not when the caller gives up. Otherwise timed-out requests would
+        keep running past the concurrency caps.
+        """
+
+        async with AsyncExitStack() as acquired:
+            await acquired.enter_async_context(global_limit)
+            await acquired.enter_async_context(host_limit)
+            request = loop.run_in_executor(self._executor, self._request, key, path, headers)
+            acquired.pop_all()
+
+        def release(future: asyncio.Future) -> None:
+            if not future.cancelled():
+                future.exception()  # retrieved here when the caller already timed out
+            host_limit.release()
+            global_limit.release()
+
+        request.add_done_callback(release)
+        return request
+
+    def _semaphores(self, loop: asyncio.AbstractEventLoop, host: str) -> tuple[asyncio.Semaphore, asyncio.Semaphore]:
+        limits = self._limits.get(loop)
+        if limits is None:
+            limits = (asyncio.Semaphore(max(1, self.policy.max_concurrency)), {})
+            self._limits[loop] = limits
+        global_limit, per_host = limits
+        if host not in per_host:
+            per_host[host] = asyncio.Semaphore(max(1, self.policy.per_host_concurrency))
+        return global_limit, per_host[host]
+
+    def _request(self, key: _HostKey, path: str, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        conn, reused = self._checkout(key)
+        try:
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once on a fresh one.
+                conn.close()
+                conn, reused = self._connect(key), False
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+            body = response.read()
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return response.status, response_headers, body
+
+    def _connect(self, key: _HostKey) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.policy.timeout_seconds)
+        return http.client.HTTPConnection(host, port, timeout=self.policy.timeout_seconds)
+
+    def _checkout(self, key: _HostKey) -> tuple[http.client.HTTPConnection, bool]:
+        with self._idle_lock:
+            pool = self._idle.get(key)
+            if pool:
+                return pool.pop(), True
+        return self._connect(key), False
+
+    def _checkin(self, key: _HostKey, conn: http.client.HTTPConnection) -> None:
+        with self._idle_lock:
+            pool = self._idle.setdefault(key, [])
+            if len(pool) < self.policy.max_idle_per_host:
+                pool.append(conn)
+                return
+        conn.close()
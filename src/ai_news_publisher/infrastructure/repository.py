@@ -1,35 +1,657 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from itertools import chain, islice
+import json
+from pathlib import Path
+import sqlite3
+from threading import Lock
+from typing import Callable, Iterator
 
-from ai_news_publisher.domain.models import Event
+from ai_news_publisher.config import settings
+from ai_news_publisher.domain.models import Event, SourceLink
+from ai_news_publisher.infrastructure.search_index import SearchIndex
+from ai_news_publisher.infrastructure.vector_index import SimilarityIndex, build_similarity_index
+
+
+# Keyset pagination position: the (occurred_at, event_id) of the last event already returned.
+EventCursor = tuple[datetime, str]
 
 
 class EventRepository:
     def upsert_events(self, events: list[Event]) -> None:
         raise NotImplementedError
 
-    def list_events(self) -> list[Event]:
+    def list_events(
+        self,
+        category: str | None = None,
+        country: str | None = None,
+        city: str | None = None,
+        limit: int | None = None,
+        before: EventCursor | None = None,
+    ) -> list[Event]:
+        """Events newest first, optionally filtered case-insensitively by location and category.
+
+        ``before`` is the ``(occurred_at, event_id)`` of the last event of the previous
+        page; only events ordered after it are returned, at most ``limit`` of them.
+        """
+
         raise NotImplementedError
 
     def get_by_slug(self, slug: str) -> Event | None:
         raise NotImplementedError
 
+    def list_events_since(self, since: datetime) -> list[Event]:
+        """Events with ``occurred_at >= since``, newest first."""
+
+        return [event for event in self.list_events() if event.occurred_at >= since]
+
+    def list_events_with_status(self, status: str) -> list[Event]:
+        """Events whose ``status`` is exactly ``status``, newest first."""
+
+        return [event for event in self.list_events() if event.status == status]
+
+    def related_events(self, slug: str, k: int) -> list[tuple[Event, float]]:
+        """Up to ``k`` other events most similar to ``slug`` by embedding, with cosine scores."""
+
+        raise NotImplementedError
+
+    def search_events(
+        self,
+        query: str,
+        category: str | None = None,
+        country: str | None = None,
+        city: str | None = None,
+        limit: int = 20,
+    ) -> list[tuple[Event, float]]:
+        """Best BM25 matches for ``query`` in title and summary, within the given filters.
+
+        The last query word also matches as a prefix, so partially typed queries work.
+        """
+
+        raise NotImplementedError
+
+    def evict_before(self, cutoff: datetime, archive: Callable[[list[Event]], None] | None = None) -> int:
+        """Remove every event with ``occurred_at < cutoff`` and return how many were removed.
+
+        ``archive`` receives the events, oldest first, before anything is removed; if it
+        raises, the store is left unchanged.
+        """
+
+        raise NotImplementedError
+
+
+def _similarity_index() -> SimilarityIndex:
+    return build_similarity_index(settings.related_index_backend, settings.related_ivf_probes)
+
+
+def _search_text(title: str, summary: dict[str, str]) -> str:
+    return " ".join([title, *(str(value) for value in summary.values())])
+
+
+# (occurred_at, event_id, slug): the time-ordered index key of an event.
+_IndexKey = tuple[datetime, str, str]
+
+
+class _TimeIndex:
+    """Events sorted by key in fixed-size blocks, updated copy-on-write.
+
+    An update copies only the block it touches plus the short list of blocks, and
+    publishes the result in one assignment. Readers take ``snapshot()`` without locking
+    and keep a consistent view however long they iterate.
+    """
+
+    BLOCK_SIZE = 512
 
-class InMemoryEventRepository(EventRepository):
     def __init__(self) -> None:
+        # Per block: its last key, its keys and its events. Published blocks are never mutated.
+        self._state: tuple[list[_IndexKey], list[tuple[list[_IndexKey], list[Event]]]] = ([], [])
+
+    def snapshot(self) -> tuple[list[_IndexKey], list[tuple[list[_IndexKey], list[Event]]]]:
+        return self._state
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys, _ in self._state[1])
+
+    def update(self, removed: list[_IndexKey], added: list[tuple[_IndexKey, Event]]) -> None:
+        """Apply one batch; callers serialize writers."""
+
+        maxes, blocks = list(self._state[0]), list(self._state[1])
+        copied: set[int] = set()
+
+        def writable(i: int) -> tuple[list[_IndexKey], list[Event]]:
+            block = blocks[i]
+            if id(block) not in copied:
+                block = (list(block[0]), list(block[1]))
+                blocks[i] = block
+                copied.add(id(block))
+            return block
+
+        for key in removed:
+            i = bisect_left(maxes, key)
+            keys, events = writable(i)
+            pos = bisect_left(keys, key)
+            del keys[pos], events[pos]
+            if not keys:
+                del maxes[i], blocks[i]
+            else:
+                maxes[i] = keys[-1]
+
+        for key, event in added:
+            if not blocks:
+                block = ([key], [event])
+                blocks.append(block)
+                maxes.append(key)
+                copied.add(id(block))
+                continue
+            i = min(bisect_left(maxes, key), len(blocks) - 1)
+            keys, events = writable(i)
+            pos = bisect_left(keys, key)
+            keys.insert(pos, key)
+            events.insert(pos, event)
+            maxes[i] = keys[-1]
+            if len(keys) > 2 * self.BLOCK_SIZE:
+                half = len(keys) // 2
+                right = (keys[half:], events[half:])
+                del keys[half:], events[half:]
+                blocks.insert(i + 1, right)
+                maxes[i] = keys[-1]
+                maxes.insert(i + 1, right[0][-1])
+                copied.add(id(right))
+
+        self._state = (maxes, blocks)
+
+    @staticmethod
+    def _position(maxes: list[_IndexKey], blocks: list, key: tuple) -> tuple[int, int]:
+        i = bisect_left(maxes, key)
+        if i == len(blocks):
+            return i, 0
+        return i, bisect_left(blocks[i][0], key)
+
+    def older_than(self, cutoff: datetime) -> list[Event]:
+        """Events with ``occurred_at < cutoff``, oldest first."""
+
+        maxes, blocks = self._state
+        i, pos = self._position(maxes, blocks, (cutoff,))
+        older = [event for _, events in blocks[:i] for event in events]
+        if i < len(blocks):
+            older.extend(blocks[i][1][:pos])
+        return older
+
+    def drop_before(self, cutoff: datetime) -> None:
+        """Remove every event with ``occurred_at < cutoff``; callers serialize writers.
+
+        Whole blocks are dropped by slicing the block list and only the block holding
+        the cutoff is copied, so the cost does not grow with the number of events removed.
+        """
+
+        maxes, blocks = self._state
+        i, pos = self._position(maxes, blocks, (cutoff,))
+        if i == len(blocks):
+            self._state = ([], [])
+            return
+        if pos:
+            keys, events = blocks[i]
+            blocks = [(keys[pos:], events[pos:]), *blocks[i + 1 :]]
+        else:
+            blocks = blocks[i:]
+        self._state = (maxes[i:], blocks)
+
+    def _chunks(self, since: datetime | None, before: EventCursor | None) -> Iterator[Iterator[Event]]:
+        maxes, blocks = self._state
+        last, last_offset = (len(blocks), 0) if before is None else self._position(maxes, blocks, before)
+        first, first_offset = (0, 0) if since is None else self._position(maxes, blocks, (since,))
+        for i in range(min(last, len(blocks) - 1), first - 1, -1):
+            events = blocks[i][1]
+            start = first_offset if i == first else 0
+            stop = last_offset if i == last else len(events)
+            if start < stop:
+                yield reversed(events[start:stop])
+
+    def iter_newest(self, since: datetime | None = None, before: EventCursor | None = None) -> Iterator[Event]:
+        """Events with ``occurred_at >= since`` and a key below ``before``, newest first."""
+
+        return chain.from_iterable(self._chunks(since, before))
+
+    def newest_first(
+        self, since: datetime | None = None, before: EventCursor | None = None, limit: int | None = None
+    ) -> list[Event]:
+        if limit is not None:
+            return list(islice(self.iter_newest(since, before), limit))
+        result: list[Event] = []
+        for chunk in self._chunks(since, before):
+            result.extend(chunk)
+        return result
+
+
+# Secondary indexes: each field alone, plus the prefixes of events_filters_idx in schema.sql.
+FILTER_INDEXES: tuple[tuple[str, ...], ...] = (
+    ("category",),
+    ("country",),
+    ("city",),
+    ("category", "country"),
+    ("category", "country", "city"),
+)
+
+
+def _filter_values(category: str | None, country: str | None, city: str | None) -> dict[str, str]:
+    given = {"category": category, "country": country, "city": city}
+    return {name: value.lower() for name, value in given.items() if value}
+
+
+class InMemoryEventRepository(EventRepository):
+    """Events keyed by slug, plus indexes kept sorted by ``(occurred_at, event_id)``.
+
+    Besides the main time index there is one per lowercased value of every combination
+    in ``FILTER_INDEXES``, so filtered listings read a time-ordered posting instead of
+    scanning the store. Re-upserting a slug moves it when its time or filter fields
+    changed. Readers never lock; writers are serialized.
+
+    Embeddings are mirrored into a ``SimilarityIndex`` and titles and summaries into a
+    ``SearchIndex`` on every upsert. Related-event and search lookups share the writer
+    lock because both indexes are updated in place.
+    """
+
+    def __init__(self, similarity_index: SimilarityIndex | None = None) -> None:
         self._events_by_slug: dict[str, Event] = {}
+        self._keys_by_slug: dict[str, tuple[_IndexKey, dict[str, str]]] = {}
+        self._index = _TimeIndex()
+        self._postings: dict[tuple[str, ...], dict[tuple[str, ...], _TimeIndex]] = {
+            fields: {} for fields in FILTER_INDEXES
+        }
+        self._similar = similarity_index or _similarity_index()
+        self._search = SearchIndex()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._events_by_slug)
 
     def upsert_events(self, events: list[Event]) -> None:
-        for event in events:
-            self._events_by_slug[event.slug] = event
+        latest = {event.slug: event for event in events}
+        if not latest:
+            return
+        with self._lock:
+            removed = [self._keys_by_slug[slug] for slug in latest if slug in self._keys_by_slug]
+            added = sorted(
+                ((event.occurred_at, event.event_id, event.slug), event) for event in latest.values()
+            )
+            self._index.update([key for key, _ in removed], added)
+
+            changes: dict[tuple[tuple[str, ...], tuple[str, ...]], tuple[list, list]] = {}
+            for key, values in removed:
+                for fields in FILTER_INDEXES:
+                    changes.setdefault((fields, tuple(values[f] for f in fields)), ([], []))[0].append(key)
+            for key, event in added:
+                values = _filter_values(event.category, event.country, event.city)
+                for fields in FILTER_INDEXES:
+                    posting = (fields, tuple(values.get(f, "") for f in fields))
+                    changes.setdefault(posting, ([], []))[1].append((key, event))
+                self._keys_by_slug[event.slug] = (key, {f: values.get(f, "") for f in FILTER_INDEXES[-1]})
+                self._events_by_slug[event.slug] = event
+                if event.embedding:
+                    self._similar.upsert(event.slug, event.embedding)
+                else:
+                    self._similar.remove(event.slug)
+                self._search.add(
+                    event.slug,
+                    _search_text(event.title, event.summary),
+                    category=event.category,
+                    country=event.country,
+                    city=event.city,
+                )
+            for (fields, values), (dropped, inserted) in changes.items():
+                postings = self._postings[fields]
+                index = postings.get(values)
+                if index is None:
+                    index = postings[values] = _TimeIndex()
+                index.update(dropped, inserted)
+                if not index.snapshot()[0]:
+                    del postings[values]
 
-    def list_events(self) -> list[Event]:
-        return sorted(self._events_by_slug.values(), key=lambda e: e.occurred_at, reverse=True)
+    def list_events(
+        self,
+        category: str | None = None,
+        country: str | None = None,
+        city: str | None = None,
+        limit: int | None = None,
+        before: EventCursor | None = None,
+    ) -> list[Event]:
+        wanted = _filter_values(category, country, city)
+        if not wanted:
+            return self._index.newest_first(before=before, limit=limit)
+        # Use the widest index covered by the filters, the shortest posting on ties.
+        best_index: _TimeIndex | None = None
+        best_fields: tuple[str, ...] = ()
+        for fields in FILTER_INDEXES:
+            if not set(fields) <= wanted.keys() or len(fields) < len(best_fields):
+                continue
+            index = self._postings[fields].get(tuple(wanted[f] for f in fields))
+            if index is None:
+                return []
+            if len(fields) > len(best_fields) or len(index) < len(best_index):
+                best_index, best_fields = index, fields
+        residual = [(f, v) for f, v in wanted.items() if f not in best_fields]
+        if not residual:
+            return best_index.newest_first(before=before, limit=limit)
+        matching = (
+            e for e in best_index.iter_newest(before=before) if all(getattr(e, f).lower() == v for f, v in residual)
+        )
+        return list(islice(matching, limit))
+
+    def list_events_since(self, since: datetime) -> list[Event]:
+        return self._index.newest_first(since)
 
     def get_by_slug(self, slug: str) -> Event | None:
         return self._events_by_slug.get(slug)
 
+    def related_events(self, slug: str, k: int) -> list[tuple[Event, float]]:
+        with self._lock:
+            event = self._events_by_slug.get(slug)
+            if event is None or not event.embedding:
+                return []
+            found = self._similar.nearest(event.embedding, k, exclude=(slug,))
+            return [(self._events_by_slug[key], score) for key, score in found]
+
+    def search_events(
+        self,
+        query: str,
+        category: str | None = None,
+        country: str | None = None,
+        city: str | None = None,
+        limit: int = 20,
+    ) -> list[tuple[Event, float]]:
+        with self._lock:
+            found = self._search.search(query, limit, category=category, country=country, city=city)
+            return [(self._events_by_slug[key], score) for key, score in found]
+
+    def evict_before(self, cutoff: datetime, archive: Callable[[list[Event]], None] | None = None) -> int:
+        with self._lock:
+            evicted = self._index.older_than(cutoff)
+            if not evicted:
+                return 0
+            if archive is not None:
+                archive(evicted)
+            self._index.drop_before(cutoff)
+            touched: set[tuple[tuple[str, ...], tuple[str, ...]]] = set()
+            for event in evicted:
+                _, values = self._keys_by_slug.pop(event.slug)
+                del self._events_by_slug[event.slug]
+                self._similar.remove(event.slug)
+                self._search.remove(event.slug)
+                touched.update((fields, tuple(values[f] for f in fields)) for fields in FILTER_INDEXES)
+            # Postings are time-ordered too, so each loses a prefix the same way.
+            for fields, values in touched:
+                postings = self._postings[fields]
+                postings[values].drop_before(cutoff)
+                if not postings[values].snapshot()[0]:
+                    del postings[values]
+            return len(evicted)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+_EVENT_COLUMNS = (
+    "event_id, slug, title, category, country, city, occurred_us, confidence, source_diversity, "
+    "source_count, summary, status, bias_indicator, ai_generated_notice, embedding, source_links"
+)
+
+
+class SQLiteEventRepository(EventRepository):
+    """Durable event store in one SQLite file, shareable by several API workers.
+
+    WAL mode lets readers in other processes proceed while a writer commits. Filter
+    fields are stored lowercased next to the originals, and every ``FILTER_INDEXES``
+    combination has an index ending in ``(occurred_us, event_id)``. Filtered, ordered and
+    paginated listings are therefore index range scans. Embeddings are float32 BLOBs.
+
+    Every write stamps its rows with the next ``version`` from a one-row counter table,
+    so versions keep rising even after eviction deletes the newest rows. The in-process
+    ``SimilarityIndex`` and ``SearchIndex`` catch up on rows past the last version they
+    have seen before each lookup, which also covers writes from other processes.
+    """
+
+    def __init__(self, path: str | Path, similarity_index: SimilarityIndex | None = None) -> None:
+        self._lock = Lock()
+        self._similar = similarity_index or _similarity_index()
+        self._search = SearchIndex()
+        self._synced_version = 0
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                " event_id TEXT PRIMARY KEY, slug TEXT UNIQUE NOT NULL, title TEXT NOT NULL,"
+                " category TEXT NOT NULL, country TEXT NOT NULL, city TEXT NOT NULL,"
+                " category_key TEXT NOT NULL, country_key TEXT NOT NULL, city_key TEXT NOT NULL,"
+                " occurred_us INTEGER NOT NULL, confidence REAL NOT NULL, source_diversity INTEGER NOT NULL,"
+                " source_count INTEGER NOT NULL, summary TEXT NOT NULL, status TEXT NOT NULL,"
+                " bias_indicator TEXT NOT NULL, ai_generated_notice TEXT NOT NULL,"
+                " embedding BLOB NOT NULL, source_links TEXT NOT NULL, version INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS events_time_idx ON events (occurred_us, event_id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS events_version_idx ON events (version)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS event_version (id INTEGER PRIMARY KEY CHECK (id = 0), version INTEGER NOT NULL)"
+            )
+            # Files written before the counter existed continue from their highest row version.
+            self._conn.execute(
+                "INSERT OR IGNORE INTO event_version (id, version) SELECT 0, COALESCE(MAX(version), 0) FROM events"
+            )
+            for fields in FILTER_INDEXES:
+                columns = ", ".join(f"{field}_key" for field in fields)
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS events_{'_'.join(fields)}_idx "
+                    f"ON events ({columns}, occurred_us, event_id)"
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    @staticmethod
+    def _row(event: Event) -> tuple:
+        return (
+            event.event_id,
+            event.slug,
+            event.title,
+            event.category,
+            event.country,
+            event.city,
+            event.category.lower(),
+            event.country.lower(),
+            event.city.lower(),
+            (event.occurred_at - _EPOCH) // _MICROSECOND,
+            event.confidence,
+            event.source_diversity,
+            event.source_count,
+            json.dumps(event.summary),
+            event.status,
+            event.bias_indicator,
+            event.ai_generated_notice,
+            event.embedding.tobytes(),
+            json.dumps([[link.source_name, link.url, link.published_at.isoformat()] for link in event.source_links]),
+        )
+
+    @staticmethod
+    def _event(row: tuple) -> Event:
+        embedding = array("f")
+        embedding.frombytes(row[14])
+        return Event(
+            event_id=row[0],
+            slug=row[1],
+            title=row[2],
+            category=row[3],
+            country=row[4],
+            city=row[5],
+            occurred_at=_EPOCH + row[6] * _MICROSECOND,
+            confidence=row[7],
+            source_diversity=row[8],
+            source_count=row[9],
+            summary=json.loads(row[10]),
+            status=row[11],
+            bias_indicator=row[12],
+            ai_generated_notice=row[13],
+            embedding=embedding,
+            source_links=[
+                SourceLink(name, url, datetime.fromisoformat(published_at))
+                for name, url, published_at in json.loads(row[15])
+            ],
+        )
+
+    def upsert_events(self, events: list[Event]) -> None:
+        rows = [self._row(event) for event in events]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            # Bumping the counter first takes the write lock, so concurrent writers get disjoint versions.
+            self._conn.execute("UPDATE event_version SET version = version + ? WHERE id = 0", (len(rows),))
+            last = self._conn.execute("SELECT version FROM event_version WHERE id = 0").fetchone()[0]
+            # REPLACE also clears a row holding the same slug under another event_id.
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO events (event_id, slug, title, category, country, city,"
+                " category_key, country_key, city_key, occurred_us, confidence, source_diversity,"
+                " source_count, summary, status, bias_indicator, ai_generated_notice, embedding, source_links, version)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(*row, version) for version, row in enumerate(rows, start=last - len(rows) + 1)],
+            )
+
+    def _query(self, where: list[str], params: list, limit: int | None) -> list[Event]:
+        sql = f"SELECT {_EVENT_COLUMNS} FROM events"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY occurred_us DESC, event_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = [*params, limit]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._event(row) for row in rows]
+
+    def list_events(
+        self,
+        category: str | None = None,
+        country: str | None = None,
+        city: str | None = None,
+        limit: int | None = None,
+        before: EventCursor | None = None,
+    ) -> list[Event]:
+        where: list[str] = []
+        params: list = []
+        for field, value in _filter_values(category, country, city).items():
+            where.append(f"{field}_key = ?")
+            params.append(value)
+        if before is not None:
+            where.append("(occurred_us, event_id) < (?, ?)")
+            params.extend([(before[0] - _EPOCH) // _MICROSECOND, before[1]])
+        return self._query(where, params, limit)
+
+    def list_events_since(self, since: datetime) -> list[Event]:
+        return self._query(["occurred_us >= ?"], [(since - _EPOCH) // _MICROSECOND], None)
+
+    def list_events_with_status(self, status: str) -> list[Event]:
+        return self._query(["status = ?"], [status], None)
+
+    def get_by_slug(self, slug: str) -> Event | None:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_EVENT_COLUMNS} FROM events WHERE slug = ?", (slug,)).fetchone()
+        return self._event(row) if row is not None else None
+
+    def _sync_indexes(self) -> None:
+        """Bring the in-process indexes up to the newest stored version; call with the lock held."""
+
+        rows = self._conn.execute(
+            "SELECT slug, embedding, title, summary, category, country, city, version FROM events"
+            " WHERE version > ? ORDER BY version",
+            (self._synced_version,),
+        )
+        for slug, blob, title, summary, category, country, city, version in rows:
+            embedding = array("f")
+            embedding.frombytes(blob)
+            if embedding:
+                self._similar.upsert(slug, embedding)
+            else:
+                self._similar.remove(slug)
+            self._search.add(
+                slug, _search_text(title, json.loads(summary)), category=category, country=country, city=city
+            )
+            self._synced_version = version
+
+    def _load_hits(self, found: list[tuple[str, float]]) -> list[tuple[Event, float]]:
+        """Stored events for index hits; call with the lock held."""
+
+        if not found:
+            return []
+        rows = self._conn.execute(
+            f"SELECT {_EVENT_COLUMNS} FROM events WHERE slug IN ({', '.join('?' * len(found))})",
+            [key for key, _ in found],
+        ).fetchall()
+        stored = {row[1]: row for row in rows}
+        # Slugs renamed away under the same event_id leave stale keys behind.
+        for key, _ in found:
+            if key not in stored:
+                self._similar.remove(key)
+                self._search.remove(key)
+        return [(self._event(stored[key]), score) for key, score in found if key in stored]
+
+    def related_events(self, slug: str, k: int) -> list[tuple[Event, float]]:
+        with self._lock:
+            self._sync_indexes()
+            row = self._conn.execute("SELECT embedding FROM events WHERE slug = ?", (slug,)).fetchone()
+            if row is None or not row[0]:
+                return []
+            query = array("f")
+            query.frombytes(row[0])
+            return self._load_hits(self._similar.nearest(query, k, exclude=(slug,)))
+
+    def search_events(
+        self,
+        query: str,
+        category: str | None = None,
+        country: str | None = None,
+        city: str | None = None,
+        limit: int = 20,
+    ) -> list[tuple[Event, float]]:
+        with self._lock:
+            self._sync_indexes()
+            return self._load_hits(self._search.search(query, limit, category=category, country=country, city=city))
+
+    def evict_before(self, cutoff: datetime, archive: Callable[[list[Event]], None] | None = None) -> int:
+        cutoff_us = (cutoff - _EPOCH) // _MICROSECOND
+        with self._lock:
+            if archive is not None:
+                rows = self._conn.execute(
+                    f"SELECT {_EVENT_COLUMNS} FROM events WHERE occurred_us < ? ORDER BY occurred_us, event_id",
+                    (cutoff_us,),
+                ).fetchall()
+                if rows:
+                    archive([self._event(row) for row in rows])
+            with self._conn:
+                slugs = [
+                    slug
+                    for (slug,) in self._conn.execute("SELECT slug FROM events WHERE occurred_us < ?", (cutoff_us,))
+                ]
+                self._conn.execute("DELETE FROM events WHERE occurred_us < ?", (cutoff_us,))
+            for slug in slugs:
+                self._similar.remove(slug)
+                self._search.remove(slug)
+            return len(slugs)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def build_event_repository() -> EventRepository:
+    """SQLite-backed when ``EVENTS_DB_PATH`` is set, otherwise in memory."""
+
+    if settings.events_db_path:
+        return SQLiteEventRepository(settings.events_db_path)
+    return InMemoryEventRepository()
+
 
 POSTGRES_SCHEMA_SQL = """
 CREATE EXTENSION IF NOT EXISTS vector;
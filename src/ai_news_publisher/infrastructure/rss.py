@@ -1,15 +1,26 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import codecs
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any
-from urllib.request import urlopen
+from hashlib import sha256
+from sys import intern
+from threading import Lock
+from typing import Any, AsyncIterator, Iterable, Iterator
 import xml.etree.ElementTree as ET
 
+from ai_news_publisher.config import settings
+from ai_news_publisher.infrastructure.feed_state import FeedState, FeedStateStore, InMemoryFeedStateStore
+from ai_news_publisher.infrastructure.http_client import PooledHTTPClient
+from ai_news_publisher.monitoring import monitoring_store
 
-@dataclass(frozen=True)
+_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
 class RawArticle:
     source_name: str
     title: str
@@ -19,46 +30,221 @@ class RawArticle:
     country: str
     city: str
     category: str
+    # URL of the feed the article was read from; several feeds may share a source_name.
+    feed_url: str = ""
+
+    def __post_init__(self) -> None:
+        # Every article of a feed repeats these; keep one copy of each.
+        for name in ("source_name", "country", "city", "category", "feed_url"):
+            object.__setattr__(self, name, intern(getattr(self, name)))
+
+    def __getstate__(self) -> list[Any]:
+        return [getattr(self, field.name) for field in fields(self)]
+
+    def __setstate__(self, state: list[Any]) -> None:
+        # Articles from a parse process arrive with fresh string copies; intern them again.
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
+        self.__post_init__()
 
 
 class RSSFetcher:
+    """Fetches RSS feeds with conditional requests against per-feed validator state.
+
+    New validators are staged while fetching and only written to the state store by
+    ``commit_feed_state`` for the feeds whose events the caller has stored, so a failed
+    run never marks unprocessed content as seen. Callers drop the rest with
+    ``discard_feed_state``.
+
+    XML parsing runs on ``parse_executor`` (a thread or process pool) so large feeds do not
+    stall other in-flight fetches; without one it uses the loop's default thread pool.
+    Parsing holds the GIL, so only a process pool parses in parallel.
+    ``fetch`` is ``download`` followed by ``parse``; staged callers run the two separately.
+    """
+
+    def __init__(
+        self,
+        state_store: FeedStateStore | None = None,
+        http_client: PooledHTTPClient | None = None,
+        parse_executor: Executor | None = None,
+    ) -> None:
+        self.state_store = state_store or InMemoryFeedStateStore()
+        self.http_client = http_client or PooledHTTPClient()
+        self.parse_executor = parse_executor
+        self._pending_states: dict[str, FeedState] = {}
+        self._pending_lock = Lock()
+
     async def fetch_many(self, feeds: list[dict[str, str]]) -> list[RawArticle]:
-        tasks = [self._fetch(feed) for feed in feeds]
+        tasks = [self.fetch(feed) for feed in feeds]
         nested = await asyncio.gather(*tasks)
         return [item for group in nested for item in group]
 
-    async def _fetch(self, feed: dict[str, str]) -> list[RawArticle]:
-        xml_text = await asyncio.to_thread(self._load_feed, feed["url"])
-        return self._parse_feed(xml_text, feed)
-
-    def _load_feed(self, url: str) -> str:
-        with urlopen(url, timeout=10) as response:  # nosec B310
-            return response.read().decode("utf-8", errors="ignore")
-
-    def _parse_feed(self, xml_text: str, feed: dict[str, str]) -> list[RawArticle]:
-        root = ET.fromstring(xml_text)
-        articles: list[RawArticle] = []
-        for item in root.findall(".//item"):
-            title = (item.findtext("title") or "").strip()
-            link = (item.findtext("link") or "").strip()
-            description = (item.findtext("description") or "").strip()
-            pub_date = (item.findtext("pubDate") or "").strip()
-            if not title or not link:
-                continue
-            published = _parse_date(pub_date)
-            articles.append(
-                RawArticle(
-                    source_name=feed.get("source_name", "unknown"),
-                    title=title,
-                    link=link,
-                    description=description,
-                    published_at=published,
-                    country=feed.get("country", "global"),
-                    city=feed.get("city", "global"),
-                    category=feed.get("category", "general"),
-                )
+    async def stream(self, feeds: list[dict[str, str]]) -> AsyncIterator[list[RawArticle]]:
+        """Yield each feed's articles as soon as that feed is fetched and parsed."""
+
+        tasks = [asyncio.ensure_future(self.fetch(feed)) for feed in feeds]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def commit_feed_state(self, urls: Iterable[str]) -> None:
+        """Persist the validators staged for ``urls``; other feeds keep theirs staged."""
+
+        with self._pending_lock:
+            pending = {url: state for url in urls if (state := self._pending_states.pop(url, None)) is not None}
+        if pending:
+            self.state_store.put_many(pending)
+
+    def discard_feed_state(self, urls: Iterable[str]) -> None:
+        """Forget the validators staged for ``urls``, so their next poll downloads them again."""
+
+        with self._pending_lock:
+            for url in urls:
+                self._pending_states.pop(url, None)
+
+    async def fetch(self, feed: dict[str, str]) -> list[RawArticle]:
+        body = await self.download(feed["url"])
+        if body is None:
+            return []
+        return await self.parse(feed, body)
+
+    async def parse(self, feed: dict[str, str], body: bytes) -> list[RawArticle]:
+        """Parse a downloaded ``body`` of ``feed`` on the parse executor."""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_executor, parse_feed, body, _feed_fields(feed))
+
+    async def download(self, url: str) -> bytes | None:
+        """Download ``url``; ``None`` means the feed is unchanged since the last committed poll."""
+
+        state = self.state_store.get(url)
+        headers: dict[str, str] = {}
+        if state is not None:
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                headers["If-Modified-Since"] = state.last_modified
+        response = await self.http_client.get(url, headers)
+        if response.status == 304:
+            monitoring_store.increment_counter("feeds_not_modified")
+            return None
+
+        content_hash = sha256(response.body).hexdigest()
+        if state is not None and state.content_hash == content_hash:
+            monitoring_store.increment_counter("feeds_unchanged")
+            return None
+        with self._pending_lock:
+            self._pending_states[url] = FeedState(
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                content_hash=content_hash,
             )
-        return articles
+        return response.body
+
+
+def build_parse_executor(mode: str, workers: int) -> Executor:
+    """Create the feed parsing pool for ``mode`` (``thread`` or ``process``).
+
+    Parse threads hold the GIL while parsing, so ``thread`` only moves the work off the
+    event loop and overlaps it with network I/O; it never uses more than one core. Use
+    ``process`` when parsing itself is the bottleneck.
+    """
+
+    if mode == "process":
+        return ProcessPoolExecutor(max_workers=max(1, workers))
+    if mode == "thread":
+        return ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="feed-parse")
+    raise ValueError(f"Unknown feed parse mode: {mode}")
+
+
+def _feed_fields(feed: dict[str, str]) -> dict[str, str]:
+    """The feed metadata a parse worker needs; keeps process-pool payloads small."""
+
+    keys = ("url", "source_name", "country", "city", "category", "max_items", "max_bytes")
+    return {key: feed[key] for key in keys if key in feed}
+
+
+def parse_feed(body: bytes, feed: dict[str, str]) -> list[RawArticle]:
+    """Parse an RSS document into articles; a module-level function so process pools can run it.
+
+    ``feed`` may carry ``max_items`` / ``max_bytes`` caps, defaulting to
+    ``FEED_MAX_ITEMS`` / ``FEED_MAX_BYTES``.
+    """
+
+    max_items = int(feed.get("max_items") or settings.feed_max_items) or None
+    max_bytes = int(feed.get("max_bytes") or settings.feed_max_bytes) or None
+    chunks = (body[start : start + _CHUNK_BYTES] for start in range(0, len(body), _CHUNK_BYTES))
+    return list(iter_feed_articles(chunks, feed, max_items=max_items, max_bytes=max_bytes))
+
+
+def iter_feed_articles(
+    chunks: Iterable[bytes],
+    feed: dict[str, str],
+    max_items: int | None = None,
+    max_bytes: int | None = None,
+) -> Iterator[RawArticle]:
+    """Incrementally parse RSS bytes, yielding each article as its ``<item>`` closes.
+
+    Finished items are detached from the tree, so memory stays bounded by the largest
+    single item rather than the feed. Parsing stops quietly after ``max_items`` articles
+    or ``max_bytes`` of input.
+    """
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: list[ET.Element] = []
+    consumed = 0
+    emitted = 0
+    truncated = False
+    for chunk in chunks:
+        if max_bytes is not None and consumed + len(chunk) > max_bytes:
+            chunk = chunk[: max_bytes - consumed]
+            truncated = True
+        consumed += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        for event, element in parser.read_events():
+            if event == "start":
+                stack.append(element)
+                continue
+            stack.pop()
+            if element.tag != "item":
+                continue
+            article = _article_from_item(element, feed)
+            if stack:
+                stack[-1].remove(element)
+            if article is None:
+                continue
+            yield article
+            emitted += 1
+            if max_items is not None and emitted >= max_items:
+                return
+        if truncated:
+            return
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+
+
+def _article_from_item(item: ET.Element, feed: dict[str, str]) -> RawArticle | None:
+    title = (item.findtext("title") or "").strip()
+    link = (item.findtext("link") or "").strip()
+    description = (item.findtext("description") or "").strip()
+    pub_date = (item.findtext("pubDate") or "").strip()
+    if not title or not link:
+        return None
+    return RawArticle(
+        source_name=feed.get("source_name", "unknown"),
+        title=title,
+        link=link,
+        description=description,
+        published_at=_parse_date(pub_date),
+        country=feed.get("country", "global"),
+        city=feed.get("city", "global"),
+        category=feed.get("category", "general"),
+        feed_url=feed.get("url", ""),
+    )
 
 
 def _parse_date(value: str) -> datetime:
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import accumulate
+import math
+import re
+
+try:  # NumPy vectorizes posting decoding and scoring; the pure-Python path is always available.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+_TOKEN = re.compile(r"\w+")
+
+FACETS = ("category", "country", "city")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+class _Postings:
+    __slots__ = ("deltas", "tfs", "last")
+
+    def __init__(self) -> None:
+        # Gap to the previous doc id (the first entry is the id itself), and its term frequency.
+        self.deltas = array("I")
+        self.tfs = array("H")
+        self.last = 0
+
+    def append(self, doc: int, tf: int) -> None:
+        self.deltas.append(doc - self.last)
+        self.tfs.append(min(tf, 0xFFFF))
+        self.last = doc
+
+
+class SearchIndex:
+    """BM25 full-text index with prefix matching and exact-match facet pre-filters.
+
+    Documents get increasing integer ids. Re-adding a key tombstones its old id, so a
+    posting list only ever grows at its end and stays sorted for delta encoding:
+    4-byte doc-id gaps plus 2-byte term frequencies per posting. Tombstoned ids are
+    purged by rewriting the postings once they outnumber live documents.
+
+    A last query token of at least ``MIN_PREFIX_LENGTH`` characters also matches the
+    first ``MAX_PREFIX_TERMS`` indexed terms it is a prefix of. Such expansions count ``PREFIX_WEIGHT`` of a full
+    match, since rare completions would otherwise outrank the word actually typed.
+    Not thread-safe; callers serialize access.
+    """
+
+    K1 = 1.2
+    B = 0.75
+    MIN_PREFIX_LENGTH = 3
+    MAX_PREFIX_TERMS = 16
+    PREFIX_WEIGHT = 0.3
+    MIN_COMPACT = 1024
+
+    def __init__(self) -> None:
+        self._postings: dict[str, _Postings] = {}
+        self._keys: list[str | None] = []
+        self._doc_of: dict[str, int] = {}
+        self._lengths = array("I")
+        self._alive = bytearray()
+        self._facets = {name: array("I") for name in FACETS}
+        self._facet_codes: dict[str, int] = {}
+        self._total_length = 0
+        self._sorted_terms: list[str] = []
+        self._new_terms: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    def add(self, key: str, text: str, **facets: str) -> None:
+        """Index ``text`` under ``key``, replacing what the key held before."""
+
+        self.remove(key)
+        doc = len(self._keys)
+        tokens = tokenize(text)
+        for term, tf in Counter(tokens).items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+                self._new_terms.append(term)
+            postings.append(doc, tf)
+        self._keys.append(key)
+        self._doc_of[key] = doc
+        self._lengths.append(len(tokens))
+        self._alive.append(1)
+        self._total_length += len(tokens)
+        for name in FACETS:
+            value = facets.get(name, "").lower()
+            self._facets[name].append(self._facet_codes.setdefault(value, len(self._facet_codes)))
+
+    def remove(self, key: str) -> None:
+        doc = self._doc_of.pop(key, None)
+        if doc is None:
+            return
+        self._keys[doc] = None
+        self._alive[doc] = 0
+        self._total_length -= self._lengths[doc]
+        dead = len(self._keys) - len(self._doc_of)
+        if dead > max(self.MIN_COMPACT, len(self._doc_of)):
+            self._compact()
+
+    def _compact(self) -> None:
+        remap = {}
+        for doc, key in enumerate(self._keys):
+            if key is not None:
+                remap[doc] = len(remap)
+        for term in list(self._postings):
+            old = self._postings[term]
+            fresh = _Postings()
+            for doc, tf in zip(accumulate(old.deltas), old.tfs):
+                if doc in remap:
+                    fresh.append(remap[doc], tf)
+            if fresh.deltas:
+                self._postings[term] = fresh
+            else:
+                del self._postings[term]
+        live = list(remap)
+        self._keys = [self._keys[doc] for doc in live]
+        self._doc_of = {key: doc for doc, key in enumerate(self._keys)}
+        self._lengths = array("I", (self._lengths[doc] for doc in live))
+        self._alive = bytearray(b"\x01" * len(live))
+        self._facets = {name: array("I", (codes[doc] for doc in live)) for name, codes in self._facets.items()}
+        self._sorted_terms = sorted(self._postings)
+        self._new_terms = []
+
+    def _expand_prefix(self, prefix: str) -> list[str]:
+        if self._new_terms:
+            if len(self._new_terms) > len(self._sorted_terms) // 16:
+                self._sorted_terms = sorted(self._postings)
+            else:
+                for term in self._new_terms:
+                    insort(self._sorted_terms, term)
+            self._new_terms = []
+        terms = self._sorted_terms
+        found = []
+        for i in range(bisect_left(terms, prefix), len(terms)):
+            if not terms[i].startswith(prefix) or len(found) == self.MAX_PREFIX_TERMS:
+                break
+            if terms[i] in self._postings:
+                found.append(terms[i])
+        return found
+
+    def search(self, query: str, limit: int = 20, **filters: str | None) -> list[tuple[str, float]]:
+        """Best ``limit`` ``(key, score)`` pairs for ``query``; ties go to the most recently added."""
+
+        tokens = tokenize(query)
+        if not tokens or not self._doc_of or limit <= 0:
+            return []
+        terms = {}
+        if len(tokens[-1]) >= self.MIN_PREFIX_LENGTH:
+            terms = {term: self.PREFIX_WEIGHT for term in self._expand_prefix(tokens[-1])}
+        terms.update((term, 1.0) for term in tokens if term in self._postings)
+        wanted = []
+        for name, value in filters.items():
+            if not value:
+                continue
+            code = self._facet_codes.get(value.lower())
+            if code is None:
+                return []
+            wanted.append((self._facets[name], code))
+        if not terms:
+            return []
+        if np is not None:
+            ranked = self._score_numpy(terms, wanted, limit)
+        else:
+            ranked = self._score_python(terms, wanted, limit)
+        return [(self._keys[doc], score) for doc, score in ranked]
+
+    def _idf(self, df: int) -> float:
+        return math.log(1 + (len(self._doc_of) - df + 0.5) / (df + 0.5))
+
+    def _score_python(self, terms: dict[str, float], wanted: list, limit: int) -> list[tuple[int, float]]:
+        k1, b = self.K1, self.B
+        average = self._total_length / len(self._doc_of) or 1.0
+        scores: dict[int, float] = {}
+        for term, weight in terms.items():
+            postings = self._postings[term]
+            matches = [(doc, tf) for doc, tf in zip(accumulate(postings.deltas), postings.tfs) if self._alive[doc]]
+            if not matches:
+                continue
+            idf = weight * self._idf(len(matches))
+            for doc, tf in matches:
+                if any(codes[doc] != code for codes, code in wanted):
+                    continue
+                norm = k1 * (1 - b + b * self._lengths[doc] / average)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return ranked[:limit]
+
+    def _score_numpy(self, terms: dict[str, float], wanted: list, limit: int) -> list[tuple[int, float]]:
+        k1, b = self.K1, self.B
+        average = self._total_length / len(self._doc_of) or 1.0
+        alive = np.frombuffer(self._alive, dtype=np.uint8)
+        lengths = np.frombuffer(self._lengths, dtype=np.uint32)
+        facets = [(np.frombuffer(codes, dtype=np.uint32), code) for codes, code in wanted]
+        matched_docs, matched_scores = [], []
+        for term, weight in terms.items():
+            postings = self._postings[term]
+            docs = np.cumsum(np.frombuffer(postings.deltas, dtype=np.uint32), dtype=np.int64)
+            keep = alive[docs].view(bool)
+            df = int(keep.sum())
+            if not df:
+                continue
+            idf = weight * self._idf(df)
+            for codes, code in facets:
+                keep &= codes[docs] == code
+            docs = docs[keep]
+            tfs = np.frombuffer(postings.tfs, dtype=np.uint16)[keep].astype(np.float64)
+            norm = k1 * (1 - b + b * lengths[docs] / average)
+            matched_docs.append(docs)
+            matched_scores.append(idf * tfs * (k1 + 1) / (tfs + norm))
+        if not matched_docs:
+            return []
+        if len(matched_docs) == 1:
+            docs, scores = matched_docs[0], matched_scores[0]
+        else:
+            docs, scores = np.concatenate(matched_docs), np.concatenate(matched_scores)
+            if len(docs) * 8 > len(self._keys):
+                # Dense accumulation beats sorting once matches are a sizeable share of all ids.
+                scores = np.bincount(docs, weights=scores, minlength=len(self._keys))
+                docs = np.flatnonzero(scores)
+                scores = scores[docs]
+            else:
+                docs, inverse = np.unique(docs, return_inverse=True)
+                scores = np.bincount(inverse, weights=scores)
+        if len(docs) > limit:
+            # Keep everything tied with the limit-th score so the tie-break below is exact.
+            cut = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            top = scores >= cut
+            docs, scores = docs[top], scores[top]
+        ranked = sorted(zip(docs.tolist(), scores.tolist()), key=lambda item: (-item[1], -item[0]))
+        return ranked[:limit]
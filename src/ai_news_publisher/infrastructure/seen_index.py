@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from hashlib import blake2b
+import math
+from pathlib import Path
+import sqlite3
+from threading import Lock
+from typing import Iterable
+
+from ai_news_publisher.domain.models import utc_now
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over byte keys using double hashing."""
+
+    def __init__(self, expected_items: int, false_positive_rate: float = 0.01) -> None:
+        expected_items = max(1, expected_items)
+        bits = math.ceil(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2))
+        self.size = max(8, bits)
+        self.hashes = max(1, round(self.size / expected_items * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: bytes) -> Iterable[int]:
+        digest = blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key: bytes) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SeenArticleIndex:
+    """Persistent set of already-ingested article links with time-based expiry.
+
+    Links are stored as 16-byte digests in SQLite (in memory when ``path`` is None).
+    A Bloom filter in front answers most "never seen" lookups without touching SQLite.
+    The TTL runs from the last time a link was looked up or marked, so an item a feed
+    keeps listing never expires and comes back as new.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        ttl: timedelta = timedelta(days=7),
+        expected_items: int = 1_000_000,
+        false_positive_rate: float = 0.01,
+    ) -> None:
+        self.ttl = ttl
+        self._expected_items = expected_items
+        self._false_positive_rate = false_positive_rate
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(path) if path else ":memory:", check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_links (link_hash BLOB PRIMARY KEY, seen_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS seen_links_seen_at_idx ON seen_links (seen_at)")
+        self._last_expiry = utc_now()
+        self._bloom = self._build_bloom()
+
+    @staticmethod
+    def _key(link: str) -> bytes:
+        return blake2b(link.encode("utf-8"), digest_size=16).digest()
+
+    def _build_bloom(self) -> BloomFilter:
+        bloom = BloomFilter(self._expected_items, self._false_positive_rate)
+        for (link_hash,) in self._conn.execute("SELECT link_hash FROM seen_links"):
+            bloom.add(link_hash)
+        return bloom
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_links").fetchone()[0]
+
+    def seen(self, links: list[str], now: datetime | None = None) -> list[bool]:
+        """Whether each link was seen within the TTL; links that were are marked seen at ``now`` again."""
+
+        now = now or utc_now()
+        cutoff = (now - self.ttl).timestamp()
+        keys = [self._key(link) for link in links]
+        candidates = [key for key in keys if key in self._bloom]
+        found: set[bytes] = set()
+        with self._lock, self._conn:
+            for start in range(0, len(candidates), 500):
+                batch = candidates[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                hits = [
+                    row[0]
+                    for row in self._conn.execute(
+                        f"SELECT link_hash FROM seen_links WHERE seen_at >= ? AND link_hash IN ({placeholders})",
+                        (cutoff, *batch),
+                    )
+                ]
+                if hits:
+                    self._conn.execute(
+                        f"UPDATE seen_links SET seen_at = ? WHERE link_hash IN ({','.join('?' * len(hits))})",
+                        (now.timestamp(), *hits),
+                    )
+                found.update(hits)
+        return [key in found for key in keys]
+
+    def mark_seen(self, links: Iterable[str], now: datetime | None = None) -> None:
+        now = now or utc_now()
+        rows = [(self._key(link), now.timestamp()) for link in links]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO seen_links (link_hash, seen_at) VALUES (?, ?) "
+                    "ON CONFLICT(link_hash) DO UPDATE SET seen_at = excluded.seen_at",
+                    rows,
+                )
+            for key, _ in rows:
+                self._bloom.add(key)
+            if now - self._last_expiry >= self.ttl / 4:
+                self._expire_unlocked(now)
+
+    def expire(self, now: datetime | None = None) -> int:
+        with self._lock:
+            return self._expire_unlocked(now or utc_now())
+
+    def _expire_unlocked(self, now: datetime) -> int:
+        with self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM seen_links WHERE seen_at < ?", ((now - self.ttl).timestamp(),)
+            ).rowcount
+        self._last_expiry = now
+        if removed:
+            # Bloom filters cannot delete; rebuild so expired links stop costing SQLite lookups.
+            self._bloom = self._build_bloom()
+        return removed
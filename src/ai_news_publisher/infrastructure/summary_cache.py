@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import json
+from hashlib import sha1
+from pathlib import Path
+import sqlite3
+from threading import Lock
+import time
+
+from ai_news_publisher.domain.models import Event
+
+# Sign bits of the first dimensions locate the centroid's orthant; nearby centroids share it.
+CENTROID_BUCKET_BITS = 64
+
+
+def centroid_bucket(embedding: list[float]) -> str:
+    bits = 0
+    for value in embedding[:CENTROID_BUCKET_BITS]:
+        bits = (bits << 1) | (value >= 0)
+    return f"{bits:x}"
+
+
+def event_fingerprint(event: Event) -> str:
+    """Content key for a summary: stable when a cluster gains or loses a link from a known source.
+
+    Callers that change an event for real, such as merging new articles into it, drop
+    its entry with ``SummaryCache.delete``.
+    """
+
+    sources = sorted({link.source_name.lower() for link in event.source_links})
+    parts = [
+        event.category.lower(),
+        event.country.lower(),
+        event.city.lower(),
+        centroid_bucket(event.embedding),
+        ",".join(sources),
+    ]
+    return sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    def get(self, key: str) -> dict[str, str] | None:
+        raise NotImplementedError
+
+    def put(self, key: str, payload: dict[str, str]) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class InMemorySummaryCache(SummaryCache):
+    """Per-process LRU cache with a TTL."""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float | None = None) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict[str, str]]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict[str, str] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl_seconds is not None and time.time() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, payload: dict[str, str]) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteSummaryCache(SummaryCache):
+    """Summaries persisted across restarts, evicted by TTL and least-recent access."""
+
+    def __init__(self, path: str | Path, max_entries: int = 100000, ttl_seconds: float | None = None) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                " key TEXT PRIMARY KEY, payload TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS summaries_accessed_idx ON summaries (accessed_at)")
+        self._count = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, key: str) -> dict[str, str] | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT payload, created_at FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                if self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+                    self._count -= 1
+                    return None
+                self._conn.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def put(self, key: str, payload: dict[str, str]) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            inserted = self._conn.execute(
+                "INSERT INTO summaries (key, payload, created_at, accessed_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO NOTHING",
+                (key, json.dumps(payload), now, now),
+            ).rowcount
+            if not inserted:
+                self._conn.execute(
+                    "UPDATE summaries SET payload = ?, created_at = ?, accessed_at = ? WHERE key = ?",
+                    (json.dumps(payload), now, now, key),
+                )
+            self._count += inserted
+            if self._count > self.max_entries:
+                excess = self._count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM summaries WHERE key IN (SELECT key FROM summaries ORDER BY accessed_at LIMIT ?)",
+                    (excess,),
+                )
+                self._count -= excess
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._count -= self._conn.execute("DELETE FROM summaries WHERE key = ?", (key,)).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Collection, Sequence
+
+from ai_news_publisher.infrastructure.embeddings import cosine_similarity
+
+try:  # NumPy is an optional speed-up; the pure-Python index is always available.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+class CentroidIndex:
+    """Growable set of centroid rows answering best-match cosine queries."""
+
+    backend = "base"
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def add(self, vector: Sequence[float]) -> int:
+        raise NotImplementedError
+
+    def update(self, idx: int, vector: Sequence[float]) -> None:
+        raise NotImplementedError
+
+    def scores(self, vector: Sequence[float], start: int = 0, stop: int | None = None) -> Sequence[float]:
+        """Cosine similarity of ``vector`` against rows ``start:stop``."""
+
+        raise NotImplementedError
+
+    def best_match(self, vector: Sequence[float]) -> tuple[int, float]:
+        """Return ``(row, score)`` of the most similar row, or ``(-1, -1.0)`` when empty.
+
+        Ties resolve to the lowest row index, matching a strict ``>`` scan.
+        """
+
+        raise NotImplementedError
+
+
+class PythonCentroidIndex(CentroidIndex):
+    backend = "python"
+
+    def __init__(self) -> None:
+        self._rows: list[list[float]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, vector: Sequence[float]) -> int:
+        self._rows.append(list(vector))
+        return len(self._rows) - 1
+
+    def update(self, idx: int, vector: Sequence[float]) -> None:
+        self._rows[idx] = list(vector)
+
+    def scores(self, vector: Sequence[float], start: int = 0, stop: int | None = None) -> list[float]:
+        query = list(vector)
+        return [cosine_similarity(query, row) for row in self._rows[start:stop]]
+
+    def best_match(self, vector: Sequence[float]) -> tuple[int, float]:
+        query = list(vector)
+        best_idx, best_score = -1, -1.0
+        for idx, row in enumerate(self._rows):
+            score = cosine_similarity(query, row)
+            if score > best_score:
+                best_score, best_idx = score, idx
+        return best_idx, best_score
+
+
+class NumpyCentroidIndex(CentroidIndex):
+    """Centroids kept as a pre-normalized float64 matrix so a lookup is one mat-vec product."""
+
+    backend = "numpy"
+
+    def __init__(self, initial_capacity: int = 64) -> None:
+        if np is None:
+            raise RuntimeError("NumPy backend requested but numpy is not installed")
+        self._matrix: Any = None
+        self._size = 0
+        self._initial_capacity = max(1, initial_capacity)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> Any:
+        row = np.asarray(vector, dtype=np.float64)
+        norm = float(np.linalg.norm(row))
+        if norm == 0.0:
+            return np.zeros_like(row)
+        return row / norm
+
+    @staticmethod
+    def normalize_many(vectors: Sequence[Sequence[float]]) -> Any:
+        block = np.asarray(vectors, dtype=np.float64)
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return block / norms
+
+    def add(self, vector: Sequence[float]) -> int:
+        row = self._normalize(vector)
+        if self._matrix is None:
+            self._matrix = np.zeros((self._initial_capacity, row.shape[0]), dtype=np.float64)
+        elif self._size == self._matrix.shape[0]:
+            grown = np.zeros((self._matrix.shape[0] * 2, self._matrix.shape[1]), dtype=np.float64)
+            grown[: self._size] = self._matrix[: self._size]
+            self._matrix = grown
+        self._matrix[self._size] = row
+        self._size += 1
+        return self._size - 1
+
+    def update(self, idx: int, vector: Sequence[float]) -> None:
+        self._matrix[idx] = self._normalize(vector)
+
+    def scores(self, vector: Sequence[float], start: int = 0, stop: int | None = None) -> Any:
+        stop = self._size if stop is None else min(stop, self._size)
+        if self._matrix is None or start >= stop:
+            return np.zeros(0, dtype=np.float64)
+        return self._matrix[start:stop] @ self._normalize(vector)
+
+    def best_match(self, vector: Sequence[float]) -> tuple[int, float]:
+        if not self._size:
+            return -1, -1.0
+        scores = self._matrix[: self._size] @ self._normalize(vector)
+        idx = int(np.argmax(scores))
+        return idx, float(scores[idx])
+
+    def score_block(self, normalized_block: Any) -> Any:
+        """Similarities of a pre-normalized ``(batch, dim)`` block against every current row."""
+
+        return normalized_block @ self._matrix[: self._size].T
+
+    def score_rows(self, normalized_query: Any, rows: Any) -> Any:
+        return self._matrix[rows] @ normalized_query
+
+    def score_tail(self, normalized_query: Any, start: int) -> Any:
+        return self._matrix[start : self._size] @ normalized_query
+
+
+def build_centroid_index(backend: str = "auto") -> CentroidIndex:
+    """Create a centroid index for ``backend`` (``auto``, ``numpy`` or ``python``)."""
+
+    if backend == "python":
+        return PythonCentroidIndex()
+    if backend == "numpy":
+        return NumpyCentroidIndex()
+    if backend == "auto":
+        return NumpyCentroidIndex() if np is not None else PythonCentroidIndex()
+    raise ValueError(f"Unknown centroid index backend: {backend}")
+
+
+class SimilarityIndex:
+    """Keyed vectors answering top-k cosine queries, updated in place as keys change."""
+
+    backend = "base"
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def upsert(self, key: str, vector: Sequence[float]) -> None:
+        raise NotImplementedError
+
+    def remove(self, key: str) -> None:
+        raise NotImplementedError
+
+    def nearest(self, vector: Sequence[float], k: int, exclude: Collection[str] = ()) -> list[tuple[str, float]]:
+        """The ``k`` most similar ``(key, score)`` pairs, best first, ties by key."""
+
+        raise NotImplementedError
+
+
+class PythonSimilarityIndex(SimilarityIndex):
+    backend = "python"
+
+    def __init__(self) -> None:
+        self._rows: dict[str, list[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def upsert(self, key: str, vector: Sequence[float]) -> None:
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        self._rows[key] = [value / norm for value in vector]
+
+    def remove(self, key: str) -> None:
+        self._rows.pop(key, None)
+
+    def nearest(self, vector: Sequence[float], k: int, exclude: Collection[str] = ()) -> list[tuple[str, float]]:
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        query = [value / norm for value in vector]
+        ranked = heapq.nsmallest(
+            k,
+            (
+                (-sum(a * b for a, b in zip(query, row)), key)
+                for key, row in self._rows.items()
+                if key not in exclude
+            ),
+        )
+        return [(key, -score) for score, key in ranked]
+
+
+class NumpySimilarityIndex(SimilarityIndex):
+    """Exact search over one contiguous float32 matrix of normalized rows.
+
+    A query is one mat-vec product plus a partial sort. Removing a key moves the last
+    row into its slot, so the matrix never has holes.
+    """
+
+    backend = "numpy"
+
+    def __init__(self, initial_capacity: int = 1024) -> None:
+        if np is None:
+            raise RuntimeError("NumPy backend requested but numpy is not installed")
+        self._matrix: Any = None
+        self._keys: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._initial_capacity = max(1, initial_capacity)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def normalize(vector: Sequence[float]) -> Any:
+        row = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(row))
+        return row / norm if norm else row
+
+    def upsert(self, key: str, vector: Sequence[float]) -> None:
+        row = self.normalize(vector)
+        idx = self._rows.get(key)
+        if idx is None:
+            if self._matrix is None:
+                self._matrix = np.zeros((self._initial_capacity, row.shape[0]), dtype=np.float32)
+            elif len(self._keys) == self._matrix.shape[0]:
+                grown = np.zeros((self._matrix.shape[0] * 2, self._matrix.shape[1]), dtype=np.float32)
+                grown[: len(self._keys)] = self._matrix[: len(self._keys)]
+                self._matrix = grown
+            idx = self._rows[key] = len(self._keys)
+            self._keys.append(key)
+        self._matrix[idx] = row
+
+    def remove(self, key: str) -> None:
+        idx = self._rows.pop(key, None)
+        if idx is None:
+            return
+        last = len(self._keys) - 1
+        if idx != last:
+            self._matrix[idx] = self._matrix[last]
+            self._keys[idx] = self._keys[last]
+            self._rows[self._keys[idx]] = idx
+        self._keys.pop()
+
+    def vectors(self) -> tuple[list[str], Any]:
+        """Keys and their normalized rows, as a view valid until the next write."""
+
+        if self._matrix is None:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        return self._keys, self._matrix[: len(self._keys)]
+
+    def nearest(self, vector: Sequence[float], k: int, exclude: Collection[str] = ()) -> list[tuple[str, float]]:
+        if not self._keys or k <= 0:
+            return []
+        scores = self._matrix[: len(self._keys)] @ self.normalize(vector)
+        for key in exclude:
+            idx = self._rows.get(key)
+            if idx is not None:
+                scores[idx] = -np.inf
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        ranked = sorted((-float(scores[i]), self._keys[i]) for i in top if scores[i] != -np.inf)
+        return [(key, -score) for score, key in ranked]
+
+
+class IVFSimilarityIndex(SimilarityIndex):
+    """Approximate search over inverted lists of a spherical k-means partition.
+
+    Until it holds ``TRAIN_SIZE`` vectors the index is exact. It then clusters them
+    once into about ``sqrt(n)`` lists; later vectors join the list of their nearest
+    centroid. A query scans the ``probes`` lists whose centroids score highest.
+    """
+
+    backend = "ivf"
+    TRAIN_SIZE = 20_000
+
+    def __init__(self, probes: int = 8, kmeans_iterations: int = 10) -> None:
+        if np is None:
+            raise RuntimeError("IVF backend requested but numpy is not installed")
+        self.probes = max(1, probes)
+        self.kmeans_iterations = kmeans_iterations
+        self._exact: NumpySimilarityIndex | None = NumpySimilarityIndex()
+        self._centroids: Any = None
+        self._lists: list[NumpySimilarityIndex] = []
+        self._list_of: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._exact) if self._exact is not None else len(self._list_of)
+
+    @property
+    def trained(self) -> bool:
+        return self._exact is None
+
+    def upsert(self, key: str, vector: Sequence[float]) -> None:
+        if self._exact is not None:
+            self._exact.upsert(key, vector)
+            if len(self._exact) >= self.TRAIN_SIZE:
+                self._train()
+            return
+        row = NumpySimilarityIndex.normalize(vector)
+        target = int(np.argmax(self._centroids @ row))
+        current = self._list_of.get(key)
+        if current is not None and current != target:
+            self._lists[current].remove(key)
+        self._lists[target].upsert(key, row)
+        self._list_of[key] = target
+
+    def remove(self, key: str) -> None:
+        if self._exact is not None:
+            self._exact.remove(key)
+            return
+        current = self._list_of.pop(key, None)
+        if current is not None:
+            self._lists[current].remove(key)
+
+    def _train(self) -> None:
+        keys, data = self._exact.vectors()
+        count = len(keys)
+        lists = max(1, int(math.sqrt(count)))
+        rng = np.random.default_rng(0)
+        centroids = data[rng.choice(count, lists, replace=False)].copy()
+        for _ in range(self.kmeans_iterations):
+            assignment = np.argmax(data @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, data)
+            norms = np.linalg.norm(sums, axis=1)
+            # An empty list keeps its previous centroid.
+            filled = norms > 0
+            centroids[filled] = sums[filled] / norms[filled, None]
+        assignment = np.argmax(data @ centroids.T, axis=1)
+        self._centroids = centroids
+        self._lists = [NumpySimilarityIndex(initial_capacity=64) for _ in range(lists)]
+        for key, row, target in zip(keys, data, assignment.tolist()):
+            self._lists[target].upsert(key, row)
+            self._list_of[key] = target
+        self._exact = None
+
+    def nearest(self, vector: Sequence[float], k: int, exclude: Collection[str] = ()) -> list[tuple[str, float]]:
+        if self._exact is not None:
+            return self._exact.nearest(vector, k, exclude)
+        query = NumpySimilarityIndex.normalize(vector)
+        coarse = self._centroids @ query
+        probed = np.argsort(-coarse)[: self.probes]
+        found: list[tuple[str, float]] = []
+        for target in probed.tolist():
+            found.extend(self._lists[target].nearest(query, k, exclude))
+        found.sort(key=lambda item: (-item[1], item[0]))
+        return found[:k]
+
+
+def build_similarity_index(backend: str = "auto", probes: int = 8) -> SimilarityIndex:
+    """Create a keyed similarity index for ``backend`` (``auto``, ``numpy``, ``python`` or ``ivf``)."""
+
+    if backend == "python":
+        return PythonSimilarityIndex()
+    if backend == "numpy":
+        return NumpySimilarityIndex()
+    if backend == "ivf":
+        return IVFSimilarityIndex(probes=probes)
+    if backend == "auto":
+        return NumpySimilarityIndex() if np is not None else PythonSimilarityIndex()
+    raise ValueError(f"Unknown similarity index backend: {backend}")
@@ -39,6 +39,8 @@ class MonitoringStore:
         resolved_window = recent_window or int(os.getenv("AI_COST_WINDOW", "50"))
         self._recent_window = max(5, resolved_window)
         self._event_counters: dict[str, int] = defaultdict(int)
+        self._feeds: dict[str, dict[str, object]] = {}
+        self._gauges: dict[str, float] = {}
 
     def record_ai_call(
         self,
@@ -100,6 +102,43 @@ class MonitoringStore:
             self._event_counters["publishing_failures"] += 1
         logger.error("Publishing failure: %s", reason)
 
+    def record_feed_fetch(self, url: str, elapsed_seconds: float, status: int) -> None:
+        with self._lock:
+            self._feeds.setdefault(url, {}).update(
+                {
+                    "last_status": status,
+                    "last_latency_ms": round(elapsed_seconds * 1000, 1),
+                    "last_fetched_at": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+            self._event_counters["feed_fetches"] += 1
+
+    def record_feed_schedule(
+        self,
+        url: str,
+        interval_seconds: float,
+        lag_seconds: float,
+        consecutive_failures: int,
+        next_poll_at: datetime,
+    ) -> None:
+        with self._lock:
+            self._feeds.setdefault(url, {}).update(
+                {
+                    "poll_interval_seconds": round(interval_seconds, 1),
+                    "poll_lag_seconds": round(lag_seconds, 1),
+                    "consecutive_failures": consecutive_failures,
+                    "next_poll_at": next_poll_at.isoformat(),
+                }
+            )
+
+    def increment_counter(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._event_counters[name] += amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
     def snapshot(self) -> dict[str, object]:
         with self._lock:
             total_tokens = sum(r.prompt_tokens + r.completion_tokens for r in self._ai_calls)
@@ -112,6 +151,8 @@ class MonitoringStore:
                 "publishing_failures": self._publishing_failures,
                 "alerts": list(self._alerts),
                 "event_counters": dict(self._event_counters),
+                "gauges": dict(self._gauges),
+                "feeds": {url: dict(stats) for url, stats in self._feeds.items()},
                 "last_updated": datetime.now(timezone.utc).isoformat(),
             }
 
@@ -8,7 +8,7 @@ def build_seo_metadata(event: Event, location_suffix: str | None = None) -> dict
     suffix = f" - {location_suffix}" if location_suffix else ""
     canonical = f"{settings.base_url}/events/{event.slug}"
     title = f"{event.title}{suffix} | AI News Publisher"
-    description = event.summary["what_happened"][:155]
+    description = event.summary.get("what_happened", event.title)[:155]
     og_image = f"{settings.base_url}/og/{event.slug}.png"
     return {
         "title": title,
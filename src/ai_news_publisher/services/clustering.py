@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import Executor
+from typing import Hashable, Sequence
+
+from ai_news_publisher.infrastructure.vector_index import CentroidIndex, NumpyCentroidIndex, build_centroid_index
+
+
+class IncrementalClusterer:
+    """Greedy threshold clustering: each vector joins its most similar centroid or starts a new one.
+
+    Centroids are running means, so assignments depend only on the input order and the
+    threshold, not on the index backend.
+
+    Optional blocking restricts candidates: a vector given a ``key`` is only compared
+    with clusters started under the same key, and with ``time_window_seconds`` only
+    with clusters started in the same or an adjacent time window. Without keys or a
+    window every cluster is a candidate.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        backend: str = "auto",
+        block_size: int = 256,
+        block_min_dimensions: int = 64,
+        time_window_seconds: float | None = None,
+    ) -> None:
+        self.threshold = threshold
+        self.backend = backend
+        self.block_size = max(1, block_size)
+        # Below this width a single mat-vec per article beats the block bookkeeping.
+        self.block_min_dimensions = block_min_dimensions
+        self.time_window_seconds = time_window_seconds or None
+        self.members: list[list[int]] = []
+        self.sums: list[list[float]] = []
+        self._partitions: dict[tuple[Hashable, int], tuple[CentroidIndex, list[int]]] = {}
+        self._rows: list[tuple[CentroidIndex, int]] = []
+        self._seen = 0
+        self.index, _ = self._partition(None, 0)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def centroid(self, cluster_idx: int) -> list[float]:
+        count = len(self.members[cluster_idx])
+        return [value / count for value in self.sums[cluster_idx]]
+
+    def _partition(self, key: Hashable, bucket: int) -> tuple[CentroidIndex, list[int]]:
+        partition = self._partitions.get((key, bucket))
+        if partition is None:
+            partition = (build_centroid_index(self.backend), [])
+            self._partitions[(key, bucket)] = partition
+        return partition
+
+    def add(self, vector: Sequence[float], key: Hashable = None, timestamp: float | None = None) -> int:
+        if self.time_window_seconds is None or timestamp is None:
+            buckets = [0]
+        else:
+            home = int(timestamp // self.time_window_seconds)
+            buckets = [home, home - 1, home + 1]
+        best_idx, best_score = -1, -1.0
+        for bucket in buckets:
+            partition = self._partitions.get((key, bucket))
+            if partition is None:
+                continue
+            index, clusters = partition
+            row, score = index.best_match(vector)
+            if row < 0:
+                continue
+            # Prefer the older cluster on ties, as a single ordered scan would.
+            if score > best_score or (score == best_score and clusters[row] < best_idx):
+                best_idx, best_score = clusters[row], score
+        return self._assign(vector, best_idx, best_score, self._partition(key, buckets[0]))
+
+    def add_many(
+        self,
+        vectors: Sequence[Sequence[float]],
+        keys: Sequence[Hashable] | None = None,
+        timestamps: Sequence[float] | None = None,
+    ) -> list[int]:
+        """Assign a batch, scoring whole blocks against the centroid matrix when NumPy is in use."""
+
+        if keys is not None or (timestamps is not None and self.time_window_seconds is not None):
+            keys = keys if keys is not None else [None] * len(vectors)
+            stamps = timestamps if timestamps is not None else [None] * len(vectors)
+            return [self.add(vector, key, stamp) for vector, key, stamp in zip(vectors, keys, stamps)]
+        if (
+            not vectors
+            or len(self._partitions) > 1
+            or not isinstance(self.index, NumpyCentroidIndex)
+            or len(vectors[0]) < self.block_min_dimensions
+        ):
+            return [self.add(vector) for vector in vectors]
+
+        index = self.index
+        home = self._partition(None, 0)
+        assignments: list[int] = []
+        for start in range(0, len(vectors), self.block_size):
+            block = vectors[start : start + self.block_size]
+            normalized = NumpyCentroidIndex.normalize_many(block)
+            frozen = len(index)
+            block_scores = index.score_block(normalized) if frozen else None
+            # Rows whose centroid moved since block_scores was computed.
+            stale: list[int] = []
+            for offset, vector in enumerate(block):
+                query = normalized[offset]
+                best_idx, best_score = -1, -1.0
+                if block_scores is not None:
+                    row = block_scores[offset]
+                    if stale:
+                        row[stale] = index.score_rows(query, stale)
+                    best_idx = int(row.argmax())
+                    best_score = float(row[best_idx])
+                # Clusters created inside this block are newer than the precomputed scores.
+                if len(index) > frozen:
+                    fresh = index.score_tail(query, frozen)
+                    fresh_idx = int(fresh.argmax())
+                    if float(fresh[fresh_idx]) > best_score:
+                        best_idx, best_score = frozen + fresh_idx, float(fresh[fresh_idx])
+                cluster_idx = self._assign(vector, best_idx, best_score, home)
+                if cluster_idx < frozen and cluster_idx not in stale:
+                    stale.append(cluster_idx)
+                assignments.append(cluster_idx)
+        return assignments
+
+    def _assign(
+        self,
+        vector: Sequence[float],
+        best_idx: int,
+        best_score: float,
+        home: tuple[CentroidIndex, list[int]],
+    ) -> int:
+        item_idx = self._seen
+        self._seen += 1
+        if best_idx >= 0 and best_score >= self.threshold:
+            sums = self.sums[best_idx]
+            for i, value in enumerate(vector):
+                sums[i] += value
+            self.members[best_idx].append(item_idx)
+            index, row = self._rows[best_idx]
+            index.update(row, self.centroid(best_idx))
+            return best_idx
+        cluster_idx = len(self.members)
+        self.members.append([item_idx])
+        self.sums.append([0.0 + value for value in vector])
+        index, clusters = home
+        self._rows.append((index, index.add(vector)))
+        clusters.append(cluster_idx)
+        return cluster_idx
+
+
+def cluster_partition(
+    payload: tuple[float, str, float | None, int, bytes, bytes | None],
+) -> list[list[int]]:
+    """Cluster one partition packed as contiguous float64 buffers; a module-level function for process pools.
+
+    Returns member lists in partition-local indices, in cluster creation order.
+    """
+
+    threshold, backend, time_window_seconds, dimensions, vector_bytes, timestamp_bytes = payload
+    flat = array("d")
+    flat.frombytes(vector_bytes)
+    vectors = [flat[start : start + dimensions].tolist() for start in range(0, len(flat), dimensions)]
+    timestamps = None
+    if timestamp_bytes is not None:
+        stamps = array("d")
+        stamps.frombytes(timestamp_bytes)
+        timestamps = stamps.tolist()
+    clusterer = IncrementalClusterer(threshold, backend=backend, time_window_seconds=time_window_seconds)
+    clusterer.add_many(vectors, timestamps=timestamps)
+    return clusterer.members
+
+
+def cluster_in_parallel(
+    vectors: Sequence[Sequence[float]],
+    keys: Sequence[Hashable],
+    threshold: float,
+    executor: Executor,
+    backend: str = "auto",
+    timestamps: Sequence[float] | None = None,
+    time_window_seconds: float | None = None,
+) -> list[list[int]]:
+    """Cluster each blocking-key partition on ``executor``.
+
+    Partitions never share candidates, so the result equals a single
+    ``IncrementalClusterer`` fed the same keys: member lists in global indices,
+    ordered by each cluster's first article.
+    """
+
+    if not vectors:
+        return []
+    partitions: dict[Hashable, list[int]] = {}
+    for idx, key in enumerate(keys):
+        partitions.setdefault(key, []).append(idx)
+    dimensions = len(vectors[0])
+    payloads = []
+    for indices in partitions.values():
+        flat = array("d")
+        for idx in indices:
+            flat.extend(vectors[idx])
+        stamps = array("d", (timestamps[idx] for idx in indices)).tobytes() if timestamps is not None else None
+        payloads.append((threshold, backend, time_window_seconds, dimensions, flat.tobytes(), stamps))
+
+    # Many small partitions travel together so per-task overhead stays low.
+    chunksize = max(1, len(payloads) // 64)
+    clusters: list[list[int]] = []
+    for indices, members in zip(partitions.values(), executor.map(cluster_partition, payloads, chunksize=chunksize)):
+        clusters.extend([indices[i] for i in cluster] for cluster in members)
+    clusters.sort(key=lambda cluster: cluster[0])
+    return clusters
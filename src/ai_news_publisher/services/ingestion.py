@@ -1,95 +1,375 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import Counter
+from contextlib import aclosing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
 from hashlib import sha1
+from typing import AsyncGenerator, Hashable, Sequence
 
 from ai_news_publisher.config import settings
-from ai_news_publisher.domain.models import Event, SourceLink, average, make_slug
-from ai_news_publisher.infrastructure.embeddings import DeterministicEmbedder, cosine_similarity
+from ai_news_publisher.domain.models import Event, SourceLink, make_slug
+from ai_news_publisher.infrastructure.embeddings import CachedEmbedder, DeterministicEmbedder, Embedder
+from ai_news_publisher.infrastructure.feed_state import SQLiteFeedStateStore
+from ai_news_publisher.infrastructure.http_client import FetchPolicy, PooledHTTPClient
 from ai_news_publisher.infrastructure.repository import EventRepository
-from ai_news_publisher.infrastructure.rss import RSSFetcher, RawArticle
-from ai_news_publisher.services.summarization import SummaryService
+from ai_news_publisher.infrastructure.rss import RSSFetcher, RawArticle, build_parse_executor
+from ai_news_publisher.infrastructure.seen_index import SeenArticleIndex
+from ai_news_publisher.infrastructure.summary_cache import InMemorySummaryCache, SQLiteSummaryCache, SummaryCache
+from ai_news_publisher.infrastructure.vector_index import build_centroid_index
+from ai_news_publisher.services.clustering import IncrementalClusterer, cluster_in_parallel
+from ai_news_publisher.services.ingestion_pipeline import IngestionPipeline, PipelineConfig
+from ai_news_publisher.services.summary_scheduler import SummaryBudget, SummaryScheduler
+from ai_news_publisher.services.summarization import (
+    PENDING_SUMMARY_STATUS,
+    SummaryLimits,
+    SummaryService,
+    apply_pending_summary,
+    apply_summary,
+)
 from ai_news_publisher.monitoring import monitoring_store
 
 
+@dataclass
+class ArticleCluster:
+    """Articles grouped into one event, with a running vector sum for O(1) centroid updates."""
+
+    articles: list[RawArticle] = field(default_factory=list)
+    sums: list[float] = field(default_factory=list)
+
+    def add(self, article: RawArticle, vector: list[float]) -> None:
+        if not self.sums:
+            self.sums = [0.0] * len(vector)
+        for i, value in enumerate(vector):
+            self.sums[i] += value
+        self.articles.append(article)
+
+    def centroid(self) -> list[float]:
+        count = len(self.articles)
+        if not count:
+            return []
+        return [value / count for value in self.sums]
+
+
 @dataclass
 class IngestionService:
     repository: EventRepository
     fetcher: RSSFetcher
     summary_service: SummaryService
-    embedder: DeterministicEmbedder
+    embedder: Embedder
+    cluster_backend: str = settings.cluster_backend
+    blocking_keys: tuple[str, ...] = tuple(
+        key.strip() for key in settings.cluster_blocking_keys.split(",") if key.strip()
+    )
+    cluster_time_window: timedelta | None = (
+        timedelta(hours=settings.cluster_time_window_hours) if settings.cluster_time_window_hours > 0 else None
+    )
+    cluster_executor: Executor | None = None
+    parallel_min_articles: int = settings.cluster_parallel_min_articles
+    # Cluster each feed as it arrives. Results then depend on download order, so it is opt-in.
+    stream_feeds: bool = False
+    seen_index: SeenArticleIndex | None = None
+    summary_scheduler: SummaryScheduler | None = None
+    # When set, ingest runs as a staged pipeline that publishes events as they are summarized.
+    pipeline: PipelineConfig | None = None
+    merge_window: timedelta | None = (
+        timedelta(hours=settings.event_merge_window_hours) if settings.event_merge_window_hours > 0 else None
+    )
+    # Articles that survived the seen-index filter in the latest run, by feed URL.
+    last_run_new_articles: Counter[str] = field(default_factory=Counter, init=False, repr=False)
+    _skipped_total: int = field(default=0, init=False, repr=False)
+    _checked_total: int = field(default=0, init=False, repr=False)
 
     async def ingest(self, feeds: list[dict[str, str]]) -> list[Event]:
+        if self.pipeline is not None:
+            return await IngestionPipeline(self, self.pipeline).run(feeds)
+        self.last_run_new_articles = Counter()
         try:
-            articles = await self.fetcher.fetch_many(feeds)
-            clusters = self._cluster_articles(articles)
-            events = [self._to_event(cluster) for cluster in clusters]
+            # Parallel clustering needs the whole batch, so it bypasses per-feed streaming.
+            if self.stream_feeds and self.cluster_executor is None:
+                clusters = await self._cluster_stream(self.fetcher.stream(feeds))
+            else:
+                articles = self.drop_seen(await self.fetcher.fetch_many(feeds))
+                clusters = self._cluster_articles(articles)
+            events = self._resolve_events(clusters)
+            if self.summary_scheduler is not None:
+                released = await self.summary_scheduler.run_cycle(events, article_texts=self._article_texts(clusters))
+                # Deferred events are stored as placeholders so later runs match and merge into them.
+                events = list({event.event_id: event for event in [*events, *released]}.values())
+            else:
+                await self._summarize(events)
             self.repository.upsert_events(events)
+            if self.seen_index is not None:
+                self.seen_index.mark_seen(a.link for cluster in clusters for a in cluster.articles)
+            self.fetcher.commit_feed_state(feed["url"] for feed in feeds)
             return events
         except Exception as exc:
+            self.fetcher.discard_feed_state(feed["url"] for feed in feeds)
             monitoring_store.record_ingestion_failure(str(exc))
             raise
 
-    def _cluster_articles(self, articles: list[RawArticle]) -> list[list[RawArticle]]:
-        clusters: list[list[RawArticle]] = []
-        vectors: list[list[float]] = []
-        for article in articles:
-            vector = self.embedder.embed(f"{article.title} {article.description}")
-            best_idx = -1
-            best_score = -1.0
-            for idx, cluster_vec in enumerate(vectors):
-                score = cosine_similarity(vector, cluster_vec)
-                if score > best_score:
-                    best_score, best_idx = score, idx
-            if best_score >= settings.similarity_threshold and best_idx >= 0:
-                clusters[best_idx].append(article)
-                vectors[best_idx] = average([
-                    self.embedder.embed(f"{a.title} {a.description}") for a in clusters[best_idx]
-                ])
-            else:
-                clusters.append([article])
-                vectors.append(vector)
+    def _new_clusterer(self) -> IncrementalClusterer:
+        window = self.cluster_time_window.total_seconds() if self.cluster_time_window else None
+        return IncrementalClusterer(
+            settings.similarity_threshold, backend=self.cluster_backend, time_window_seconds=window
+        )
+
+    def _blocking_inputs(
+        self, articles: list[RawArticle]
+    ) -> tuple[list[Hashable] | None, list[float] | None]:
+        keys = None
+        if self.blocking_keys:
+            keys = [
+                tuple(str(getattr(article, name)).strip().lower() for name in self.blocking_keys)
+                for article in articles
+            ]
+        timestamps = None
+        if self.cluster_time_window is not None:
+            timestamps = [article.published_at.timestamp() for article in articles]
+        return keys, timestamps
+
+    def _add_to_clusterer(self, clusterer: IncrementalClusterer, articles: list[RawArticle]) -> None:
+        keys, timestamps = self._blocking_inputs(articles)
+        clusterer.add_many([self.embed_article(article) for article in articles], keys=keys, timestamps=timestamps)
+
+    def _cluster_articles(self, articles: list[RawArticle]) -> list[ArticleCluster]:
+        if (
+            self.cluster_executor is not None
+            and self.blocking_keys
+            and len(articles) >= self.parallel_min_articles
+        ):
+            return self._cluster_in_parallel(articles)
+        clusterer = self._new_clusterer()
+        self._add_to_clusterer(clusterer, articles)
+        return self._collect_clusters(clusterer, articles)
+
+    def _cluster_in_parallel(self, articles: list[RawArticle]) -> list[ArticleCluster]:
+        """Cluster independent blocking-key partitions on the process pool."""
+
+        vectors = [self.embed_article(article) for article in articles]
+        keys, timestamps = self._blocking_inputs(articles)
+        members = cluster_in_parallel(
+            vectors,
+            keys,
+            settings.similarity_threshold,
+            self.cluster_executor,
+            backend=self.cluster_backend,
+            timestamps=timestamps,
+            time_window_seconds=self.cluster_time_window.total_seconds() if self.cluster_time_window else None,
+        )
+        clusters = []
+        for indices in members:
+            cluster = ArticleCluster()
+            for idx in indices:
+                cluster.add(articles[idx], vectors[idx])
+            clusters.append(cluster)
         return clusters
 
-    def _to_event(self, cluster: list[RawArticle]) -> Event:
+    async def _cluster_stream(self, batches: AsyncGenerator[list[RawArticle], None]) -> list[ArticleCluster]:
+        """Embed and cluster each feed's batch while slower feeds are still downloading."""
+
+        clusterer = self._new_clusterer()
+        articles: list[RawArticle] = []
+        # Closing the stream on error cancels the downloads still in flight.
+        async with aclosing(batches) as stream:
+            async for batch in stream:
+                batch = self.drop_seen(batch)
+                self._add_to_clusterer(clusterer, batch)
+                articles.extend(batch)
+        return self._collect_clusters(clusterer, articles)
+
+    def drop_seen(self, articles: list[RawArticle]) -> list[RawArticle]:
+        """Skip articles whose link was already ingested, before any embedding work."""
+
+        if self.seen_index is None or not articles:
+            fresh = articles
+        else:
+            flags = self.seen_index.seen([article.link for article in articles])
+            fresh = [article for article, seen in zip(articles, flags) if not seen]
+            skipped = len(articles) - len(fresh)
+            self._skipped_total += skipped
+            self._checked_total += len(articles)
+            monitoring_store.increment_counter("articles_seen_skipped", skipped)
+            monitoring_store.increment_counter("articles_new", len(fresh))
+            monitoring_store.set_gauge("article_skip_rate", round(self._skipped_total / self._checked_total, 4))
+        self.last_run_new_articles.update(article.feed_url for article in fresh)
+        return fresh
+
+    @staticmethod
+    def _collect_clusters(clusterer: IncrementalClusterer, articles: list[RawArticle]) -> list[ArticleCluster]:
+        return [
+            ArticleCluster(articles=[articles[i] for i in members], sums=sums)
+            for members, sums in zip(clusterer.members, clusterer.sums)
+        ]
+
+    def embed_article(self, article: RawArticle) -> list[float]:
+        return self.embedder.embed(f"{article.title} {article.description}")
+
+    def resolve_batch(
+        self, articles: list[RawArticle], vectors: list[list[float]], pending: Sequence[Event] = ()
+    ) -> list[Event]:
+        """Cluster already-embedded ``articles`` and resolve them against stored and ``pending`` events."""
+
+        clusterer = self._new_clusterer()
+        keys, timestamps = self._blocking_inputs(articles)
+        clusterer.add_many(vectors, keys=keys, timestamps=timestamps)
+        return self._resolve_events(self._collect_clusters(clusterer, articles), pending)
+
+    @staticmethod
+    def _article_texts(clusters: list[ArticleCluster]) -> dict[str, str]:
+        return {a.link: f"{a.title} {a.description}" for cluster in clusters for a in cluster.articles}
+
+    def _resolve_events(self, clusters: list[ArticleCluster], pending: Sequence[Event] = ()) -> list[Event]:
+        """Merge clusters into matching recent stored events; the rest become new events.
+
+        ``pending`` holds events built earlier in the same run but not stored yet; they are
+        matched as if stored, and take precedence over an older stored version.
+        """
+
+        matches = self._match_stored_events(clusters, pending)
+        events: list[Event] = []
+        merged: dict[str, Event] = {}
+        claimed = {event.slug: event.event_id for event in pending}
+        for cluster, existing in zip(clusters, matches):
+            if existing is None:
+                event = self._to_event(cluster)
+                self._claim_slug(event, claimed)
+                events.append(event)
+                continue
+            # Several clusters in one batch can land on the same stored event.
+            base = merged.get(existing.slug, existing)
+            updated = self._merge_into_event(base, cluster)
+            if updated is not None:
+                merged[existing.slug] = updated
+        events.extend(merged.values())
+        return events
+
+    def _claim_slug(self, event: Event, claimed: dict[str, str]) -> None:
+        """Suffix ``event.slug`` when another event holds it; generated titles repeat often."""
+
+        owner = claimed.get(event.slug)
+        if owner is None:
+            stored = self.repository.get_by_slug(event.slug)
+            owner = stored.event_id if stored is not None else None
+        if owner is not None and owner != event.event_id:
+            event.slug = f"{event.slug}-{event.event_id[:8]}"
+        claimed[event.slug] = event.event_id
+
+    def _match_stored_events(
+        self, clusters: list[ArticleCluster], pending: Sequence[Event] = ()
+    ) -> list[Event | None]:
+        if not clusters or self.merge_window is None:
+            return [None] * len(clusters)
+        since = min(a.published_at for cluster in clusters for a in cluster.articles) - self.merge_window
+        by_id = {event.event_id: event for event in self.repository.list_events_since(since)}
+        by_id.update((event.event_id, event) for event in pending if event.occurred_at >= since)
+        candidates = [event for event in by_id.values() if event.embedding]
+        if not candidates:
+            return [None] * len(clusters)
+
+        index = build_centroid_index(self.cluster_backend)
+        for event in candidates:
+            index.add(event.embedding)
+        matches: list[Event | None] = []
+        for cluster in clusters:
+            best_idx, best_score = index.best_match(cluster.centroid())
+            if best_idx >= 0 and best_score >= settings.similarity_threshold:
+                matches.append(candidates[best_idx])
+            else:
+                matches.append(None)
+        return matches
+
+    def _merge_into_event(self, existing: Event, cluster: ArticleCluster) -> Event | None:
+        """Fold new articles into a stored event, keeping its event_id and slug stable."""
+
+        known = {link.url for link in existing.source_links}
+        fresh = [a for a in cluster.articles if a.link not in known]
+        if not fresh:
+            return None
+        if len(fresh) == len(cluster.articles):
+            fresh_sums = cluster.sums
+        else:
+            partial = ArticleCluster()
+            for article in fresh:
+                partial.add(article, self.embed_article(article))
+            fresh_sums = partial.sums
+
+        # The pre-merge summary is obsolete once the event gains articles.
+        self.summary_service.forget(existing)
+        previous_count = len(existing.source_links)
+        links = existing.source_links + [SourceLink(a.source_name, a.link, a.published_at) for a in fresh]
+        embedding = [
+            (value * previous_count + added) / len(links) for value, added in zip(existing.embedding, fresh_sums)
+        ]
+        event = self._build_event(
+            links,
+            embedding,
+            category=existing.category,
+            country=existing.country,
+            city=existing.city,
+            event_id=existing.event_id,
+            slug=existing.slug,
+        )
+        # Until the merged version is summarized it keeps showing the published summary.
+        event.summary, event.status, event.bias_indicator = existing.summary, existing.status, existing.bias_indicator
+        return event
+
+    def _to_event(self, article_cluster: ArticleCluster) -> Event:
+        cluster = article_cluster.articles
         primary = max(cluster, key=lambda a: a.published_at)
-        source_count = len(cluster)
-        source_diversity = len({a.source_name for a in cluster})
-        time_spread_hours = (max(a.published_at for a in cluster) - min(a.published_at for a in cluster)).total_seconds() / 3600 if source_count > 1 else 0
-        time_consistency = 1.0 if time_spread_hours <= 24 else 0.5
-        confidence = min(1.0, round(0.35 + 0.2 * source_count + 0.2 * source_diversity + 0.25 * time_consistency, 3))
-        embedding = average([self.embedder.embed(f"{a.title} {a.description}") for a in cluster])
-        event_id = sha1("|".join(sorted(a.link for a in cluster)).encode("utf-8")).hexdigest()[:16]
-        event = Event(
-            event_id=event_id,
-            slug=make_slug(self._build_event_title(cluster, primary.category, primary.city, primary.country)),
-            title=self._build_event_title(cluster, primary.category, primary.city, primary.country),
+        return self._build_event(
+            [SourceLink(a.source_name, a.link, a.published_at) for a in cluster],
+            article_cluster.centroid(),
             category=primary.category,
             country=primary.country,
             city=primary.city,
+        )
+
+    def _build_event(
+        self,
+        links: list[SourceLink],
+        embedding: list[float],
+        category: str,
+        country: str,
+        city: str,
+        event_id: str | None = None,
+        slug: str | None = None,
+    ) -> Event:
+        primary = max(links, key=lambda link: link.published_at)
+        source_count = len(links)
+        source_diversity = len({link.source_name for link in links})
+        time_spread_hours = (max(link.published_at for link in links) - min(link.published_at for link in links)).total_seconds() / 3600 if source_count > 1 else 0
+        time_consistency = 1.0 if time_spread_hours <= 24 else 0.5
+        confidence = min(1.0, round(0.35 + 0.2 * source_count + 0.2 * source_diversity + 0.25 * time_consistency, 3))
+        title = self._build_event_title(links, category, city, country)
+        event = Event(
+            event_id=event_id or sha1("|".join(sorted(link.url for link in links)).encode("utf-8")).hexdigest()[:16],
+            slug=slug or make_slug(title),
+            title=title,
+            category=category,
+            country=country,
+            city=city,
             occurred_at=primary.published_at,
             confidence=confidence,
             source_diversity=source_diversity,
             source_count=source_count,
             embedding=embedding,
-            source_links=[SourceLink(a.source_name, a.link, a.published_at) for a in cluster],
+            source_links=links,
             summary={},
             status="Developing",
             bias_indicator="unknown",
         )
-        summary = self.summary_service.summarize(event)
-        event.summary = {
-            "what_happened": summary["what_happened"],
-            "where_when": summary["where_when"],
-            "why_it_matters": summary["why_it_matters"],
-            "what_next": summary["what_next"],
-        }
-        event.status = summary["status"]
-        event.bias_indicator = summary["bias_indicator"]
+        apply_pending_summary(event)
         return event
 
+    async def _summarize(self, events: list[Event]) -> None:
+        summaries = await self.summary_service.summarize_many(events)
+        for event, summary in zip(events, summaries):
+            apply_summary(event, summary)
+
     @staticmethod
-    def _build_event_title(cluster: list[RawArticle], category: str, city: str, country: str) -> str:
+    def _build_event_title(cluster: Sequence[RawArticle | SourceLink], category: str, city: str, country: str) -> str:
         """Generate a neutral event title without copying a source headline verbatim."""
 
         source_count = len(cluster)
@@ -97,9 +377,59 @@ class IngestionService:
 
 
 def build_ingestion_service(repository: EventRepository) -> IngestionService:
+    summary_service = SummaryService(
+        limits=SummaryLimits(
+            max_concurrency=settings.summary_max_concurrency,
+            batch_size=settings.summary_batch_size,
+            requests_per_second=settings.summary_requests_per_second or None,
+            tokens_per_minute=settings.summary_tokens_per_minute or None,
+        ),
+        cache=_build_summary_cache(),
+    )
+    summary_scheduler = None
+    if settings.summary_cycle_token_budget or settings.summary_cycle_cost_budget_usd:
+        summary_scheduler = SummaryScheduler(
+            summary_service,
+            SummaryBudget(
+                max_tokens_per_cycle=settings.summary_cycle_token_budget or None,
+                max_cost_usd_per_cycle=settings.summary_cycle_cost_budget_usd or None,
+            ),
+        )
+        # The queue lives in memory; placeholders stored before a restart compete again.
+        summary_scheduler.restore(repository.list_events_with_status(PENDING_SUMMARY_STATUS))
     return IngestionService(
         repository=repository,
-        fetcher=RSSFetcher(),
-        summary_service=SummaryService(),
-        embedder=DeterministicEmbedder(settings.embedding_dimensions),
+        fetcher=RSSFetcher(
+            state_store=SQLiteFeedStateStore(settings.feed_state_path) if settings.feed_state_path else None,
+            http_client=PooledHTTPClient(
+                FetchPolicy(
+                    max_concurrency=settings.feed_max_concurrency,
+                    per_host_concurrency=settings.feed_per_host_concurrency,
+                    timeout_seconds=settings.feed_timeout_seconds,
+                    retries=settings.feed_retries,
+                )
+            ),
+            parse_executor=build_parse_executor(settings.feed_parse_mode, settings.feed_parse_workers),
+        ),
+        summary_service=summary_service,
+        embedder=CachedEmbedder(
+            DeterministicEmbedder(settings.embedding_dimensions),
+            max_entries=settings.embedding_cache_size,
+        ),
+        seen_index=SeenArticleIndex(settings.seen_index_path, ttl=timedelta(hours=settings.seen_index_ttl_hours)),
+        summary_scheduler=summary_scheduler,
+        pipeline=PipelineConfig() if settings.ingest_mode == "staged" else None,
+        stream_feeds=settings.ingest_mode == "stream",
+        cluster_executor=(
+            ProcessPoolExecutor(max_workers=settings.cluster_workers) if settings.cluster_workers > 0 else None
+        ),
     )
+
+
+def _build_summary_cache() -> SummaryCache:
+    ttl_seconds = settings.summary_cache_ttl_hours * 3600 if settings.summary_cache_ttl_hours > 0 else None
+    if settings.summary_cache_path:
+        return SQLiteSummaryCache(
+            settings.summary_cache_path, max_entries=settings.summary_cache_max_entries, ttl_seconds=ttl_seconds
+        )
+    return InMemorySummaryCache(max_entries=settings.summary_cache_max_entries, ttl_seconds=ttl_seconds)
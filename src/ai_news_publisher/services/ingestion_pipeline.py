@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from ai_news_publisher.config import settings
+from ai_news_publisher.domain.models import Event
+from ai_news_publisher.infrastructure.rss import RawArticle
+from ai_news_publisher.monitoring import monitoring_store
+from ai_news_publisher.services.summarization import apply_summary
+
+if TYPE_CHECKING:
+    from ai_news_publisher.services.ingestion import IngestionService
+
+STAGES = ("fetch", "parse", "embed", "cluster", "summarize", "upsert")
+
+# Marks the end of a stage's input; each worker puts it back so its siblings see it too.
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    queue_size: int = settings.pipeline_queue_size
+    fetch_workers: int = settings.pipeline_fetch_workers
+    parse_workers: int = settings.pipeline_parse_workers
+    embed_workers: int = settings.pipeline_embed_workers
+    summarize_workers: int = settings.pipeline_summarize_workers
+    # Articles clustered together at most; under light load batches are whatever has arrived.
+    cluster_batch_size: int = settings.pipeline_cluster_batch_size
+
+
+@dataclass
+class StageStats:
+    items: int = 0
+    busy_seconds: float = 0.0
+
+
+class IngestionPipeline:
+    """Runs one ingestion pass as fetch → parse → embed → cluster → summarize → upsert stages.
+
+    Stages are joined by bounded queues, so a slow stage applies backpressure upstream
+    instead of buffering the whole run in memory. Events are upserted as soon as they
+    are summarized; a failure late in the run keeps everything already published.
+
+    Clustering works on micro-batches. Each batch is matched against stored events and
+    events built earlier in the run, so stories split across batches still merge
+    (within ``IngestionService.merge_window``). Summarize workers may finish out of order,
+    so the upsert stage drops a version of an event older than one it already published.
+    A feed that fails to download or parse does not stop the others. The run raises once
+    the remaining feeds are done.
+    """
+
+    def __init__(self, service: IngestionService, config: PipelineConfig | None = None) -> None:
+        self.service = service
+        self.config = config or PipelineConfig()
+        self.stats = {name: StageStats() for name in STAGES}
+        self.failed_feeds: dict[str, str] = {}
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._pending: dict[str, Event] = {}
+        self._published: dict[str, Event] = {}
+        # Cluster batch number each published event_id came from; later batches hold newer versions.
+        self._published_batch: dict[str, int] = {}
+        self._started = 0.0
+
+    async def run(self, feeds: list[dict[str, str]]) -> list[Event]:
+        service = self.service
+        service.last_run_new_articles = Counter()
+        self._started = time.perf_counter()
+        self._queues = {name: asyncio.Queue(maxsize=max(1, self.config.queue_size)) for name in STAGES}
+        stages = [
+            self._feed_source(feeds),
+            self._stage("fetch", "parse", self._fetch, self.config.fetch_workers),
+            self._stage("parse", "embed", self._parse, self.config.parse_workers),
+            self._stage("embed", "cluster", self._embed, self.config.embed_workers),
+            self._cluster_stage(),
+            self._stage("summarize", "upsert", self._summarize, self.config.summarize_workers),
+            self._upsert_stage(),
+        ]
+        tasks = [asyncio.ensure_future(stage) for stage in stages]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException as exc:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            service.fetcher.discard_feed_state(feed["url"] for feed in feeds)
+            if isinstance(exc, Exception):
+                monitoring_store.record_ingestion_failure(str(exc))
+            raise
+        finally:
+            self._report()
+
+        # A feed that failed after its download was staged must be downloaded again next run.
+        service.fetcher.discard_feed_state(self.failed_feeds)
+        service.fetcher.commit_feed_state(feed["url"] for feed in feeds)
+        if self.failed_feeds:
+            raise RuntimeError(f"{len(self.failed_feeds)} feeds failed: {', '.join(sorted(self.failed_feeds))}")
+        return list(self._published.values())
+
+    async def _feed_source(self, feeds: list[dict[str, str]]) -> None:
+        for feed in feeds:
+            await self._put("fetch", feed)
+        await self._put("fetch", _DONE)
+
+    async def _put(self, stage: str, item: object) -> None:
+        await self._queues[stage].put(item)
+        monitoring_store.set_gauge(f"ingest_stage_{stage}_queue_depth", self._queues[stage].qsize())
+
+    async def _get(self, stage: str) -> object:
+        item = await self._queues[stage].get()
+        monitoring_store.set_gauge(f"ingest_stage_{stage}_queue_depth", self._queues[stage].qsize())
+        return item
+
+    async def _stage(
+        self,
+        name: str,
+        downstream: str,
+        handler: Callable[[Any], Awaitable[list[Any]]],
+        workers: int,
+    ) -> None:
+        stats = self.stats[name]
+
+        async def worker() -> None:
+            while True:
+                item = await self._get(name)
+                if item is _DONE:
+                    await self._put(name, _DONE)
+                    return
+                started = time.perf_counter()
+                results = await handler(item)
+                stats.busy_seconds += time.perf_counter() - started
+                stats.items += 1
+                for result in results:
+                    await self._put(downstream, result)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, workers))))
+        await self._put(downstream, _DONE)
+
+    async def _fetch(self, feed: dict[str, str]) -> list[tuple[dict[str, str], bytes]]:
+        try:
+            body = await self.service.fetcher.download(feed["url"])
+        except Exception as exc:
+            self._fail(feed, "fetch", exc)
+            return []
+        return [] if body is None else [(feed, body)]
+
+    async def _parse(self, item: tuple[dict[str, str], bytes]) -> list[list[RawArticle]]:
+        feed, body = item
+        try:
+            articles = await self.service.fetcher.parse(feed, body)
+        except Exception as exc:
+            self._fail(feed, "parse", exc)
+            return []
+        return [articles] if articles else []
+
+    def _fail(self, feed: dict[str, str], stage: str, exc: Exception) -> None:
+        self.failed_feeds[feed["url"]] = str(exc)
+        monitoring_store.record_ingestion_failure(f"feed_{stage}_failed:{feed['url']}: {exc}")
+
+    async def _embed(self, articles: list[RawArticle]) -> list[tuple[list[RawArticle], list[list[float]]]]:
+        articles = self.service.drop_seen(articles)
+        if not articles:
+            return []
+        vectors = await asyncio.to_thread(lambda: [self.service.embed_article(article) for article in articles])
+        return [(articles, vectors)]
+
+    async def _cluster_stage(self) -> None:
+        stats = self.stats["cluster"]
+        batch_number = 0
+        done = False
+        while not done:
+            batch: list[tuple[list[RawArticle], list[list[float]]]] = []
+            size = 0
+            item = await self._get("cluster")
+            # Take whatever else is already queued, up to the batch size, without waiting.
+            while True:
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+                size += len(item[0])
+                if size >= self.config.cluster_batch_size or self._queues["cluster"].empty():
+                    break
+                item = self._queues["cluster"].get_nowait()
+            if not batch:
+                continue
+            started = time.perf_counter()
+            articles = [a for articles, _ in batch for a in articles]
+            events = self._cluster(articles, [v for _, vectors in batch for v in vectors])
+            stats.busy_seconds += time.perf_counter() - started
+            stats.items += len(batch)
+            if events:
+                batch_number += 1
+                texts = {a.link: f"{a.title} {a.description}" for a in articles}
+                await self._put("summarize", (batch_number, events, texts))
+        await self._put("summarize", _DONE)
+
+    def _cluster(self, articles: list[RawArticle], vectors: list[list[float]]) -> list[Event]:
+        events = self.service.resolve_batch(articles, vectors, pending=list(self._pending.values()))
+        for event in events:
+            self._pending[event.event_id] = event
+        return events
+
+    async def _summarize(self, item: tuple[int, list[Event], dict[str, str]]) -> list[tuple[int, list[Event]]]:
+        service = self.service
+        batch_number, events, article_texts = item
+        if service.summary_scheduler is not None:
+            # Each batch is one scheduler cycle. Deferred events are published as placeholders
+            # and summarized in a later batch or run.
+            released = await service.summary_scheduler.run_cycle(events, article_texts=article_texts)
+            events = list({event.event_id: event for event in [*events, *released]}.values())
+        else:
+            summaries = await service.summary_service.summarize_many(events)
+            for event, summary in zip(events, summaries):
+                apply_summary(event, summary)
+        return [(batch_number, events)] if events else []
+
+    async def _upsert_stage(self) -> None:
+        stats = self.stats["upsert"]
+        service = self.service
+        while True:
+            item = await self._get("upsert")
+            if item is _DONE:
+                return
+            started = time.perf_counter()
+            batch_number, events = item
+            events = [e for e in events if self._published_batch.get(e.event_id, 0) <= batch_number]
+            service.repository.upsert_events(events)
+            if service.seen_index is not None:
+                service.seen_index.mark_seen(link.url for event in events for link in event.source_links)
+            for event in events:
+                self._published[event.event_id] = event
+                self._published_batch[event.event_id] = batch_number
+            stats.busy_seconds += time.perf_counter() - started
+            stats.items += 1
+            monitoring_store.increment_counter("ingest_events_published", len(events))
+
+    def _report(self) -> None:
+        elapsed = max(time.perf_counter() - self._started, 1e-9)
+        for name, stats in self.stats.items():
+            monitoring_store.increment_counter(f"ingest_stage_{name}_items", stats.items)
+            monitoring_store.set_gauge(f"ingest_stage_{name}_items_per_second", round(stats.items / elapsed, 2))
+            monitoring_store.set_gauge(f"ingest_stage_{name}_busy_ratio", round(stats.busy_seconds / elapsed, 4))
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import random
+import time
+from typing import Callable
+
+from ai_news_publisher.config import settings
+from ai_news_publisher.domain.models import Event
+from ai_news_publisher.monitoring import logger, monitoring_store
+from ai_news_publisher.services.ingestion import IngestionService
+from ai_news_publisher.services.retention import RetentionService
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    initial_interval_seconds: float = settings.poll_initial_interval_seconds
+    min_interval_seconds: float = settings.poll_min_interval_seconds
+    max_interval_seconds: float = settings.poll_max_interval_seconds
+    max_backoff_seconds: float = settings.poll_max_backoff_seconds
+    jitter: float = settings.poll_jitter
+    # Aim for this many new items per poll; weight of the latest poll in the publish-rate average.
+    target_items_per_poll: float = 1.0
+    rate_smoothing: float = 0.3
+
+
+@dataclass
+class FeedSchedule:
+    feed: dict[str, str]
+    interval_seconds: float
+    next_due: float
+    last_polled: float | None = None
+    items_per_second: float | None = None
+    consecutive_failures: int = 0
+    lag_seconds: float = 0.0
+
+    @property
+    def url(self) -> str:
+        return self.feed["url"]
+
+
+@dataclass
+class IngestionScheduler:
+    """Polls each feed on its own interval and runs ``IngestionService`` on the feeds that are due.
+
+    A feed's interval follows a smoothed estimate of how many new items it publishes per
+    second, so busy wires are polled often and daily feeds rarely. Failing feeds back off
+    exponentially. Every poll time gets random jitter so feeds do not synchronize.
+    ``run_forever`` also applies ``retention``, when set, between cycles.
+    """
+
+    ingestion_service: IngestionService
+    feeds: list[dict[str, str]]
+    policy: PollingPolicy = field(default_factory=PollingPolicy)
+    clock: Callable[[], float] = time.time
+    rng: random.Random = field(default_factory=random.Random)
+    retention: RetentionService | None = None
+    schedules: dict[str, FeedSchedule] = field(init=False)
+
+    def __post_init__(self) -> None:
+        now = self.clock()
+        self.schedules = {
+            feed["url"]: FeedSchedule(
+                feed=feed,
+                interval_seconds=float(feed.get("poll_interval_seconds", self.policy.initial_interval_seconds)),
+                # Spread the first polls over a short window instead of firing every feed at once.
+                next_due=now + self.rng.uniform(0, self.policy.jitter * self.policy.min_interval_seconds),
+            )
+            for feed in self.feeds
+        }
+
+    def due(self, now: float | None = None) -> list[FeedSchedule]:
+        now = self.clock() if now is None else now
+        return sorted((s for s in self.schedules.values() if s.next_due <= now), key=lambda s: s.next_due)
+
+    async def run_once(self) -> list[Event]:
+        """Ingest every due feed; feeds are isolated from each other's failures."""
+
+        started = self.clock()
+        due = self.due(started)
+        if not due:
+            return []
+        for schedule in due:
+            schedule.lag_seconds = started - schedule.next_due
+        try:
+            events = await self.ingestion_service.ingest([s.feed for s in due])
+            failed: set[str] = set()
+        except Exception:
+            if len(due) == 1:
+                events, failed = [], {due[0].url}
+            else:
+                # One bad feed fails the whole batch; retry one by one to find it.
+                events, failed = await self._ingest_individually(due)
+        now = self.clock()
+        new_articles = self.ingestion_service.last_run_new_articles
+        for schedule in due:
+            if schedule.url in failed:
+                self._record_failure(schedule, now)
+            else:
+                self._record_success(schedule, new_articles.get(schedule.url, 0), now)
+        return events
+
+    async def _ingest_individually(self, due: list[FeedSchedule]) -> tuple[list[Event], set[str]]:
+        events: list[Event] = []
+        failed: set[str] = set()
+        counts: Counter[str] = Counter()
+        for schedule in due:
+            try:
+                events.extend(await self.ingestion_service.ingest([schedule.feed]))
+            except Exception:
+                failed.add(schedule.url)
+                continue
+            counts += self.ingestion_service.last_run_new_articles
+        self.ingestion_service.last_run_new_articles = counts
+        return events, failed
+
+    def _record_success(self, schedule: FeedSchedule, new_items: int, now: float) -> None:
+        if schedule.last_polled is None:
+            # The first poll returns the feed's whole backlog, which says nothing about its pace.
+            schedule.last_polled = now
+            schedule.consecutive_failures = 0
+            self._schedule_next(schedule, schedule.interval_seconds, now)
+            return
+        observed = new_items / max(now - schedule.last_polled, 1.0)
+        if schedule.items_per_second is None:
+            schedule.items_per_second = observed
+        else:
+            alpha = self.policy.rate_smoothing
+            schedule.items_per_second = alpha * observed + (1 - alpha) * schedule.items_per_second
+        if schedule.items_per_second > 0:
+            interval = self.policy.target_items_per_poll / schedule.items_per_second
+        else:
+            interval = schedule.interval_seconds * 2
+        schedule.interval_seconds = min(
+            self.policy.max_interval_seconds, max(self.policy.min_interval_seconds, interval)
+        )
+        schedule.consecutive_failures = 0
+        schedule.last_polled = now
+        self._schedule_next(schedule, schedule.interval_seconds, now)
+
+    def _record_failure(self, schedule: FeedSchedule, now: float) -> None:
+        schedule.consecutive_failures += 1
+        monitoring_store.increment_counter("feed_poll_failures")
+        logger.warning("Feed poll failed (%s in a row): %s", schedule.consecutive_failures, schedule.url)
+        backoff = self.policy.min_interval_seconds * 2 ** schedule.consecutive_failures
+        self._schedule_next(schedule, min(self.policy.max_backoff_seconds, backoff), now)
+
+    def _schedule_next(self, schedule: FeedSchedule, delay: float, now: float) -> None:
+        jitter = self.policy.jitter
+        schedule.next_due = now + delay * self.rng.uniform(1 - jitter, 1 + jitter)
+        monitoring_store.record_feed_schedule(
+            schedule.url,
+            interval_seconds=schedule.interval_seconds,
+            lag_seconds=schedule.lag_seconds,
+            consecutive_failures=schedule.consecutive_failures,
+            next_poll_at=datetime.fromtimestamp(schedule.next_due, tz=timezone.utc),
+        )
+
+    def lag_report(self, now: float | None = None) -> dict[str, dict[str, float | int | None]]:
+        """Per-feed polling state; ``overdue_seconds`` > 0 means the daemon is falling behind."""
+
+        now = self.clock() if now is None else now
+        return {
+            url: {
+                "interval_seconds": round(s.interval_seconds, 1),
+                "last_lag_seconds": round(s.lag_seconds, 1),
+                "overdue_seconds": round(max(0.0, now - s.next_due), 1),
+                "seconds_since_poll": round(now - s.last_polled, 1) if s.last_polled is not None else None,
+                "consecutive_failures": s.consecutive_failures,
+            }
+            for url, s in self.schedules.items()
+        }
+
+    async def run_forever(self, stop: asyncio.Event | None = None, max_sleep_seconds: float = 30.0) -> None:
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                await self.run_once()
+            except Exception as exc:
+                logger.error("Ingestion cycle failed: %s", exc)
+            if self.retention is not None:
+                try:
+                    await asyncio.to_thread(self.retention.run_once)
+                except Exception as exc:
+                    monitoring_store.increment_counter("retention_failures")
+                    logger.error("Retention run failed: %s", exc)
+            next_due = min((s.next_due for s in self.schedules.values()), default=self.clock() + max_sleep_seconds)
+            sleep_for = min(max_sleep_seconds, max(0.0, next_due - self.clock()))
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=sleep_for)
+            except asyncio.TimeoutError:
+                pass
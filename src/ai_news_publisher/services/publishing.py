@@ -1,21 +1,91 @@
 from __future__ import annotations
 
-from ai_news_publisher.infrastructure.repository import EventRepository
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+import json
+
+from ai_news_publisher.domain.models import Event
+from ai_news_publisher.infrastructure.repository import EventCursor, EventRepository
+
+
+@dataclass(frozen=True)
+class EventPage:
+    events: list[Event]
+    next_cursor: str | None
+
+
+def encode_cursor(event: Event) -> str:
+    raw = json.dumps([event.occurred_at.isoformat(), event.event_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> EventCursor:
+    """Inverse of ``encode_cursor``; raises ValueError for anything it did not produce."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        occurred_at, event_id = json.loads(raw)
+        if not isinstance(occurred_at, str) or not isinstance(event_id, str):
+            raise TypeError("cursor fields must be strings")
+        before = datetime.fromisoformat(occurred_at)
+        if before.utcoffset() is None:
+            # Stored timestamps are timezone-aware and cannot be compared with a naive one.
+            raise ValueError("cursor timestamp has no timezone")
+        return before, event_id
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
 
 
 class PublishingService:
     def __init__(self, repository: EventRepository) -> None:
         self.repository = repository
 
-    def list_events(self, category: str | None = None, country: str | None = None, city: str | None = None) -> list:
-        events = self.repository.list_events()
-        if category:
-            events = [e for e in events if e.category.lower() == category.lower()]
-        if country:
-            events = [e for e in events if e.country.lower() == country.lower()]
-        if city:
-            events = [e for e in events if e.city.lower() == city.lower()]
-        return events
+    def list_events(
+        self,
+        category: str | None = None,
+        country: str | None = None,
+        city: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> list:
+        return self.repository.list_events(
+            category=category,
+            country=country,
+            city=city,
+            limit=limit,
+            before=decode_cursor(cursor) if cursor else None,
+        )
+
+    def list_events_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        category: str | None = None,
+        country: str | None = None,
+        city: str | None = None,
+    ) -> EventPage:
+        """One page of events newest first; ``next_cursor`` is None on the last page."""
+
+        # One extra row tells whether another page exists without a count query.
+        events = self.list_events(category=category, country=country, city=city, limit=limit + 1, cursor=cursor)
+        if len(events) <= limit:
+            return EventPage(events=events, next_cursor=None)
+        page = events[:limit]
+        return EventPage(events=page, next_cursor=encode_cursor(page[-1]))
 
     def get_event(self, slug: str):
         return self.repository.get_by_slug(slug)
+
+    def related_events(self, slug: str, k: int) -> list[tuple[Event, float]]:
+        return self.repository.related_events(slug, k)
+
+    def search_events(
+        self,
+        query: str,
+        category: str | None = None,
+        country: str | None = None,
+        city: str | None = None,
+        limit: int = 20,
+    ) -> list[tuple[Event, float]]:
+        return self.repository.search_events(query, category=category, country=country, city=city, limit=limit)
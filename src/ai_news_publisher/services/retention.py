@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from ai_news_publisher.config import settings
+from ai_news_publisher.domain.models import Event, utc_now
+from ai_news_publisher.infrastructure.repository import EventRepository, SQLiteEventRepository
+from ai_news_publisher.monitoring import logger, monitoring_store
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    # Events older than the horizon are dropped; 0 keeps everything.
+    horizon_hours: float = settings.retention_horizon_hours
+    bucket_hours: float = settings.retention_bucket_hours
+
+
+@dataclass
+class RetentionService:
+    """Drops events older than the retention horizon, a whole time bucket at a time.
+
+    Buckets are ``bucket_hours`` wide and aligned to the epoch. The cutoff only moves
+    when the oldest retained bucket falls entirely past the horizon. Every run evicts
+    all events older than the cutoff, so events that arrive late with an old
+    ``occurred_at`` go on the next run. The time indexes lose a contiguous range, but the
+    slug maps, similarity index and search index drop evicted events one by one, so
+    a run costs time proportional to the events it removes.
+    When ``archive`` is set, evicted events are written there before they are dropped.
+    """
+
+    repository: EventRepository
+    policy: RetentionPolicy = field(default_factory=RetentionPolicy)
+    archive: EventRepository | None = None
+    clock: Callable[[], datetime] = utc_now
+
+    def cutoff(self, now: datetime | None = None) -> datetime | None:
+        """Start of the oldest bucket still inside the horizon, or None without a horizon."""
+
+        if self.policy.horizon_hours <= 0:
+            return None
+        bucket = timedelta(hours=self.policy.bucket_hours)
+        edge = (now or self.clock()) - timedelta(hours=self.policy.horizon_hours)
+        return _EPOCH + ((edge - _EPOCH) // bucket) * bucket
+
+    def run_once(self) -> int:
+        """Evict every bucket past the horizon; returns the number of events removed."""
+
+        cutoff = self.cutoff()
+        if cutoff is None:
+            return 0
+        archive = self._archive if self.archive is not None else None
+        evicted = self.repository.evict_before(cutoff, archive=archive)
+        monitoring_store.increment_counter("retention_evicted_events", evicted)
+        monitoring_store.set_gauge("retention_cutoff_timestamp", cutoff.timestamp())
+        if evicted:
+            logger.info("Retention evicted %s events older than %s", evicted, cutoff.isoformat())
+        return evicted
+
+    def _archive(self, events: list[Event]) -> None:
+        self.archive.upsert_events(events)
+        monitoring_store.increment_counter("retention_archived_events", len(events))
+
+    async def run_forever(self, interval_seconds: float = 60.0) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as exc:
+                monitoring_store.increment_counter("retention_failures")
+                logger.error("Retention run failed: %s", exc)
+            await asyncio.sleep(interval_seconds)
+
+
+def build_retention_service(repository: EventRepository) -> RetentionService | None:
+    """A retention service per ``RETENTION_*`` settings, or None when retention is off."""
+
+    policy = RetentionPolicy()
+    if policy.horizon_hours <= 0:
+        return None
+    archive = SQLiteEventRepository(settings.retention_archive_path) if settings.retention_archive_path else None
+    return RetentionService(repository, policy, archive=archive)
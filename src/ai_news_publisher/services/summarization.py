@@ -1,16 +1,84 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from typing import Protocol
+import inspect
+from threading import Lock
+import time
+from typing import Any, Protocol
 
 from ai_news_publisher.domain.models import Event
+from ai_news_publisher.infrastructure.summary_cache import InMemorySummaryCache, SummaryCache, event_fingerprint
 from ai_news_publisher.monitoring import monitoring_store
 
+REQUIRED_SUMMARY_FIELDS = {"what_happened", "where_when", "why_it_matters", "what_next", "status", "bias_indicator"}
+# Status of an event stored before its summary is written; see apply_pending_summary.
+PENDING_SUMMARY_STATUS = "Summary pending"
+
 
 class AIClient(Protocol):
+    """Single-event summarizer.
+
+    Clients may also provide ``summarize_events(events) -> list[dict[str, str]]`` to
+    summarize several events per request; either method may be sync or async.
+    """
+
     def summarize_event(self, event: Event) -> dict[str, str]: ...
 
 
+@dataclass(frozen=True)
+class SummaryLimits:
+    max_concurrency: int = 8
+    batch_size: int = 16
+    requests_per_second: float | None = None
+    tokens_per_minute: int | None = None
+
+
+class RateLimiter:
+    """Reservation-based limiter for requests/sec and tokens/min.
+
+    Each ``acquire`` reserves capacity immediately and sleeps until its slot, so callers
+    are admitted in order without holding a lock across the wait.
+    """
+
+    def __init__(self, requests_per_second: float | None = None, tokens_per_minute: int | None = None) -> None:
+        self.requests_per_second = requests_per_second
+        self.tokens_per_minute = tokens_per_minute
+        self._lock = Lock()
+        self._next_request_at = 0.0
+        self._token_level = float(tokens_per_minute or 0)
+        self._token_updated_at = time.monotonic()
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            if self.requests_per_second:
+                slot = max(now, self._next_request_at)
+                self._next_request_at = slot + 1.0 / self.requests_per_second
+                delay = slot - now
+            if self.tokens_per_minute:
+                rate = self.tokens_per_minute / 60.0
+                elapsed = now - self._token_updated_at
+                self._token_level = min(float(self.tokens_per_minute), self._token_level + elapsed * rate) - tokens
+                self._token_updated_at = now
+                if self._token_level < 0:
+                    delay = max(delay, -self._token_level / rate)
+            return delay
+
+    async def acquire(self, tokens: int = 0) -> None:
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def debit(self, tokens: int) -> None:
+        """Charge tokens discovered after a call (actual minus reserved usage)."""
+
+        if self.tokens_per_minute and tokens:
+            with self._lock:
+                self._token_level -= tokens
+
+
 @dataclass
 class TemplateAIClient:
     model_name: str = "template-v1"
@@ -28,9 +96,21 @@ class TemplateAIClient:
 
 
 class SummaryService:
-    def __init__(self, client: AIClient | None = None) -> None:
+    # Budgeted per event before the call; corrected with the real estimate afterwards.
+    RESERVED_TOKENS_PER_EVENT = 160
+
+    def __init__(
+        self,
+        client: AIClient | None = None,
+        limits: SummaryLimits | None = None,
+        cache: SummaryCache | None = None,
+    ) -> None:
         self.client = client or TemplateAIClient()
-        self._cache: dict[str, dict[str, str]] = {}
+        self.limits = limits or SummaryLimits()
+        self.rate_limiter = RateLimiter(self.limits.requests_per_second, self.limits.tokens_per_minute)
+        # Keyed by event_fingerprint, so restarts (with a persistent cache) and small
+        # cluster changes reuse an existing summary instead of paying for a new call.
+        self.cache = cache if cache is not None else InMemorySummaryCache()
 
     @staticmethod
     def _estimate_tokens(summary: dict[str, str]) -> tuple[int, int]:
@@ -44,12 +124,68 @@ class SummaryService:
         return round(prompt_tokens * 0.0000002 + completion_tokens * 0.0000006, 6)
 
     def summarize(self, event: Event) -> dict[str, str]:
-        if event.event_id in self._cache:
-            return self._cache[event.event_id]
+        key = event_fingerprint(event)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
 
         payload = self.client.summarize_event(event)
-        required = {"what_happened", "where_when", "why_it_matters", "what_next", "status", "bias_indicator"}
-        missing = required - set(payload)
+        self._accept(key, payload)
+        return payload
+
+    def forget(self, event: Event) -> None:
+        """Drop the cached summary of ``event``, e.g. once new articles are merged into it."""
+
+        self.cache.delete(event_fingerprint(event))
+
+    async def summarize_many(self, events: list[Event]) -> list[dict[str, str]]:
+        """Summarize events concurrently under the configured concurrency and rate limits.
+
+        Uses the client's ``summarize_events`` batch method when available. Results are
+        returned in input order; cached or duplicate fingerprints never reach the client.
+        """
+
+        keys = [event_fingerprint(event) for event in events]
+        results: dict[str, dict[str, str]] = {}
+        pending: dict[str, Event] = {}
+        for key, event in zip(keys, events):
+            if key in results or key in pending:
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = event
+        if pending:
+            batch_method = getattr(self.client, "summarize_events", None)
+            size = max(1, self.limits.batch_size) if batch_method is not None else 1
+            todo = list(pending.items())
+            chunks = [todo[i : i + size] for i in range(0, len(todo), size)]
+            semaphore = asyncio.Semaphore(max(1, self.limits.max_concurrency))
+
+            async def run(chunk: list[tuple[str, Event]]) -> None:
+                async with semaphore:
+                    reserved = self.RESERVED_TOKENS_PER_EVENT * len(chunk)
+                    await self.rate_limiter.acquire(reserved)
+                    if batch_method is not None:
+                        payloads = await _call(batch_method, [event for _, event in chunk])
+                        if len(payloads) != len(chunk):
+                            raise ValueError(f"Batch summary returned {len(payloads)} payloads for {len(chunk)} events")
+                    else:
+                        payloads = [await _call(self.client.summarize_event, chunk[0][1])]
+                    used = 0
+                    for (key, _), payload in zip(chunk, payloads):
+                        used += sum(self._accept(key, payload))
+                        results[key] = payload
+                    self.rate_limiter.debit(used - reserved)
+
+            await asyncio.gather(*(run(chunk) for chunk in chunks))
+        return [results[key] for key in keys]
+
+    def _accept(self, key: str, payload: dict[str, str]) -> tuple[int, int]:
+        """Validate, account for and cache one summary payload."""
+
+        missing = REQUIRED_SUMMARY_FIELDS - set(payload)
         if missing:
             raise ValueError(f"Summary payload missing fields: {sorted(missing)}")
 
@@ -62,5 +198,36 @@ class SummaryService:
             estimated_cost_usd=self._estimate_cost_usd(prompt_tokens, completion_tokens),
         )
 
-        self._cache[event.event_id] = payload
-        return payload
+        self.cache.put(key, payload)
+        return prompt_tokens, completion_tokens
+
+
+def apply_summary(event: Event, summary: dict[str, str]) -> None:
+    event.summary = {
+        "what_happened": summary["what_happened"],
+        "where_when": summary["where_when"],
+        "why_it_matters": summary["why_it_matters"],
+        "what_next": summary["what_next"],
+    }
+    event.status = summary["status"]
+    event.bias_indicator = summary["bias_indicator"]
+
+
+def apply_pending_summary(event: Event) -> None:
+    """Give an unsummarized event a stand-in summary, so it can be stored and served meanwhile."""
+
+    event.summary = {
+        "what_happened": f"{event.source_count} sources report a {event.category} event. A summary is pending.",
+        "where_when": f"Reported around {event.city}, {event.country} at {event.occurred_at.isoformat()}.",
+        "why_it_matters": "Not assessed yet; see the source links.",
+        "what_next": "A summary will follow once the event is processed.",
+    }
+    event.status = PENDING_SUMMARY_STATUS
+
+
+async def _call(method: Any, argument: Any) -> Any:
+    """Await async client methods; run blocking ones on a worker thread."""
+
+    if inspect.iscoroutinefunction(method):
+        return await method(argument)
+    return await asyncio.to_thread(method, argument)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+import math
+from typing import Mapping
+
+from ai_news_publisher.domain.models import Event, utc_now
+from ai_news_publisher.infrastructure.summary_cache import event_fingerprint
+from ai_news_publisher.monitoring import monitoring_store
+from ai_news_publisher.services.summarization import SummaryService, apply_summary
+
+
+@dataclass(frozen=True)
+class SummaryBudget:
+    max_tokens_per_cycle: int | None = None
+    max_cost_usd_per_cycle: float | None = None
+    max_pending: int = 10000
+    recency_half_life_hours: float = 24.0
+
+
+class SummaryScheduler:
+    """Summarizes the most valuable pending events within a per-cycle token and cost budget.
+
+    Events that do not fit stay queued with their placeholder summary and compete again
+    in the next cycle; callers store them meanwhile so later articles can merge into them,
+    and ``restore`` them after a restart.
+    A newer version of a queued event (same ``event_id``) takes its place without losing
+    links. Already-cached summaries cost nothing and are always released. An event that
+    alone exceeds the budget is summarized by itself once nothing else fits the cycle.
+    """
+
+    # Prompt tokens assumed for a source article whose text was not handed over.
+    TOKENS_PER_UNKNOWN_ARTICLE = 40
+
+    def __init__(self, summary_service: SummaryService, budget: SummaryBudget | None = None) -> None:
+        self.summary_service = summary_service
+        self.budget = budget or SummaryBudget()
+        self._pending: dict[str, Event] = {}
+        self._article_texts: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def restore(self, events: list[Event]) -> None:
+        """Queue stored placeholder events again, e.g. the pending summaries of a previous process."""
+
+        for event in events:
+            self._queue(event)
+        monitoring_store.set_gauge("summary_queue_depth", len(self._pending))
+
+    def value(self, event: Event, now: datetime) -> float:
+        age_hours = max(0.0, (now - event.occurred_at).total_seconds() / 3600)
+        recency = 0.5 ** (age_hours / self.budget.recency_half_life_hours)
+        return event.confidence * (1 + math.log1p(event.source_diversity)) * recency
+
+    def estimate(self, event: Event) -> tuple[int, float]:
+        """Expected (tokens, USD) for summarizing ``event``; zero when the summary is cached.
+
+        The prompt carries every source article, so its size follows their titles and
+        descriptions rather than the (still empty) summary.
+        """
+
+        if self.summary_service.cache.get(event_fingerprint(event)) is not None:
+            return 0, 0.0
+        prompt_tokens, completion_tokens = self.summary_service._estimate_tokens({})
+        for link in event.source_links:
+            words = len(self._article_texts.get(link.url, "").split())
+            prompt_tokens += words or self.TOKENS_PER_UNKNOWN_ARTICLE
+        return (
+            prompt_tokens + completion_tokens,
+            self.summary_service._estimate_cost_usd(prompt_tokens, completion_tokens),
+        )
+
+    def _queue(self, event: Event) -> None:
+        queued = self._pending.get(event.event_id)
+        if queued is not None and queued is not event:
+            known = {link.url for link in event.source_links}
+            missing = [link for link in queued.source_links if link.url not in known]
+            if missing and known <= {link.url for link in queued.source_links}:
+                # Concurrent cycles can hand over an older version after a newer one.
+                return
+            if missing:
+                links = event.source_links + missing
+                event = replace(
+                    event,
+                    source_links=links,
+                    source_count=len(links),
+                    source_diversity=len({link.source_name for link in links}),
+                )
+        self._pending[event.event_id] = event
+
+    def _forget(self, event: Event) -> None:
+        # A concurrent cycle may have queued a newer version while this one was summarizing.
+        if self._pending.get(event.event_id) is not event:
+            return
+        del self._pending[event.event_id]
+        for link in event.source_links:
+            self._article_texts.pop(link.url, None)
+
+    async def run_cycle(
+        self,
+        events: list[Event],
+        now: datetime | None = None,
+        article_texts: Mapping[str, str] | None = None,
+    ) -> list[Event]:
+        """Queue ``events`` and return the ones summarized this cycle, most valuable first.
+
+        ``article_texts`` maps source links to their article text for cost estimates.
+        """
+
+        now = now or utc_now()
+        if article_texts:
+            self._article_texts.update(article_texts)
+        for event in events:
+            self._queue(event)
+
+        ranked = sorted(self._pending.values(), key=lambda e: self.value(e, now), reverse=True)
+        selected: list[Event] = []
+        tokens_spent, cost_spent = 0, 0.0
+        for event in ranked:
+            tokens, cost = self.estimate(event)
+            if self.budget.max_tokens_per_cycle is not None and tokens_spent + tokens > self.budget.max_tokens_per_cycle:
+                continue
+            if self.budget.max_cost_usd_per_cycle is not None and cost_spent + cost > self.budget.max_cost_usd_per_cycle:
+                continue
+            tokens_spent += tokens
+            cost_spent += cost
+            selected.append(event)
+        if not selected and ranked:
+            # Nothing fits, so each event alone exceeds the budget; never summarizing it would starve it.
+            selected.append(ranked[0])
+            tokens_spent, cost_spent = self.estimate(ranked[0])
+
+        summaries = await self.summary_service.summarize_many(selected)
+        for event, summary in zip(selected, summaries):
+            apply_summary(event, summary)
+            self._forget(event)
+
+        # Past max_pending the least valuable deferred events are dropped.
+        overflow = [e for e in ranked if e.event_id in self._pending][self.budget.max_pending :]
+        for event in overflow:
+            self._forget(event)
+        dropped = len(overflow)
+
+        monitoring_store.increment_counter("summaries_deferred", len(ranked) - len(selected) - dropped)
+        if dropped:
+            monitoring_store.increment_counter("summaries_dropped", dropped)
+        monitoring_store.set_gauge("summary_queue_depth", len(self._pending))
+        monitoring_store.set_gauge("summary_cycle_tokens", tokens_spent)
+        monitoring_store.set_gauge("summary_cycle_cost_usd", round(cost_spent, 6))
+        return selected
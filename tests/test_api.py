@@ -1,4 +1,7 @@
+import asyncio
+import base64
 from datetime import datetime, timezone
+import json
 
 import pytest
 
@@ -7,6 +10,11 @@ from fastapi.testclient import TestClient
 
 from ai_news_publisher.api.app import app, repository
 from ai_news_publisher.domain.models import Event, SourceLink
+from ai_news_publisher.infrastructure.embeddings import DeterministicEmbedder
+from ai_news_publisher.infrastructure.rss import RawArticle, RSSFetcher
+from ai_news_publisher.services.ingestion import IngestionService
+from ai_news_publisher.services.summarization import PENDING_SUMMARY_STATUS, SummaryService
+from ai_news_publisher.services.summary_scheduler import SummaryBudget, SummaryScheduler
 
 
 client = TestClient(app)
@@ -41,6 +49,26 @@ def test_list_events_with_filters_and_cache_header():
     body = response.json()
     assert len(body["events"]) == 1
     assert "ai_generated_notice" in body["events"][0]
+    assert body["next_cursor"] is None
+
+
+def test_list_events_rejects_malformed_cursor():
+    response = client.get("/api/events?cursor=%%%")
+    assert response.status_code == 400
+
+
+def _cursor(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode("utf-8")).decode("ascii")
+
+
+def test_list_events_rejects_naive_datetime_cursor():
+    response = client.get("/api/events", params={"cursor": _cursor(["2026-01-01T00:00:00", "x"])})
+    assert response.status_code == 400
+
+
+def test_list_events_rejects_cursor_with_non_string_event_id():
+    response = client.get("/api/events", params={"cursor": _cursor(["2026-01-01T00:00:00+00:00", 7])})
+    assert response.status_code == 400
 
 
 def test_event_detail_never_exposes_raw_content_and_has_seo():
@@ -52,6 +80,81 @@ def test_event_detail_never_exposes_raw_content_and_has_seo():
     assert payload["seo"]["json_ld"]["@type"] == "NewsArticle"
 
 
+def test_event_detail_serves_events_whose_summary_was_deferred():
+    class ListFetcher(RSSFetcher):
+        async def fetch_many(self, feeds):
+            published = datetime(2025, 6, 1, tzinfo=timezone.utc)
+            return [
+                RawArticle("A", "Dam opens", "https://a.com/dam", "hydro dam opens", published, "BR", "Manaus", "energy"),
+                RawArticle("B", "Port strike", "https://b.com/port", "dockers walk out", published, "BR", "Santos", "labor"),
+            ]
+
+    summary_service = SummaryService()
+    service = IngestionService(
+        repository=repository,
+        fetcher=ListFetcher(),
+        summary_service=summary_service,
+        embedder=DeterministicEmbedder(16),
+        summary_scheduler=SummaryScheduler(summary_service, SummaryBudget(max_tokens_per_cycle=1)),
+    )
+    asyncio.run(service.ingest([{"url": "unused"}]))
+    try:
+        deferred = repository.list_events_with_status(PENDING_SUMMARY_STATUS)
+        assert len(deferred) == 1
+
+        response = client.get(f"/api/events/{deferred[0].slug}")
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["status"] == PENDING_SUMMARY_STATUS
+        assert payload["seo"]["description"] == deferred[0].summary["what_happened"]
+    finally:
+        # Keep the shared repository as the other tests expect it.
+        repository.evict_before(datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+
+def test_related_events_endpoint_ranks_by_embedding():
+    published = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    repository.upsert_events([
+        Event(
+            event_id="evt3",
+            slug="chip-follow-up",
+            title="Chip Follow-up",
+            category="world",
+            country="GB",
+            city="London",
+            occurred_at=published,
+            confidence=0.8,
+            source_diversity=1,
+            source_count=1,
+            embedding=[0.1] * 15 + [0.2],
+            source_links=[SourceLink("B", "https://b.com/1", published)],
+            summary={"what_happened": "Follow-up"},
+            status="Developing",
+            bias_indicator="low",
+        )
+    ])
+
+    response = client.get("/api/events/chip-event/related?k=3")
+    assert response.status_code == 200
+    related = response.json()["related"]
+    assert [item["slug"] for item in related] == ["chip-follow-up"]
+    assert 0.9 < related[0]["score"] <= 1.0
+
+    assert client.get("/api/events/missing/related").status_code == 404
+    assert client.get("/api/events/chip-event/related?k=0").status_code == 422
+
+
+def test_search_endpoint_matches_titles_summaries_and_prefixes():
+    response = client.get("/api/search?q=chi&country=us")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert [item["slug"] for item in response.json()["results"]] == ["chip-event"]
+
+    assert client.get("/api/search?q=impact").json()["results"][0]["slug"] == "chip-event"
+    assert client.get("/api/search?q=chip&city=Paris").json()["results"] == []
+    assert client.get("/api/search?q=").status_code == 422
+
+
 def test_local_impact_endpoint():
     response = client.get("/api/events/chip-event/local-impact?country=US&city=Austin")
     assert response.status_code == 200
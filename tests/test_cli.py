@@ -1,5 +1,7 @@
+from dataclasses import replace
 from pathlib import Path
 
+from ai_news_publisher import cli
 from ai_news_publisher.cli import run
 
 
@@ -68,3 +70,24 @@ def test_cli_run_handles_invalid_item_data(tmp_path: Path, capsys) -> None:
 
     assert code == 1
     assert "Invalid news item data" in capsys.readouterr().err
+
+
+def test_cli_schedule_rejects_feeds_without_url(tmp_path: Path, capsys) -> None:
+    feeds_path = tmp_path / "feeds.json"
+    feeds_path.write_text('[{"source_name": "Wire"}]', encoding="utf-8")
+
+    code = run(["schedule", str(feeds_path), "--once"])
+
+    assert code == 1
+    assert "list of objects with a 'url'" in capsys.readouterr().err
+
+
+def test_cli_schedule_requires_persistent_event_store(tmp_path: Path, capsys, monkeypatch) -> None:
+    feeds_path = tmp_path / "feeds.json"
+    feeds_path.write_text('[{"url": "https://wire/rss"}]', encoding="utf-8")
+    monkeypatch.setattr(cli, "settings", replace(cli.settings, events_db_path=None))
+
+    code = run(["schedule", str(feeds_path)])
+
+    assert code == 1
+    assert "EVENTS_DB_PATH must be set" in capsys.readouterr().err
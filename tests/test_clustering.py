@@ -0,0 +1,115 @@
+from concurrent.futures import ProcessPoolExecutor
+import random
+
+import pytest
+
+from ai_news_publisher.domain.models import average
+from ai_news_publisher.infrastructure import vector_index
+from ai_news_publisher.infrastructure.embeddings import cosine_similarity
+from ai_news_publisher.infrastructure.vector_index import build_centroid_index, numpy_available
+from ai_news_publisher.services.clustering import IncrementalClusterer, cluster_in_parallel
+
+
+def _synthetic_vectors(count: int, stories: int, seed: int = 7) -> list[list[float]]:
+    rng = random.Random(seed)
+    centers = [[rng.gauss(0, 1) for _ in range(16)] for _ in range(stories)]
+    return [[value + rng.gauss(0, 0.25) for value in rng.choice(centers)] for _ in range(count)]
+
+
+def _reference_assignments(vectors: list[list[float]], threshold: float) -> list[int]:
+    clusters: list[list[list[float]]] = []
+    centroids: list[list[float]] = []
+    assignments = []
+    for vector in vectors:
+        best_idx, best_score = -1, -1.0
+        for idx, centroid in enumerate(centroids):
+            score = cosine_similarity(vector, centroid)
+            if score > best_score:
+                best_score, best_idx = score, idx
+        if best_score >= threshold and best_idx >= 0:
+            clusters[best_idx].append(vector)
+            centroids[best_idx] = average(clusters[best_idx])
+            assignments.append(best_idx)
+        else:
+            clusters.append([vector])
+            centroids.append(vector)
+            assignments.append(len(clusters) - 1)
+    return assignments
+
+
+def test_python_clusterer_matches_reference_greedy_logic():
+    vectors = _synthetic_vectors(300, 20)
+    clusterer = IncrementalClusterer(0.8, backend="python")
+
+    assert clusterer.add_many(vectors) == _reference_assignments(vectors, 0.8)
+    assert len(clusterer) == len(set(_reference_assignments(vectors, 0.8)))
+
+
+def test_numpy_clusterer_matches_python_assignments_in_blocks():
+    pytest.importorskip("numpy")
+    vectors = _synthetic_vectors(500, 30)
+
+    python_clusterer = IncrementalClusterer(0.8, backend="python")
+    numpy_clusterer = IncrementalClusterer(0.8, backend="numpy", block_size=64, block_min_dimensions=0)
+
+    assert numpy_clusterer.add_many(vectors) == python_clusterer.add_many(vectors)
+    assert numpy_clusterer.members == python_clusterer.members
+
+
+def test_auto_backend_falls_back_without_numpy(monkeypatch):
+    monkeypatch.setattr(vector_index, "np", None)
+    vectors = _synthetic_vectors(100, 10)
+
+    assert not numpy_available()
+    assert build_centroid_index("auto").backend == "python"
+    assert IncrementalClusterer(0.8, backend="auto").add_many(vectors) == _reference_assignments(vectors, 0.8)
+    with pytest.raises(RuntimeError):
+        build_centroid_index("numpy")
+    with pytest.raises(ValueError):
+        build_centroid_index("gpu")
+
+
+def test_blocking_keys_keep_unrelated_partitions_apart():
+    vector = [1.0, 0.0, 0.0]
+    clusterer = IncrementalClusterer(0.8, backend="python")
+
+    assignments = clusterer.add_many([vector, vector, vector], keys=["tech", "sports", "tech"])
+
+    assert assignments == [0, 1, 0]
+    assert clusterer.members == [[0, 2], [1]]
+
+
+def test_time_window_compares_only_adjacent_buckets():
+    vector = [1.0, 0.0, 0.0]
+    hour = 3600.0
+    clusterer = IncrementalClusterer(0.8, backend="python", time_window_seconds=hour)
+
+    # 1.5h later lands in the adjacent window; 5h later is out of reach.
+    assignments = clusterer.add_many([vector, vector, vector], timestamps=[0.0, 1.5 * hour, 5 * hour])
+
+    assert assignments == [0, 0, 1]
+
+
+def test_single_block_reproduces_unblocked_assignments():
+    vectors = _synthetic_vectors(300, 20)
+    clusterer = IncrementalClusterer(0.8, backend="python", time_window_seconds=86400)
+
+    assignments = clusterer.add_many(vectors, keys=["all"] * len(vectors), timestamps=[0.0] * len(vectors))
+
+    assert assignments == _reference_assignments(vectors, 0.8)
+
+
+def test_parallel_partitions_match_sequential_blocked_clustering():
+    vectors = _synthetic_vectors(400, 25)
+    rng = random.Random(3)
+    keys = [rng.choice(["tech", "world", "sports"]) for _ in vectors]
+    timestamps = [rng.uniform(0, 4 * 3600) for _ in vectors]
+
+    sequential = IncrementalClusterer(0.8, backend="python", time_window_seconds=3600)
+    sequential.add_many(vectors, keys=keys, timestamps=timestamps)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = cluster_in_parallel(
+            vectors, keys, 0.8, executor, backend="python", timestamps=timestamps, time_window_seconds=3600
+        )
+
+    assert parallel == sequential.members
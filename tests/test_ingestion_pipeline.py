@@ -1,15 +1,38 @@
 import asyncio
-from datetime import datetime, timezone
+from collections import Counter
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 
-from ai_news_publisher.infrastructure.embeddings import DeterministicEmbedder
+import pytest
+
+from ai_news_publisher.infrastructure.embeddings import CachedEmbedder, DeterministicEmbedder
 from ai_news_publisher.infrastructure.repository import InMemoryEventRepository
-from ai_news_publisher.infrastructure.rss import RawArticle
+from ai_news_publisher.infrastructure.rss import RawArticle, RSSFetcher
+from ai_news_publisher.infrastructure.seen_index import BloomFilter, SeenArticleIndex
 from ai_news_publisher.services.ingestion import IngestionService
-from ai_news_publisher.services.summarization import SummaryService
+from ai_news_publisher.services.ingestion_pipeline import PipelineConfig
+from ai_news_publisher.services.ingestion_scheduler import IngestionScheduler, PollingPolicy
+from ai_news_publisher.services.summary_scheduler import SummaryBudget, SummaryScheduler
+from ai_news_publisher.services.summarization import PENDING_SUMMARY_STATUS, SummaryService, TemplateAIClient
+from ai_news_publisher.monitoring import monitoring_store
+
+
+class CannedFetcher(RSSFetcher):
+    """Serves canned articles through RSSFetcher's download and parse steps, without HTTP."""
+
+    def articles(self, feed):
+        raise NotImplementedError
+
+    async def download(self, url):
+        return b""
 
+    async def parse(self, feed, body):
+        return list(self.articles(feed))
 
-class StubFetcher:
-    async def fetch_many(self, feeds):
+
+class StubFetcher(CannedFetcher):
+    def articles(self, feed):
         return [
             RawArticle("A", "AI chip launch", "https://a.com/1", "new ai chip announced", datetime(2026, 1, 1, tzinfo=timezone.utc), "US", "Austin", "tech"),
             RawArticle("B", "AI chip launch", "https://b.com/1", "new ai chip announced", datetime(2026, 1, 1, 1, tzinfo=timezone.utc), "US", "Austin", "tech"),
@@ -33,3 +56,393 @@ def test_ingestion_clusters_and_scores_confidence():
     assert tech_event.source_diversity == 2
     assert 0.65 <= tech_event.confidence <= 1.0
     assert "what_happened" in tech_event.summary
+
+
+def test_ingestion_clusters_blocking_partitions_on_process_pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        service = IngestionService(
+            repository=InMemoryEventRepository(),
+            fetcher=StubFetcher(),
+            summary_service=SummaryService(),
+            embedder=DeterministicEmbedder(16),
+            blocking_keys=("category", "country"),
+            cluster_executor=executor,
+            parallel_min_articles=1,
+        )
+        events = asyncio.run(service.ingest([{"url": "unused"}]))
+
+    assert sorted((e.category, e.source_count) for e in events) == [("climate", 1), ("tech", 2)]
+
+
+class CountingEmbedder(DeterministicEmbedder):
+    def __init__(self, dimensions: int = 16) -> None:
+        super().__init__(dimensions)
+        self.calls = 0
+
+    def embed(self, text: str) -> list[float]:
+        self.calls += 1
+        return super().embed(text)
+
+
+def test_ingestion_embeds_each_article_once_and_keeps_mean_centroid():
+    embedder = CountingEmbedder(16)
+    service = IngestionService(
+        repository=InMemoryEventRepository(),
+        fetcher=StubFetcher(),
+        summary_service=SummaryService(),
+        embedder=embedder,
+    )
+
+    events = asyncio.run(service.ingest([{"url": "unused"}]))
+
+    assert embedder.calls == 3
+    tech_event = next(e for e in events if e.category == "tech")
+    expected = DeterministicEmbedder(16).embed("AI chip launch new ai chip announced")
+    # Stored as float32, so compare with float32 tolerance.
+    assert list(tech_event.embedding) == pytest.approx(expected, rel=1e-6)
+
+
+def test_cached_embedder_memoizes_with_lru_eviction_and_counters():
+    inner = CountingEmbedder(16)
+    cached = CachedEmbedder(inner, max_entries=2)
+    before = monitoring_store.snapshot()["event_counters"]
+
+    first = cached.embed("alpha")
+    assert cached.embed("alpha") is first
+    cached.embed("beta")
+    cached.embed("gamma")
+    cached.embed("alpha")
+
+    after = monitoring_store.snapshot()["event_counters"]
+    assert inner.calls == 4
+    assert len(cached) == 2
+    assert after.get("embedding_cache_hits", 0) - before.get("embedding_cache_hits", 0) == 1
+    assert after.get("embedding_cache_misses", 0) - before.get("embedding_cache_misses", 0) == 4
+    assert after.get("embedding_cache_evictions", 0) - before.get("embedding_cache_evictions", 0) == 2
+
+
+class ListFetcher(CannedFetcher):
+    def __init__(self, articles):
+        super().__init__()
+        self.canned = articles
+
+    def articles(self, feed):
+        return self.canned
+
+
+def test_ingestion_merges_new_articles_into_recent_stored_event():
+    repository = InMemoryEventRepository()
+    first = StubFetcher()
+    service = IngestionService(
+        repository=repository,
+        fetcher=first,
+        summary_service=SummaryService(),
+        embedder=DeterministicEmbedder(16),
+    )
+    original = next(e for e in asyncio.run(service.ingest([{"url": "unused"}])) if e.category == "tech")
+
+    service.fetcher = ListFetcher([
+        RawArticle("A", "AI chip launch", "https://d.com/1", "new ai chip announced", datetime(2026, 1, 1, 3, tzinfo=timezone.utc), "US", "Austin", "tech"),
+        RawArticle("A", "AI chip launch", "https://a.com/1", "new ai chip announced", datetime(2026, 1, 1, tzinfo=timezone.utc), "US", "Austin", "tech"),
+    ])
+    events = asyncio.run(service.ingest([{"url": "unused"}]))
+
+    assert len(events) == 1
+    merged = events[0]
+    assert (merged.event_id, merged.slug) == (original.event_id, original.slug)
+    assert merged.source_count == 3
+    assert [link.url for link in merged.source_links][-1] == "https://d.com/1"
+    assert merged.summary["what_happened"].startswith("3 sources")
+    assert len(repository.list_events()) == 2
+    assert repository.get_by_slug(original.slug).source_count == 3
+
+
+def test_deferred_events_are_stored_and_merge_with_later_articles():
+    repository = InMemoryEventRepository()
+    summary_service = SummaryService()
+    service = IngestionService(
+        repository=repository,
+        fetcher=ListFetcher([
+            RawArticle("A", "AI chip launch", "https://a.com/2", "new ai chip announced", datetime(2026, 1, 1, tzinfo=timezone.utc), "US", "Austin", "tech"),
+            RawArticle("C", "Flood warning", "https://c.com/2", "rain and flood warning", datetime(2026, 1, 2, tzinfo=timezone.utc), "US", "Miami", "climate"),
+        ]),
+        summary_service=summary_service,
+        embedder=DeterministicEmbedder(16),
+        summary_scheduler=SummaryScheduler(summary_service, SummaryBudget(max_tokens_per_cycle=160)),
+    )
+
+    asyncio.run(service.ingest([{"url": "unused"}]))
+    deferred = next(e for e in repository.list_events() if e.category == "tech")
+    assert deferred.status == PENDING_SUMMARY_STATUS
+    assert deferred.summary["what_happened"].endswith("A summary is pending.")
+
+    service.fetcher = ListFetcher([
+        RawArticle("B", "AI chip launch", "https://b.com/2", "new ai chip announced", datetime(2026, 1, 1, 1, tzinfo=timezone.utc), "US", "Austin", "tech"),
+    ])
+    asyncio.run(service.ingest([{"url": "unused"}]))
+
+    assert len(repository.list_events()) == 2
+    tech = repository.get_by_slug(deferred.slug)
+    assert (tech.event_id, tech.source_count) == (deferred.event_id, 2)
+    assert {link.url for link in tech.source_links} == {"https://a.com/2", "https://b.com/2"}
+    assert "what_happened" in tech.summary
+    assert len(service.summary_scheduler) == 0
+
+
+def test_stored_placeholders_are_summarized_after_a_restart():
+    repository = InMemoryEventRepository()
+    summary_service = SummaryService()
+    service = IngestionService(
+        repository=repository,
+        fetcher=StubFetcher(),
+        summary_service=summary_service,
+        embedder=DeterministicEmbedder(16),
+        summary_scheduler=SummaryScheduler(summary_service, SummaryBudget(max_tokens_per_cycle=1)),
+    )
+    asyncio.run(service.ingest([{"url": "unused"}]))
+    assert len(repository.list_events_with_status(PENDING_SUMMARY_STATUS)) == 1
+
+    # A new process starts with an empty queue and rebuilds it from the store.
+    service.summary_scheduler = SummaryScheduler(summary_service, SummaryBudget(max_tokens_per_cycle=1))
+    service.summary_scheduler.restore(repository.list_events_with_status(PENDING_SUMMARY_STATUS))
+    service.fetcher = ListFetcher([])
+    asyncio.run(service.ingest([{"url": "unused"}]))
+
+    assert repository.list_events_with_status(PENDING_SUMMARY_STATUS) == []
+    assert len(service.summary_scheduler) == 0
+
+
+def test_new_event_gets_unique_slug_when_generated_title_repeats():
+    repository = InMemoryEventRepository()
+    service = IngestionService(
+        repository=repository,
+        fetcher=ListFetcher([
+            RawArticle("A", "AI chip launch", "https://a.com/3", "new ai chip announced", datetime(2026, 1, 1, tzinfo=timezone.utc), "US", "Austin", "tech"),
+        ]),
+        summary_service=SummaryService(),
+        embedder=DeterministicEmbedder(16),
+        merge_window=None,
+    )
+    first = asyncio.run(service.ingest([{"url": "unused"}]))[0]
+    service.fetcher = ListFetcher([
+        RawArticle("B", "Stadium reopens", "https://b.com/3", "stadium reopens downtown", datetime(2026, 1, 1, tzinfo=timezone.utc), "US", "Austin", "tech"),
+    ])
+    second = asyncio.run(service.ingest([{"url": "unused"}]))[0]
+
+    assert second.slug == f"{first.slug}-{second.event_id[:8]}"
+    assert len(repository.list_events()) == 2
+
+
+class FeedFetcher(CannedFetcher):
+    def __init__(self, by_url):
+        super().__init__()
+        self.by_url = by_url
+
+    async def download(self, url):
+        if url not in self.by_url:
+            raise OSError(f"unreachable: {url}")
+        return b""
+
+    def articles(self, feed):
+        articles = self.by_url[feed["url"]]
+        if isinstance(articles, Exception):
+            raise articles
+        return articles
+
+
+def test_staged_pipeline_publishes_and_merges_across_batches():
+    tech_a, tech_b, climate = StubFetcher().articles({})
+    repository = InMemoryEventRepository()
+    service = IngestionService(
+        repository=repository,
+        fetcher=FeedFetcher({"a": [tech_a], "b": [tech_b, climate]}),
+        summary_service=SummaryService(),
+        embedder=DeterministicEmbedder(16),
+        pipeline=PipelineConfig(queue_size=1, fetch_workers=2, cluster_batch_size=1),
+    )
+
+    events = asyncio.run(service.ingest([{"url": "a"}, {"url": "b"}]))
+
+    assert sorted((e.category, e.source_count) for e in events) == [("climate", 1), ("tech", 2)]
+    assert len(repository.list_events()) == 2
+    assert all("what_happened" in e.summary for e in repository.list_events())
+    gauges = monitoring_store.snapshot()["gauges"]
+    assert "ingest_stage_cluster_items_per_second" in gauges
+    assert "ingest_stage_upsert_queue_depth" in gauges
+
+
+def test_staged_pipeline_keeps_healthy_feeds_when_one_fails():
+    tech_a, _, climate = StubFetcher().articles({})
+    repository = InMemoryEventRepository()
+    service = IngestionService(
+        repository=repository,
+        fetcher=FeedFetcher({"a": [tech_a], "bad": ValueError("not xml"), "c": [climate]}),
+        summary_service=SummaryService(),
+        embedder=DeterministicEmbedder(16),
+        pipeline=PipelineConfig(),
+    )
+
+    with pytest.raises(RuntimeError, match="2 feeds failed: bad, down"):
+        asyncio.run(service.ingest([{"url": "a"}, {"url": "down"}, {"url": "bad"}, {"url": "c"}]))
+
+    assert sorted(e.category for e in repository.list_events()) == ["climate", "tech"]
+
+
+class SlowSingleSourceClient(TemplateAIClient):
+    async def summarize_event(self, event):
+        if event.source_count == 1:
+            await asyncio.sleep(0.05)
+        return super().summarize_event(event)
+
+
+def test_staged_pipeline_keeps_newest_version_when_summaries_finish_out_of_order():
+    tech_a, tech_b, _ = StubFetcher().articles({})
+    repository = InMemoryEventRepository()
+    service = IngestionService(
+        repository=repository,
+        fetcher=FeedFetcher({"a": [tech_a], "b": [tech_b]}),
+        summary_service=SummaryService(client=SlowSingleSourceClient()),
+        embedder=DeterministicEmbedder(16),
+        pipeline=PipelineConfig(queue_size=1, fetch_workers=1, summarize_workers=2, cluster_batch_size=1),
+    )
+
+    events = asyncio.run(service.ingest([{"url": "a"}, {"url": "b"}]))
+
+    assert [e.source_count for e in events] == [2]
+    assert [e.source_count for e in repository.list_events()] == [2]
+
+
+def test_seen_index_persists_and_expires(tmp_path):
+    path = tmp_path / "seen.sqlite"
+    now = datetime(2026, 1, 10, tzinfo=timezone.utc)
+    index = SeenArticleIndex(path, ttl=timedelta(days=1))
+    index.mark_seen(["https://a.com/1"], now=now - timedelta(hours=30))
+    index.mark_seen(["https://b.com/1"], now=now)
+
+    reopened = SeenArticleIndex(path, ttl=timedelta(days=1))
+    assert reopened.seen(["https://a.com/1", "https://b.com/1", "https://c.com/1"], now=now) == [False, True, False]
+    assert reopened.expire(now=now) == 1
+    assert len(reopened) == 1
+
+    bloom = BloomFilter(100)
+    bloom.add(b"key")
+    assert b"key" in bloom
+
+
+def test_seen_index_keeps_links_a_feed_still_lists_after_the_ttl():
+    start = datetime(2026, 1, 10, tzinfo=timezone.utc)
+    index = SeenArticleIndex(ttl=timedelta(days=1))
+    index.mark_seen(["https://a.com/evergreen"], now=start)
+
+    # Polled twice a day, the item outlives the TTL counted from its first sighting.
+    for hours in (12, 24, 36, 48):
+        now = start + timedelta(hours=hours)
+        assert index.seen(["https://a.com/evergreen"], now=now) == [True]
+        assert index.expire(now=now) == 0
+
+    assert index.seen(["https://a.com/evergreen"], now=start + timedelta(hours=80)) == [False]
+
+
+def test_ingestion_skips_already_ingested_links():
+    embedder = CountingEmbedder(16)
+    service = IngestionService(
+        repository=InMemoryEventRepository(),
+        fetcher=StubFetcher(),
+        summary_service=SummaryService(),
+        embedder=embedder,
+        seen_index=SeenArticleIndex(),
+    )
+
+    assert len(asyncio.run(service.ingest([{"url": "unused"}]))) == 2
+    assert asyncio.run(service.ingest([{"url": "unused"}])) == []
+    assert embedder.calls == 3
+    assert monitoring_store.snapshot()["gauges"]["article_skip_rate"] == 0.5
+
+
+class ScriptedIngestion:
+    """Stands in for IngestionService: reports scripted new-article counts per feed URL."""
+
+    def __init__(self, new_counts, failing=()):
+        self.new_counts = new_counts
+        self.failing = set(failing)
+        self.last_run_new_articles = Counter()
+        self.calls = []
+
+    async def ingest(self, feeds):
+        self.calls.append([feed["url"] for feed in feeds])
+        self.last_run_new_articles = Counter()
+        if any(feed["url"] in self.failing for feed in feeds):
+            raise OSError("feed down")
+        for feed in feeds:
+            self.last_run_new_articles[feed["url"]] += self.new_counts.get(feed["url"], 0)
+        return []
+
+
+def test_scheduler_adapts_intervals_to_publish_rate():
+    now = [0.0]
+    feeds = [
+        {"url": "https://wire/rss", "source_name": "wire"},
+        {"url": "https://daily/rss", "source_name": "daily"},
+    ]
+    service = ScriptedIngestion({"https://wire/rss": 30, "https://daily/rss": 0})
+    policy = PollingPolicy(initial_interval_seconds=600, min_interval_seconds=60, max_interval_seconds=86400, jitter=0)
+    scheduler = IngestionScheduler(service, feeds, policy=policy, clock=lambda: now[0])
+
+    for _ in range(4):
+        now[0] = min(s.next_due for s in scheduler.schedules.values())
+        asyncio.run(scheduler.run_once())
+
+    wire, daily = scheduler.schedules["https://wire/rss"], scheduler.schedules["https://daily/rss"]
+    assert wire.interval_seconds == 60
+    assert daily.interval_seconds > 600
+    report = scheduler.lag_report(now[0])
+    assert report["https://wire/rss"]["consecutive_failures"] == 0
+    assert monitoring_store.snapshot()["feeds"]["https://wire/rss"]["poll_interval_seconds"] == 60
+
+
+def test_scheduler_isolates_and_backs_off_failing_feed():
+    feeds = [
+        {"url": "https://ok/rss", "source_name": "ok"},
+        {"url": "https://down/rss", "source_name": "down"},
+    ]
+    service = ScriptedIngestion({"https://ok/rss": 1}, failing={"https://down/rss"})
+    policy = PollingPolicy(min_interval_seconds=60, max_backoff_seconds=3600, jitter=0)
+    scheduler = IngestionScheduler(service, feeds, policy=policy, clock=lambda: 0.0)
+
+    asyncio.run(scheduler.run_once())
+
+    assert service.calls == [["https://ok/rss", "https://down/rss"], ["https://ok/rss"], ["https://down/rss"]]
+    down = scheduler.schedules["https://down/rss"]
+    assert down.consecutive_failures == 1
+    assert down.next_due == 120
+    assert scheduler.schedules["https://ok/rss"].consecutive_failures == 0
+
+
+def test_scheduler_counts_new_articles_per_feed_url_when_feeds_share_a_source_name():
+    def wire(n):
+        return [
+            replace(a, source_name="wire", link=f"{a.link}/{n}", feed_url="https://wire/us")
+            for a in StubFetcher().articles({})
+        ]
+
+    fetcher = FeedFetcher({"https://wire/us": wire(1), "https://wire/eu": []})
+    service = IngestionService(
+        repository=InMemoryEventRepository(),
+        fetcher=fetcher,
+        summary_service=SummaryService(),
+        embedder=DeterministicEmbedder(16),
+        seen_index=SeenArticleIndex(),
+    )
+    feeds = [{"url": "https://wire/us", "source_name": "wire"}, {"url": "https://wire/eu", "source_name": "wire"}]
+    now = [0.0]
+    policy = PollingPolicy(initial_interval_seconds=600, min_interval_seconds=60, max_interval_seconds=86400, jitter=0)
+    scheduler = IngestionScheduler(service, feeds, policy=policy, clock=lambda: now[0])
+
+    asyncio.run(scheduler.run_once())
+    assert service.last_run_new_articles == Counter({"https://wire/us": 3})
+    fetcher.by_url["https://wire/us"] = wire(1) + wire(2)
+    now[0] = 600.0
+    asyncio.run(scheduler.run_once())
+
+    assert service.last_run_new_articles == Counter({"https://wire/us": 3})
+    assert scheduler.schedules["https://wire/us"].interval_seconds < 600 < scheduler.schedules["https://wire/eu"].interval_seconds
@@ -0,0 +1,322 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+import random
+from threading import Thread
+
+import pytest
+
+from ai_news_publisher.domain.models import Event, SourceLink
+from ai_news_publisher.infrastructure.embeddings import cosine_similarity
+from ai_news_publisher.infrastructure import search_index
+from ai_news_publisher.infrastructure.repository import InMemoryEventRepository, SQLiteEventRepository, _TimeIndex
+from ai_news_publisher.infrastructure.vector_index import IVFSimilarityIndex, build_similarity_index, numpy_available
+from ai_news_publisher.monitoring import monitoring_store
+from ai_news_publisher.services.publishing import PublishingService
+from ai_news_publisher.services.retention import RetentionPolicy, RetentionService
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(n: int, hours: float, category: str = "tech", country: str = "US", city: str = "Austin") -> Event:
+    occurred_at = BASE + timedelta(hours=hours)
+    return Event(
+        event_id=f"evt{n:06d}",
+        slug=f"event-{n}",
+        title=f"Event {n}",
+        category=category,
+        country=country,
+        city=city,
+        occurred_at=occurred_at,
+        confidence=0.8,
+        source_diversity=1,
+        source_count=1,
+        embedding=[0.1] * 16,
+        source_links=[SourceLink("A", f"https://a.com/{n}", occurred_at)],
+        summary={},
+        status="Developing",
+        bias_indicator="unknown",
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_repository(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryEventRepository
+    return lambda: SQLiteEventRepository(tmp_path / "events.sqlite")
+
+
+def _expected_order(events: list[Event]) -> list[str]:
+    return [e.slug for e in sorted(events, key=lambda e: (e.occurred_at, e.event_id), reverse=True)]
+
+
+def test_repository_keeps_time_order_across_small_and_bulk_upserts(monkeypatch, make_repository):
+    # Small blocks so the test crosses block splits and emptied blocks.
+    monkeypatch.setattr(_TimeIndex, "BLOCK_SIZE", 4)
+    rng = random.Random(5)
+    events = {n: _event(n, rng.uniform(0, 1000)) for n in range(300)}
+    repository = make_repository()
+    repository.upsert_events([events[n] for n in range(10)])
+    repository.upsert_events([events[n] for n in range(10, 300)])
+
+    # Re-upserts move events; a batch may carry the same slug twice, the last one wins.
+    for n in (3, 150, 299):
+        events[n] = replace(events[n], occurred_at=BASE + timedelta(hours=rng.uniform(0, 1000)))
+    repository.upsert_events([replace(events[3], title="stale"), events[3], events[150], events[299]])
+
+    assert len(repository) == 300
+    assert [e.slug for e in repository.list_events()] == _expected_order(list(events.values()))
+    since = BASE + timedelta(hours=500)
+    assert [e.slug for e in repository.list_events_since(since)] == _expected_order(
+        [e for e in events.values() if e.occurred_at >= since]
+    )
+    assert repository.get_by_slug("event-3").title == "Event 3"
+
+    repository.upsert_events([replace(e, occurred_at=BASE) for e in list(events.values())[:100]])
+    assert [e.slug for e in repository.list_events()][-100:] == _expected_order(
+        [replace(e, occurred_at=BASE) for e in list(events.values())[:100]]
+    )
+
+
+def test_in_memory_repository_readers_see_consistent_snapshots_during_writes():
+    repository = InMemoryEventRepository()
+    errors: list[str] = []
+
+    def read() -> None:
+        for _ in range(200):
+            listed = repository.list_events()
+            if [e.slug for e in listed] != _expected_order(listed) or len({e.slug for e in listed}) != len(listed):
+                errors.append("unordered or duplicated snapshot")
+
+    readers = [Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for batch in range(50):
+        repository.upsert_events([_event(n % 120, (n * 7) % 97) for n in range(batch * 10, batch * 10 + 10)])
+    for reader in readers:
+        reader.join()
+
+    assert errors == []
+    assert len(repository) == 120
+
+
+def test_repository_filters_case_insensitively(make_repository):
+    events = [
+        _event(1, 1, "Tech", "US", "Austin"),
+        _event(2, 2, "tech", "us", "Boston"),
+        _event(3, 3, "climate", "US", "Austin"),
+        _event(4, 4, "TECH", "DE", "Berlin"),
+    ]
+    repository = make_repository()
+    repository.upsert_events(events)
+
+    assert [e.slug for e in repository.list_events(category="tech")] == ["event-4", "event-2", "event-1"]
+    assert [e.slug for e in repository.list_events(category="TECH", country="us")] == ["event-2", "event-1"]
+    assert [e.slug for e in repository.list_events(country="US", city="austin")] == ["event-3", "event-1"]
+    assert [e.slug for e in repository.list_events(category="tech", city="AUSTIN")] == ["event-1"]
+    assert repository.list_events(category="sports") == []
+
+    # Moving an event to another category updates its postings.
+    repository.upsert_events([replace(events[0], category="climate")])
+    assert [e.slug for e in repository.list_events(category="tech", country="US", city="Austin")] == []
+    assert [e.slug for e in repository.list_events(category="Climate", city="Austin")] == ["event-3", "event-1"]
+
+
+def test_keyset_pages_walk_the_store_without_gaps_or_repeats(monkeypatch, make_repository):
+    monkeypatch.setattr(_TimeIndex, "BLOCK_SIZE", 4)
+    # Several events share a timestamp, so the cursor must break ties on event_id.
+    events = [_event(n, n // 3, "tech" if n % 2 else "world") for n in range(40)]
+    repository = make_repository()
+    repository.upsert_events(events)
+    service = PublishingService(repository)
+
+    for category in (None, "TECH"):
+        seen, cursor = [], None
+        while True:
+            page = service.list_events_page(limit=7, cursor=cursor, category=category, country="us")
+            seen.extend(e.slug for e in page.events)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+        expected = [e for e in events if category is None or e.category == "tech"]
+        assert seen == _expected_order(expected)
+
+    with pytest.raises(ValueError):
+        service.list_events_page(limit=5, cursor="not-a-cursor")
+
+
+def test_sqlite_repository_persists_compact_events_across_reopen(tmp_path):
+    path = tmp_path / "events.sqlite"
+    original = _event(1, 5, "Tech", "US", "Austin")
+    original.summary = {"what_happened": "Chips"}
+    repository = SQLiteEventRepository(path)
+    repository.upsert_events([original])
+    # Same slug under a new event_id replaces the old row.
+    repository.upsert_events([replace(original, event_id="evt-new", title="Renamed")])
+    repository.close()
+
+    reopened = SQLiteEventRepository(path)
+    stored = reopened.get_by_slug("event-1")
+
+    assert len(reopened) == 1
+    assert (stored.event_id, stored.title, stored.occurred_at) == ("evt-new", "Renamed", original.occurred_at)
+    assert stored.summary == {"what_happened": "Chips"}
+    assert stored.source_links == original.source_links
+    assert stored.embedding == pytest.approx(original.embedding, rel=1e-6)
+    assert reopened._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_sqlite_versions_keep_rising_after_eviction_removes_the_newest_rows(tmp_path):
+    writer = SQLiteEventRepository(tmp_path / "events.sqlite")
+    reader = SQLiteEventRepository(tmp_path / "events.sqlite")
+    writer.upsert_events([_event(1, hours=10)])
+    # The oldest event is written last, so eviction removes the highest version.
+    writer.upsert_events([_event(2, hours=0)])
+    assert [e.slug for e, _ in reader.search_events("event")] == ["event-2", "event-1"]
+
+    assert writer.evict_before(BASE + timedelta(hours=5)) == 1
+    writer.upsert_events([_event(3, hours=20)])
+
+    assert [e.slug for e, _ in reader.search_events("event")] == ["event-3", "event-1"]
+    assert [e.slug for e, _ in SQLiteEventRepository(tmp_path / "events.sqlite").search_events("event")] == [
+        "event-3",
+        "event-1",
+    ]
+
+
+def test_events_are_slotted_with_float32_embeddings_and_shared_strings():
+    first, second = _event(1, 1, "".join(["te", "ch"])), _event(2, 2, "".join(["t", "ech"]))
+
+    assert not hasattr(first, "__dict__") and not hasattr(first.source_links[0], "__dict__")
+    assert first.embedding.typecode == "f" and list(first.embedding) == pytest.approx([0.1] * 16)
+    assert first.category is second.category
+    # Replaced events keep the compact layout.
+    assert replace(first, embedding=[0.5, 0.25]).embedding.tolist() == [0.5, 0.25]
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy", "ivf"])
+def test_related_events_follow_embedding_updates(monkeypatch, tmp_path, backend):
+    if backend != "python" and not numpy_available():
+        pytest.skip("numpy not installed")
+    # A tiny training size makes the ivf backend partition the store; probing every
+    # list keeps its answers exact.
+    monkeypatch.setattr(IVFSimilarityIndex, "TRAIN_SIZE", 20)
+    rng = random.Random(3)
+    events = [replace(_event(n, n), embedding=[rng.gauss(0, 1) for _ in range(8)]) for n in range(60)]
+    for repository in (
+        InMemoryEventRepository(build_similarity_index(backend, probes=100)),
+        SQLiteEventRepository(tmp_path / f"{backend}.sqlite", build_similarity_index(backend, probes=100)),
+    ):
+        repository.upsert_events(events[:30])
+        repository.related_events("event-0", 1)
+        repository.upsert_events(events[30:])
+
+        query = events[0].embedding
+        expected = sorted(events[1:], key=lambda e: (-cosine_similarity(list(query), list(e.embedding)), e.slug))[:5]
+        related = repository.related_events("event-0", 5)
+        assert [e.slug for e, _ in related] == [e.slug for e in expected]
+        assert [score for _, score in related] == pytest.approx(
+            [cosine_similarity(list(query), list(e.embedding)) for e in expected], abs=1e-5
+        )
+
+        # Re-upserting with a near-copy embedding makes it the closest match.
+        repository.upsert_events([replace(events[59], embedding=[v * 2 for v in query])])
+        assert repository.related_events("event-0", 1)[0][0].slug == "event-59"
+        assert repository.related_events("missing", 5) == []
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_search_ranks_with_bm25_prefixes_and_filters(monkeypatch, make_repository, vectorized):
+    if not vectorized:
+        monkeypatch.setattr(search_index, "np", None)
+    # Frequent re-upserts below push tombstones past this and force compactions.
+    monkeypatch.setattr(search_index.SearchIndex, "MIN_COMPACT", 2)
+    events = [
+        replace(_event(1, 1), title="Chip shortage hits carmakers", summary={"what_happened": "Chip chip chip"}),
+        replace(_event(2, 2), title="New chip factory opens", summary={"what_happened": "A factory in Austin"}),
+        replace(_event(3, 3, "climate", "DE", "Berlin"), title="Heatwave", summary={"why": "Chipmakers pause"}),
+        replace(_event(4, 4, "climate"), title="Floods in Texas", summary={}),
+    ]
+    repository = make_repository()
+    repository.upsert_events(events)
+
+    def slugs(query: str, **filters) -> list[str]:
+        return [e.slug for e, _ in repository.search_events(query, **filters)]
+
+    # Higher term frequency wins; the prefix also reaches "chipmakers".
+    assert slugs("chip") == ["event-1", "event-2", "event-3"]
+    assert slugs("chip factory")[0] == "event-2"
+    assert slugs("CHIP", category="Climate") == ["event-3"]
+    assert slugs("chip", country="us", city="austin") == ["event-1", "event-2"]
+    assert slugs("chip", city="Nowhere") == [] and slugs("zzz") == [] and slugs("  ") == []
+    assert [e.slug for e, _ in repository.search_events("chip", limit=1)] == ["event-1"]
+
+    for round_ in range(3):
+        repository.upsert_events([replace(events[0], title=f"Carmakers recover {round_}", summary={})])
+        repository.upsert_events([replace(events[3], title="Floods", summary={})])
+    assert slugs("chip") == ["event-2", "event-3"]
+    assert slugs("carm") == ["event-1"]
+    assert slugs("recover 2") == ["event-1"]
+
+
+def test_evict_before_drops_old_events_from_every_structure(monkeypatch, make_repository):
+    monkeypatch.setattr(_TimeIndex, "BLOCK_SIZE", 4)
+    events = [
+        replace(_event(n, n, "tech" if n % 2 else "world", city=f"City {n % 3}"), title=f"Chip story {n}")
+        for n in range(50)
+    ]
+    repository = make_repository()
+    repository.upsert_events(events)
+    cutoff = BASE + timedelta(hours=20)
+
+    def failing_archive(evicted: list[Event]) -> None:
+        raise RuntimeError("archive down")
+
+    with pytest.raises(RuntimeError):
+        repository.evict_before(cutoff, archive=failing_archive)
+    assert len(repository) == 50
+
+    archived: list[Event] = []
+    assert repository.evict_before(cutoff, archive=archived.extend) == 20
+    assert [e.slug for e in archived] == [f"event-{n}" for n in range(20)]
+    kept = events[20:]
+    assert len(repository) == 30
+    assert [e.slug for e in repository.list_events()] == _expected_order(kept)
+    assert [e.slug for e in repository.list_events(category="tech", city="city 1")] == _expected_order(
+        [e for e in kept if e.category == "tech" and e.city == "City 1"]
+    )
+    assert repository.get_by_slug("event-3") is None
+    assert {e.slug for e, _ in repository.related_events("event-30", 100)} == {e.slug for e in kept} - {"event-30"}
+    assert {e.slug for e, _ in repository.search_events("chip", limit=100)} == {e.slug for e in kept}
+    assert repository.evict_before(cutoff) == 0
+
+    # Old events upserted again come back, and everything can be evicted.
+    repository.upsert_events(events[:5])
+    assert repository.evict_before(BASE + timedelta(days=30)) == 35
+    assert len(repository) == 0 and repository.list_events(category="tech") == []
+
+
+def test_retention_service_evicts_whole_buckets_past_the_horizon(tmp_path):
+    now = [BASE + timedelta(hours=100, minutes=30)]
+    repository = InMemoryEventRepository()
+    repository.upsert_events([_event(n, n) for n in range(100)])
+    archive = SQLiteEventRepository(tmp_path / "archive.sqlite")
+    service = RetentionService(
+        repository, RetentionPolicy(horizon_hours=48, bucket_hours=12), archive=archive, clock=lambda: now[0]
+    )
+    before = monitoring_store.snapshot()["event_counters"].get("retention_evicted_events", 0)
+
+    # The horizon edge is hour 52:30, inside the bucket starting at hour 48.
+    assert service.cutoff() == BASE + timedelta(hours=48)
+    assert service.run_once() == 48
+    assert len(repository) == 52 and len(archive) == 48
+    now[0] += timedelta(hours=7)
+    assert service.run_once() == 0
+    # A late arrival older than the unchanged cutoff is evicted on the next run.
+    repository.upsert_events([_event(500, 10)])
+    assert service.run_once() == 1
+    now[0] += timedelta(hours=1)
+    assert service.run_once() == 12
+
+    assert monitoring_store.snapshot()["event_counters"]["retention_evicted_events"] == before + 61
+    assert monitoring_store.snapshot()["gauges"]["retention_cutoff_timestamp"] == (BASE + timedelta(hours=60)).timestamp()
+    assert RetentionService(repository, RetentionPolicy(horizon_hours=0)).run_once() == 0
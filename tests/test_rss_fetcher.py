@@ -0,0 +1,349 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from sys import intern
+from threading import Lock, Thread
+import time
+
+import pytest
+
+from ai_news_publisher.infrastructure.embeddings import DeterministicEmbedder
+from ai_news_publisher.infrastructure.feed_state import SQLiteFeedStateStore
+from ai_news_publisher.infrastructure.http_client import FetchPolicy, PooledHTTPClient
+from ai_news_publisher.monitoring import monitoring_store
+from ai_news_publisher.infrastructure.repository import InMemoryEventRepository
+from ai_news_publisher.infrastructure.rss import RSSFetcher, RawArticle, iter_feed_articles, parse_feed
+from ai_news_publisher.services.ingestion import IngestionService
+from ai_news_publisher.services.ingestion_pipeline import PipelineConfig
+from ai_news_publisher.services.summarization import SummaryService
+
+FEED_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss><channel>
+<item><title>AI chip launch</title><link>https://a.com/1</link><description>new ai chip announced</description>
+<pubDate>Thu, 01 Jan 2026 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        server.connections.add(self.client_address)
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+        if server.failures:
+            server.failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if server.etag and self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(server.body)))
+        if server.etag:
+            self.send_header("ETag", server.etag)
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def feed_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    server.body = FEED_XML
+    server.etag = '"v1"'
+    server.requests = []
+    server.connections = set()
+    server.lock = Lock()
+    server.active = server.peak = server.failures = 0
+    server.delay = 0.0
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _feed(server) -> dict[str, str]:
+    return {"url": f"http://127.0.0.1:{server.server_address[1]}/feed.xml", "source_name": "A"}
+
+
+def test_conditional_get_skips_parsing_on_not_modified(feed_server, tmp_path):
+    fetcher = RSSFetcher(state_store=SQLiteFeedStateStore(tmp_path / "feeds.sqlite"))
+
+    first = asyncio.run(fetcher.fetch_many([_feed(feed_server)]))
+    fetcher.commit_feed_state([_feed(feed_server)["url"]])
+    restarted = RSSFetcher(state_store=SQLiteFeedStateStore(tmp_path / "feeds.sqlite"))
+    second = asyncio.run(restarted.fetch_many([_feed(feed_server)]))
+
+    assert [a.link for a in first] == ["https://a.com/1"]
+    assert second == []
+    assert feed_server.requests[1].get("If-None-Match") == '"v1"'
+
+
+def test_unchanged_body_without_validators_is_skipped_after_commit(feed_server):
+    feed_server.etag = None
+    fetcher = RSSFetcher()
+
+    assert len(asyncio.run(fetcher.fetch_many([_feed(feed_server)]))) == 1
+    assert len(asyncio.run(fetcher.fetch_many([_feed(feed_server)]))) == 1
+    fetcher.commit_feed_state([_feed(feed_server)["url"]])
+    assert asyncio.run(fetcher.fetch_many([_feed(feed_server)])) == []
+
+
+class FlakyParseFetcher(RSSFetcher):
+    def __init__(self, failing):
+        super().__init__()
+        self.failing = set(failing)
+        self.parsed = []
+
+    async def parse(self, feed, body):
+        self.parsed.append(feed["url"])
+        if feed["url"] in self.failing:
+            self.failing.discard(feed["url"])
+            raise ValueError("not xml")
+        return await super().parse(feed, body)
+
+
+@pytest.mark.parametrize("pipeline", [None, PipelineConfig()])
+def test_feed_whose_parse_failed_is_downloaded_again_after_a_later_commit(feed_server, pipeline):
+    url = _feed(feed_server)["url"]
+    bad, good = {**_feed(feed_server), "url": f"{url}?bad"}, {**_feed(feed_server), "url": f"{url}?good"}
+    fetcher = FlakyParseFetcher({bad["url"]})
+    service = IngestionService(
+        repository=InMemoryEventRepository(),
+        fetcher=fetcher,
+        summary_service=SummaryService(),
+        embedder=DeterministicEmbedder(16),
+        pipeline=pipeline,
+    )
+
+    with pytest.raises(Exception):
+        asyncio.run(service.ingest([bad, good]))
+    asyncio.run(service.ingest([good]))
+    asyncio.run(service.ingest([bad]))
+
+    assert fetcher.parsed.count(bad["url"]) == 2
+    assert fetcher.state_store.get(bad["url"]) is not None
+
+
+def test_pooled_client_caps_per_host_concurrency_and_reuses_connections(feed_server):
+    feed_server.delay = 0.02
+    client = PooledHTTPClient(FetchPolicy(max_concurrency=8, per_host_concurrency=2))
+    url = _feed(feed_server)["url"]
+
+    async def fetch_all():
+        return await asyncio.gather(*[client.get(f"{url}?n={i}") for i in range(8)])
+
+    responses = asyncio.run(fetch_all())
+
+    assert all(r.status == 200 and r.body == FEED_XML for r in responses)
+    assert feed_server.peak <= 2
+    assert len(feed_server.connections) <= 2
+    assert monitoring_store.snapshot()["feeds"][f"{url}?n=0"]["last_status"] == 200
+
+
+def test_pooled_client_retries_transient_failures(feed_server):
+    feed_server.failures = 2
+    client = PooledHTTPClient(FetchPolicy(retries=2, backoff_seconds=0.0))
+
+    response = asyncio.run(client.get(_feed(feed_server)["url"]))
+
+    assert response.status == 200
+    assert len(feed_server.requests) == 3
+
+
+def test_timed_out_request_holds_its_slot_until_the_worker_returns():
+    class StallingClient(PooledHTTPClient):
+        def __init__(self, policy):
+            super().__init__(policy)
+            self.lock, self.active, self.peak, self.calls = Lock(), 0, 0, 0
+
+        def _request(self, key, path, headers):
+            with self.lock:
+                self.calls += 1
+                first = self.calls == 1
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.3 if first else 0.0)
+            with self.lock:
+                self.active -= 1
+            return 200, {}, b""
+
+    client = StallingClient(FetchPolicy(max_concurrency=4, per_host_concurrency=1, timeout_seconds=0.1, retries=0))
+
+    async def timeout_then_retry():
+        with pytest.raises(asyncio.TimeoutError):
+            await client.get("http://feeds.test/a")
+        started = time.perf_counter()
+        response = await client.get("http://feeds.test/b")
+        return response, time.perf_counter() - started
+
+    response, waited = asyncio.run(timeout_then_retry())
+
+    assert response.status == 200
+    assert client.peak == 1
+    assert waited >= 0.1
+
+
+def test_parse_feed_runs_in_process_pool(feed_server):
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        fetcher = RSSFetcher(parse_executor=pool)
+        articles = asyncio.run(fetcher.fetch_many([_feed(feed_server)]))
+
+    assert articles == parse_feed(FEED_XML, _feed(feed_server))
+    assert (articles[0].source_name, articles[0].feed_url) == ("A", _feed(feed_server)["url"])
+    assert articles[0].feed_url is intern(_feed(feed_server)["url"])
+    assert articles[0].published_at == datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+
+
+def _big_feed(items: int) -> bytes:
+    body = "".join(
+        f"<item><title>Story {i}</title><link>https://x.com/{i}</link><description>d{i}</description></item>"
+        for i in range(items)
+    )
+    return f"<rss><channel><title>x</title>{body}</channel></rss>".encode("utf-8")
+
+
+def test_streaming_parser_yields_items_incrementally_and_honours_caps():
+    feed_bytes = _big_feed(50)
+    chunks = [feed_bytes[i : i + 100] for i in range(0, len(feed_bytes), 100)]
+
+    articles = iter_feed_articles(iter(chunks), {"source_name": "X"})
+    first = next(articles)
+
+    assert first.link == "https://x.com/0"
+    assert len(list(articles)) == 49
+    assert len(parse_feed(feed_bytes, {"max_items": "5"})) == 5
+    capped = parse_feed(feed_bytes, {"max_bytes": str(len(feed_bytes) // 2)})
+    assert 0 < len(capped) < 50
+    assert [a.link for a in capped] == [f"https://x.com/{i}" for i in range(len(capped))]
+
+
+def _article(source: str, link: str) -> RawArticle:
+    return RawArticle(source, "AI chip launch", link, "new ai chip announced", datetime(2026, 1, 1, tzinfo=timezone.utc), "US", "Austin", "tech")
+
+
+class DelayedFetcher(RSSFetcher):
+    async def fetch(self, feed):
+        await asyncio.sleep(feed["delay"])
+        return [_article(feed["source_name"], f"https://{feed['source_name']}.com/1")]
+
+
+def test_stream_yields_feeds_in_completion_order():
+    feeds = [
+        {"url": "slow", "source_name": "slow", "delay": 0.05},
+        {"url": "fast", "source_name": "fast", "delay": 0.0},
+    ]
+
+    async def collect():
+        return [batch[0].source_name async for batch in DelayedFetcher().stream(feeds)]
+
+    assert asyncio.run(collect()) == ["fast", "slow"]
+
+
+def test_ingestion_clusters_streamed_batches():
+    service = IngestionService(
+        repository=InMemoryEventRepository(),
+        fetcher=DelayedFetcher(),
+        summary_service=SummaryService(),
+        embedder=DeterministicEmbedder(16),
+        stream_feeds=True,
+    )
+    feeds = [
+        {"url": "a", "source_name": "a", "delay": 0.02},
+        {"url": "b", "source_name": "b", "delay": 0.0},
+    ]
+
+    events = asyncio.run(service.ingest(feeds))
+
+    assert len(events) == 1
+    assert [link.source_name for link in events[0].source_links] == ["b", "a"]
+
+
+def test_batch_ingestion_clusters_in_feed_order_regardless_of_download_order():
+    service = IngestionService(
+        repository=InMemoryEventRepository(),
+        fetcher=DelayedFetcher(),
+        summary_service=SummaryService(),
+        embedder=DeterministicEmbedder(16),
+    )
+    feeds = [
+        {"url": "a", "source_name": "a", "delay": 0.02},
+        {"url": "b", "source_name": "b", "delay": 0.0},
+    ]
+
+    events = asyncio.run(service.ingest(feeds))
+
+    assert [link.source_name for link in events[0].source_links] == ["a", "b"]
+
+
+class FailingEmbedder:
+    def embed(self, text):
+        raise RuntimeError("embedder down")
+
+
+def test_streaming_ingestion_cancels_pending_downloads_when_clustering_fails():
+    cancelled = []
+
+    class TrackingFetcher(DelayedFetcher):
+        async def fetch(self, feed):
+            try:
+                return await super().fetch(feed)
+            except asyncio.CancelledError:
+                cancelled.append(feed["url"])
+                raise
+
+    service = IngestionService(
+        repository=InMemoryEventRepository(),
+        fetcher=TrackingFetcher(),
+        summary_service=SummaryService(),
+        embedder=FailingEmbedder(),
+        stream_feeds=True,
+    )
+    feeds = [
+        {"url": "slow", "source_name": "slow", "delay": 5.0},
+        {"url": "fast", "source_name": "fast", "delay": 0.0},
+    ]
+
+    async def ingest_and_settle():
+        with pytest.raises(RuntimeError, match="embedder down"):
+            await service.ingest(feeds)
+        await asyncio.sleep(0)
+        return list(cancelled)
+
+    assert asyncio.run(ingest_and_settle()) == ["slow"]
+
+
+def test_staged_ingestion_downloads_and_parses_in_separate_stages(feed_server):
+    repository = InMemoryEventRepository()
+    service = IngestionService(
+        repository=repository,
+        fetcher=RSSFetcher(),
+        summary_service=SummaryService(),
+        embedder=DeterministicEmbedder(16),
+        pipeline=PipelineConfig(),
+    )
+
+    events = asyncio.run(service.ingest([_feed(feed_server)]))
+    again = asyncio.run(service.ingest([_feed(feed_server)]))
+
+    assert [link.url for link in events[0].source_links] == ["https://a.com/1"]
+    assert repository.get_by_slug(events[0].slug) is not None
+    # Feed state is committed after a staged run, so the second poll is a 304.
+    assert again == []
+    assert feed_server.requests[1].get("If-None-Match") == '"v1"'
@@ -1,9 +1,16 @@
+import asyncio
+from dataclasses import replace
 from datetime import datetime, timezone
+import time
+
+import pytest
 
 from ai_news_publisher.domain.models import Event, SourceLink
+from ai_news_publisher.infrastructure.summary_cache import SQLiteSummaryCache, event_fingerprint
 from ai_news_publisher.seo import build_seo_metadata
 from ai_news_publisher.services.localization import LocalizationService, Location
-from ai_news_publisher.services.summarization import SummaryService
+from ai_news_publisher.services.summary_scheduler import SummaryBudget, SummaryScheduler
+from ai_news_publisher.services.summarization import RateLimiter, SummaryLimits, SummaryService, TemplateAIClient
 from ai_news_publisher.monitoring import monitoring_store
 
 
@@ -62,3 +69,157 @@ def test_summary_service_records_ai_usage_once_per_event():
 
     after = monitoring_store.snapshot()["ai_calls"]
     assert after == before + 1
+
+
+class SlowClient(TemplateAIClient):
+    def __init__(self, delay: float) -> None:
+        super().__init__(model_name="slow")
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def summarize_event(self, event):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return TemplateAIClient.summarize_event(self, event)
+
+
+class BatchClient(TemplateAIClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+
+    def summarize_events(self, events):
+        self.batches.append(len(events))
+        return [self.summarize_event(event) for event in events]
+
+
+def test_summarize_many_runs_concurrently_with_bounded_parallelism():
+    client = SlowClient(delay=0.05)
+    service = SummaryService(client, SummaryLimits(max_concurrency=4))
+    events = [replace(_event(), event_id=f"evt-{i}", city=f"City {i}") for i in range(8)]
+    before = monitoring_store.snapshot()["ai_calls"]
+
+    started = time.perf_counter()
+    summaries = asyncio.run(service.summarize_many(events + events[:2]))
+    elapsed = time.perf_counter() - started
+
+    assert len(summaries) == 10
+    assert summaries[8] is summaries[0]
+    assert client.peak == 4
+    assert elapsed < 0.3
+    assert monitoring_store.snapshot()["ai_calls"] == before + 8
+
+
+def test_summarize_many_uses_batch_method_and_validates_payloads():
+    client = BatchClient()
+    service = SummaryService(client, SummaryLimits(batch_size=3))
+    events = [replace(_event(), event_id=f"batch-{i}", city=f"Town {i}") for i in range(7)]
+
+    asyncio.run(service.summarize_many(events))
+
+    assert sorted(client.batches) == [1, 3, 3]
+
+    class BrokenClient(BatchClient):
+        def summarize_events(self, events):
+            return [{"what_happened": "x"} for _ in events]
+
+    with pytest.raises(ValueError, match="missing fields"):
+        asyncio.run(SummaryService(BrokenClient()).summarize_many([replace(_event(), event_id="broken", city="Nowhere")]))
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(requests_per_second=50)
+
+    async def acquire_many():
+        for _ in range(6):
+            await limiter.acquire()
+
+    started = time.perf_counter()
+    asyncio.run(acquire_many())
+    assert time.perf_counter() - started >= 0.09
+
+
+def test_summary_cache_survives_restart_and_minor_cluster_changes(tmp_path):
+    path = tmp_path / "summaries.sqlite"
+    event = _event()
+    grown = replace(
+        event,
+        event_id="evt1-grown",
+        occurred_at=datetime(2026, 1, 1, 2, tzinfo=timezone.utc),
+        source_links=event.source_links + [SourceLink("A", "https://a.com/2", datetime(2026, 1, 1, 2, tzinfo=timezone.utc))],
+    )
+    assert event_fingerprint(grown) == event_fingerprint(event)
+    assert event_fingerprint(replace(event, city="Dallas")) != event_fingerprint(event)
+
+    SummaryService(cache=SQLiteSummaryCache(path)).summarize(event)
+    before = monitoring_store.snapshot()["ai_calls"]
+    restarted = SummaryService(cache=SQLiteSummaryCache(path))
+    summary = restarted.summarize(grown)
+
+    assert set(summary) == {"what_happened", "where_when", "why_it_matters", "what_next", "status", "bias_indicator"}
+    assert monitoring_store.snapshot()["ai_calls"] == before
+
+
+def test_sqlite_summary_cache_evicts_by_size_and_ttl(tmp_path):
+    cache = SQLiteSummaryCache(tmp_path / "s.sqlite", max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"what_happened": key})
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == {"what_happened": "c"}
+    cache.delete("c")
+    assert cache.get("c") is None and len(cache) == 1
+
+    expired = SQLiteSummaryCache(tmp_path / "t.sqlite", ttl_seconds=-1)
+    expired.put("a", {"what_happened": "a"})
+    assert expired.get("a") is None
+
+
+def _placeholder(name: str, confidence: float) -> Event:
+    link = SourceLink("A", f"https://a.com/{name}", datetime(2026, 1, 1, tzinfo=timezone.utc))
+    return replace(
+        _event(), event_id=name, slug=name, city=name.title(), confidence=confidence,
+        source_links=[link], summary={}, status="Developing",
+    )
+
+
+def test_summary_scheduler_spends_budget_on_highest_value_events_first():
+    service = SummaryService()
+    scheduler = SummaryScheduler(service, SummaryBudget(max_tokens_per_cycle=200))
+    low, high = _placeholder("low", 0.4), _placeholder("high", 0.9)
+    texts = {"https://a.com/low": "chip plant opens", "https://a.com/high": "new ai chip announced today " * 5}
+    now = datetime(2026, 1, 1, 6, tzinfo=timezone.utc)
+
+    assert scheduler.estimate(low)[0] == 120 + 40 + 40
+    first = asyncio.run(scheduler.run_cycle([low, high], now=now, article_texts=texts))
+
+    assert [e.slug for e in first] == ["high"]
+    assert "what_happened" in first[0].summary
+    assert low.status == "Developing" and low.summary == {}
+    assert scheduler.estimate(low)[0] == 120 + 3 + 40
+    gauges = monitoring_store.snapshot()["gauges"]
+    assert gauges["summary_queue_depth"] == 1
+    assert gauges["summary_cycle_tokens"] == 120 + 25 + 40
+    assert gauges["summary_cycle_cost_usd"] > 0
+
+    second = asyncio.run(scheduler.run_cycle([], now=now))
+    assert [e.slug for e in second] == ["low"]
+    assert len(scheduler) == 0
+
+
+def test_summary_scheduler_merges_versions_and_admits_oversized_events():
+    scheduler = SummaryScheduler(SummaryService(), SummaryBudget(max_tokens_per_cycle=100))
+    older, newer = _placeholder("evt", 0.5), _placeholder("evt", 0.6)
+    newer.source_links = [SourceLink("B", "https://b.com/evt", datetime(2026, 1, 1, tzinfo=timezone.utc))]
+    scheduler._pending[older.event_id] = older
+
+    released = asyncio.run(scheduler.run_cycle([newer, _placeholder("other", 0.1)]))
+
+    # Every event exceeds the budget alone, so the most valuable one runs by itself.
+    assert [e.event_id for e in released] == ["evt"]
+    assert {link.url for link in released[0].source_links} == {"https://a.com/evt", "https://b.com/evt"}
+    assert released[0].source_count == 2
+    assert len(scheduler) == 1